@@ -0,0 +1,47 @@
+import os
+import threading
+
+from robot.api import logger
+
+
+class async_listener(object):
+    ROBOT_LISTENER_API_VERSION = 2
+    ROBOT_LISTENER_ASYNC = True
+
+    def __init__(self):
+        path = os.path.join(os.getenv('TEMPDIR'), 'async_listener.txt')
+        self.outfile = open(path, 'w')
+
+    def start_suite(self, name, attrs):
+        self._write('START SUITE', name)
+
+    def start_test(self, name, attrs):
+        self._write('START TEST', name)
+
+    def start_keyword(self, name, attrs):
+        self._write('START KW', name)
+
+    def end_keyword(self, name, attrs):
+        self._write('END KW', '%s %s' % (name, attrs['status']))
+
+    def end_test(self, name, attrs):
+        self._write('END TEST', '%s %s' % (name, attrs['status']))
+        logger.warn('Logged by async listener in end_test')
+        if attrs['status'] == 'FAIL':
+            raise AssertionError('Expected failure in end_test!')
+
+    def end_suite(self, name, attrs):
+        self._write('END SUITE', '%s %s' % (name, attrs['status']))
+
+    def log_message(self, msg):
+        # Messages logged by this listener must not be sent back to it.
+        if 'async listener' in msg['message']:
+            self._write('RECURSION', msg['message'])
+
+    def close(self):
+        self._write('CLOSE', '')
+        self.outfile.close()
+
+    def _write(self, event, name):
+        thread = threading.current_thread().name
+        self.outfile.write('%s: %s [%s]\n' % (event, name, thread))
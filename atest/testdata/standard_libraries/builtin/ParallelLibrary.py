@@ -0,0 +1,38 @@
+from __future__ import print_function
+
+import sys
+import threading
+import time
+
+from robot.api import logger
+
+
+class ParallelLibrary(object):
+    ROBOT_LIBRARY_SCOPE = 'GLOBAL'
+
+    def __init__(self):
+        self._events = {}
+
+    def _event(self, name):
+        return self._events.setdefault(name, threading.Event())
+
+    def set_event(self, name):
+        logger.info('Setting %s.' % name)
+        self._event(name).set()
+
+    def wait_for_event(self, name, timeout=5):
+        logger.info('Waiting %s.' % name)
+        self._event(name).wait(float(timeout))
+        if not self._event(name).is_set():
+            raise AssertionError('%s was not set.' % name)
+        logger.info('Got %s.' % name)
+
+    def sleep_and_log(self, name='Keyword', seconds=0.5):
+        print('%s started.' % name)
+        time.sleep(float(seconds))
+        logger.info('%s slept.' % name)
+        print('%s to stderr.' % name, file=sys.stderr)
+
+    def fail_with(self, message):
+        logger.info('Failing soon.')
+        raise AssertionError(message)
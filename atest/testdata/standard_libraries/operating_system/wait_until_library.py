@@ -18,6 +18,26 @@ class wait_until_library:
     def create_dir_after_sleeping(self, path):
         self._run_after_sleeping(os.mkdir, path)
 
+    def create_dir_and_file_after_sleeping(self, path):
+        def create():
+            os.mkdir(os.path.dirname(path))
+            open(path, 'w').close()
+        self._run_after_sleeping(create)
+
+    def append_to_file_after_sleeping(self, path, *lines):
+        def append():
+            with open(path, 'ab') as f:
+                for line in lines:
+                    f.write(line.encode('UTF-8'))
+                    f.flush()
+        self._run_after_sleeping(append)
+
+    def truncate_file_after_sleeping(self, path, content):
+        def truncate():
+            with open(path, 'wb') as f:
+                f.write(content.encode('UTF-8'))
+        self._run_after_sleeping(truncate)
+
     def _run_after_sleeping(self, method, *args):
         self._timers.append(Timer(0.2, method, args))
         self._timers[-1].start()
@@ -0,0 +1,10 @@
+from __future__ import print_function
+
+import sys
+
+
+ROBOT_LIBRARY_CAPTURE_OUTPUT = False
+
+
+def print_to_console(message, stream='stdout'):
+    print(message, file=getattr(sys, stream))
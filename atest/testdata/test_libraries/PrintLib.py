@@ -2,6 +2,9 @@ from __future__ import print_function
 
 import sys
 
+from robot.api.deco import keyword
+from robot.libraries.BuiltIn import BuiltIn
+
 
 def print_one_html_line():
     print('*HTML* <a href="http://www.google.com">Google</a>')
@@ -21,3 +24,14 @@ def print_html_to_stderr():
 def print_with_all_levels():
     for level in 'TRACE DEBUG INFO HTML WARN ERROR'.split():
         print('*%s* %s message' % (level, level.title()))
+
+
+def print_and_run_keyword(name, *args):
+    print('Before')
+    BuiltIn().run_keyword(name, *args)
+    print('After')
+
+
+@keyword(capture_output=False)
+def print_without_capturing(message):
+    print(message)
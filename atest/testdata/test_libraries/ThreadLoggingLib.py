@@ -21,3 +21,19 @@ def log_using_logging_module():
     for i in range(100):
         logging.info(str(i))
         time.sleep(0.01)
+
+def log_using_robot_api_in_worker_threads(threads=2):
+    workers = [threading.Thread(target=log_using_robot_api)
+               for _ in range(int(threads))]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+def log_background_messages_explicitly():
+    logger.info('Before')
+    worker = threading.Thread(target=logger.info, args=('Background',))
+    worker.start()
+    worker.join()
+    logger.log_background_messages()
+    logger.info('After')
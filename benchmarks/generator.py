@@ -0,0 +1,176 @@
+"""Generates synthetic test data for benchmarks.
+
+The generated data contains a library with keywords that do nothing but
+optionally log, a big variable file, a resource file with deeply nested
+user keywords, lots of suites with lots of tests, and a suite with one
+test containing a very long table.
+"""
+
+from os.path import join
+import os
+
+
+SIZES = {
+    'small': dict(directories=2, suites=3, tests=10, steps=10, depth=3,
+                  messages=5, variables=200, keywords=50, long_table=200),
+    'medium': dict(directories=5, suites=10, tests=20, steps=20, depth=5,
+                   messages=10, variables=2000, keywords=200,
+                   long_table=1000),
+    'large': dict(directories=10, suites=20, tests=30, steps=30, depth=8,
+                  messages=20, variables=20000, keywords=1000,
+                  long_table=5000)
+}
+
+LIBRARY = '''\
+from robot.api import logger
+
+
+class NoOp(object):
+    ROBOT_LIBRARY_SCOPE = 'GLOBAL'
+
+    def do_nothing(self, *args, **kwargs):
+        pass
+
+    def return_value(self, value):
+        return value
+
+    def log_messages(self, count, message):
+        for index in range(int(count)):
+            logger.info('%s %d' % (message, index))
+'''
+
+
+class DataGenerator(object):
+    """Writes synthetic test data of the given size into a directory.
+
+    Size is either one of the predefined sizes in ``SIZES`` or a dictionary
+    with the same keys.
+    """
+
+    def __init__(self, size='small'):
+        self.config = SIZES[size] if size in SIZES else dict(size)
+
+    def generate(self, directory):
+        """Generates data into `directory` and returns :class:`TestData`."""
+        data = TestData(directory)
+        for path in data.suites, data.resources:
+            if not os.path.exists(path):
+                os.makedirs(path)
+        self._write(data.library, LIBRARY)
+        self._write(data.variables, self._get_variable_file())
+        self._write(data.resource, self._get_resource_file())
+        self._write(join(data.suites, '__init__.robot'),
+                    self._get_init_file())
+        for dir_index in range(self.config['directories']):
+            directory = join(data.suites, 'Directory %d' % dir_index)
+            os.mkdir(directory)
+            for suite_index in range(self.config['suites']):
+                self._write(join(directory, 'Suite %d.robot' % suite_index),
+                            self._get_suite_file(suite_index))
+        self._write(join(data.suites, 'Long Table.robot'),
+                    self._get_long_table_file())
+        return data
+
+    def _write(self, path, content):
+        with open(path, 'w') as output:
+            output.write(content)
+
+    def _get_variable_file(self):
+        lines = ['MESSAGES = %d' % self.config['messages']]
+        for index in range(self.config['variables']):
+            lines.append("VAR_%d = 'Value %d'" % (index, index))
+            lines.append("LIST__LIST_%d = ['a', 'b', %d]" % (index, index))
+            lines.append("DICT__DICT_%d = {'key': %d}" % (index, index))
+        return '\n'.join(lines) + '\n'
+
+    def _get_resource_file(self):
+        depth = self.config['depth']
+        lines = ['*** Settings ***',
+                 'Library    ../NoOp.py',
+                 'Variables    ../variables.py',
+                 '',
+                 '*** Keywords ***']
+        for level in range(depth):
+            lines.extend(['Level %d' % level,
+                          '    [Documentation]    Nesting level %d.' % level,
+                          '    [Arguments]    ${arg}',
+                          '    Do Nothing    ${arg}    level=%d' % level,
+                          '    Level %d    ${arg}' % (level + 1),
+                          ''])
+        lines.extend(['Level %d' % depth,
+                      '    [Arguments]    ${arg}',
+                      '    ${value} =    Return Value    ${arg}',
+                      '    Log Messages    ${MESSAGES}    ${value}',
+                      ''])
+        for index in range(self.config['keywords']):
+            var = index % self.config['variables']
+            lines.extend(['Keyword %d' % index,
+                          '    [Tags]    generated',
+                          '    Do Nothing    ${VAR_%d}    @{LIST_%d}'
+                          % (var, var),
+                          '    Do Nothing    &{DICT_%d}' % var,
+                          ''])
+        return '\n'.join(lines)
+
+    def _get_init_file(self):
+        return '\n'.join(['*** Settings ***',
+                          'Documentation    Synthetic benchmark data.',
+                          'Suite Setup    Do Nothing',
+                          'Library    ../NoOp.py',
+                          ''])
+
+    def _get_suite_file(self, suite_index):
+        lines = ['*** Settings ***',
+                 'Resource    ../../resources/keywords.robot',
+                 'Test Setup    Do Nothing    setup',
+                 'Force Tags    suite-%d' % suite_index,
+                 '',
+                 '*** Test Cases ***']
+        for test_index in range(self.config['tests']):
+            lines.extend(['Test %d' % test_index,
+                          '    [Tags]    test-%d    tag-%d'
+                          % (test_index, test_index % 5)])
+            lines.extend(self._get_steps(test_index))
+            lines.append('')
+        return '\n'.join(lines)
+
+    def _get_steps(self, seed):
+        steps = []
+        for index in range(self.config['steps']):
+            var = (seed + index) % self.config['variables']
+            kind = index % 4
+            if kind == 0:
+                steps.append('    Level 0    ${VAR_%d}' % var)
+            elif kind == 1:
+                steps.append('    ${result} =    Return Value    ${VAR_%d}'
+                             % var)
+            elif kind == 2:
+                steps.append('    Keyword %d'
+                             % ((seed + index) % self.config['keywords']))
+            else:
+                steps.append('    Do Nothing    @{LIST_%d}    key=value' % var)
+        return steps
+
+    def _get_long_table_file(self):
+        lines = ['*** Settings ***',
+                 'Resource    ../resources/keywords.robot',
+                 '',
+                 '*** Test Cases ***',
+                 'Long Table']
+        for index in range(self.config['long_table']):
+            lines.append('    Do Nothing    ${VAR_%d}    step=%d'
+                         % (index % self.config['variables'], index))
+        return '\n'.join(lines) + '\n'
+
+
+class TestData(object):
+    """Paths to generated test data."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.suites = join(directory, 'suites')
+        self.resources = join(directory, 'resources')
+        self.library = join(directory, 'NoOp.py')
+        self.variables = join(directory, 'variables.py')
+        self.resource = join(self.resources, 'keywords.robot')
+        self.output = join(directory, 'output.xml')
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""logwriting.py -- benchmark writing log.html with a large synthetic model
+
+Usage: [interpreter] logwriting.py [suites] [tests] [keywords] [rounds]
+
+Creates a result with the given number of suites, each containing the given
+number of tests that each have the given number of keywords with messages.
+The JavaScript model is built once and then written to log.html the given
+number of times. The best and average write times are reported.
+
+Defaults are 20 suites, 50 tests, 20 keywords and 5 rounds.
+
+Examples:
+    python benchmarks/logwriting.py
+    python3 benchmarks/logwriting.py 50 100 20 3
+"""
+
+from os.path import abspath, dirname, join
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, join(dirname(dirname(abspath(__file__))), 'src'))
+
+from robot.result import Result, TestSuite
+from robot.reporting.jsmodelbuilders import JsModelBuilder
+from robot.reporting.logreportwriters import LogWriter
+
+
+def create_result(suites, tests, keywords):
+    clock = Clock()
+    root = TestSuite(name='Root', doc='Synthetic *root* suite.',
+                     starttime=clock.tick())
+    for s in range(suites):
+        suite = root.suites.create(name='Suite %d' % s,
+                                   metadata={'Version': str(s)},
+                                   starttime=clock.tick())
+        for t in range(tests):
+            test = suite.tests.create(name='Test %d' % t, tags=['t%d' % t],
+                                      doc='Test with "quotes" and\nnewlines.',
+                                      status='PASS' if t % 10 else 'FAIL',
+                                      message='' if t % 10 else 'Error!',
+                                      starttime=clock.tick())
+            for k in range(keywords):
+                kw = test.keywords.create(kwname='Keyword %d' % k,
+                                          libname='Library',
+                                          args=['arg', '${var}', str(k)],
+                                          status='PASS',
+                                          starttime=clock.tick())
+                kw.messages.create('Message <b>%d</b>\twith tab.' % k,
+                                   timestamp=clock.tick())
+                nested = kw.keywords.create(kwname='Nested', status='PASS',
+                                            starttime=clock.tick())
+                nested.messages.create('Nested.', timestamp=clock.tick())
+                nested.endtime = kw.endtime = clock.tick()
+            test.endtime = clock.tick()
+        suite.endtime = clock.tick()
+    root.endtime = clock.tick()
+    return Result(root_suite=root)
+
+
+class Clock(object):
+
+    def __init__(self):
+        self._millis = 0
+
+    def tick(self):
+        self._millis += 7
+        secs, millis = divmod(self._millis, 1000)
+        mins, secs = divmod(secs, 60)
+        hours, mins = divmod(mins, 60)
+        return '20170101 %02d:%02d:%02d.%03d' % (hours, mins, secs, millis)
+
+
+def write_log(js_result, path):
+    start = time.time()
+    LogWriter(js_result).write(path, {'title': 'Benchmark'})
+    return time.time() - start
+
+
+def main(suites=20, tests=50, keywords=20, rounds=5):
+    result = create_result(int(suites), int(tests), int(keywords))
+    js_result = JsModelBuilder().build_from(result)
+    directory = tempfile.mkdtemp()
+    try:
+        path = join(directory, 'log.html')
+        times = [write_log(js_result, path) for _ in range(int(rounds))]
+        size = os.path.getsize(path)
+    finally:
+        shutil.rmtree(directory)
+    print('Model: %s suites, %s tests, %s keywords per test'
+          % (suites, int(suites) * int(tests), keywords))
+    print('Log size: %.1f MB' % (size / 1024.0 / 1024))
+    print('Best: %.3f s, average: %.3f s'
+          % (min(times), sum(times) / len(times)))
+
+
+if __name__ == '__main__':
+    if '-h' in sys.argv or '--help' in sys.argv:
+        sys.exit(__doc__)
+    main(*sys.argv[1:])
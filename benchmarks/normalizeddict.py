@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+
+"""normalizeddict.py -- benchmark NormalizedDict with typical workloads
+
+Usage: [interpreter] normalizeddict.py [items] [rounds]
+
+Measures `NormalizedDict` through `VariableStore` and `HandlerStore` that
+are the most important users of it during execution. Both stores are
+filled with the given number of items, after which items are looked up
+using differently formatted names, existence of missing items is checked,
+and items are iterated. The best time of the given number of rounds is
+reported for each workload.
+
+Defaults are 1000 items and 5 rounds.
+
+Examples:
+    python benchmarks/normalizeddict.py
+    python3 benchmarks/normalizeddict.py 5000 3
+"""
+
+from __future__ import print_function
+from os.path import abspath, dirname, join
+import sys
+import time
+
+sys.path.insert(0, join(dirname(dirname(abspath(__file__))), 'src'))
+
+from robot.running.handlerstore import HandlerStore
+from robot.variables import Variables
+
+
+class Handler(object):
+
+    def __init__(self, name):
+        self.name = name
+
+
+def variable_names(items):
+    return ['Variable_%d' % i for i in range(items)]
+
+
+def keyword_names(items):
+    return ['Keyword Number %d' % i for i in range(items)]
+
+
+def variable_store(items):
+    store = Variables().store
+    names = variable_names(items)
+    for name in names:
+        store.add(name, name, decorated=False)
+    for name in names:
+        store[name]
+        store[name.upper()]
+        store[name.replace('_', ' ')]
+    for name in names:
+        name + 'x' in store
+    for _ in range(10):
+        list(store)
+    return store
+
+
+def handler_store(items):
+    store = HandlerStore('benchmark', HandlerStore.TEST_LIBRARY_TYPE)
+    names = keyword_names(items)
+    for name in names:
+        store.add(Handler(name))
+    for name in names:
+        store[name]
+        store[name.lower()]
+        store[name.replace(' ', '_')]
+    for name in names:
+        name + 'x' in store
+    for _ in range(10):
+        list(store)
+    return store
+
+
+def measure(workload, items, rounds):
+    times = []
+    for _ in range(rounds):
+        start = time.time()
+        workload(items)
+        times.append(time.time() - start)
+    return min(times)
+
+
+def main(items=1000, rounds=5):
+    items, rounds = int(items), int(rounds)
+    print('Items: %d, rounds: %d' % (items, rounds))
+    for workload in variable_store, handler_store:
+        print('%-14s %.3f s' % (workload.__name__,
+                                measure(workload, items, rounds)))
+
+
+if __name__ == '__main__':
+    if '-h' in sys.argv or '--help' in sys.argv:
+        sys.exit(__doc__)
+    main(*sys.argv[1:])
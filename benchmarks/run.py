@@ -0,0 +1,239 @@
+#!/usr/bin/env python
+
+"""Script for running Robot Framework performance benchmarks.
+
+Usage:  benchmarks/run.py [options] [scenario(s)]
+
+Generates synthetic test data, executes it once to get an output file for
+scenarios needing it, and then runs the given scenarios. By default all
+scenarios are run. Every round of every scenario is run in its own process
+so that peak memory usage can be measured.
+
+Scenarios:
+  build   Parse test data using `TestSuiteBuilder.build`.
+  run     Parse and execute tests using a library that does nothing.
+  parse   Parse the output file using `ExecutionResult`.
+  write   Parse the output file and write log and report with `ResultWriter`.
+  merge   Merge the output file with itself using `rebot --merge`.
+  libdoc  Create documentation for BuiltIn and the generated resource file.
+
+Options:
+  -s --size small|medium|large  Size of the generated test data.
+                        The default is `small`.
+  -r --rounds count     How many times to run each scenario. The reported
+                        times and memory usage are the smallest ones.
+                        The default is 3.
+  -o --output path      Write results in JSON format to the given file.
+  -c --compare path     Compare results with earlier results in JSON format.
+  -d --datadir path     Generate test data and outputs into the given
+                        directory and preserve it. The directory must not
+                        exist or must be empty. By default a temporary
+                        directory is used and removed afterwards.
+  -h --help             Print this help.
+
+Results contain wall time and peak memory usage (RSS) of each scenario as
+well as times of phases the scenarios consist of. Times are in seconds and
+memory usage in kilobytes. Peak memory usage is not available on Windows.
+
+Examples:
+  python benchmarks/run.py
+  python benchmarks/run.py --size medium --output before.json run write
+  python3 benchmarks/run.py -s medium -c before.json -o after.json run write
+"""
+
+from __future__ import print_function
+from os.path import abspath, dirname, exists, join
+import getopt
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+CURDIR = dirname(abspath(__file__))
+sys.path.insert(0, join(dirname(CURDIR), 'src'))
+
+try:
+    import resource
+except ImportError:    # Not available on Windows or Jython
+    resource = None
+
+from robot.version import get_full_version
+
+from generator import DataGenerator, TestData, SIZES
+from scenarios import Phases, SCENARIOS
+
+
+def run_benchmarks(scenarios=None, size='small', rounds=3, datadir=None):
+    """Runs scenarios and returns results as a dictionary."""
+    scenarios = scenarios or [name for name, _ in SCENARIOS]
+    tempdir = None
+    if not datadir:
+        datadir = tempdir = tempfile.mkdtemp(prefix='robotbench-')
+    try:
+        data = prepare_data(datadir, size)
+        results = {}
+        for name in scenarios:
+            print('%-8s' % name, end='')
+            sys.stdout.flush()
+            results[name] = run_scenario(name, data, rounds)
+            print(format_result(results[name]))
+    finally:
+        if tempdir:
+            shutil.rmtree(tempdir)
+    return {'version': get_full_version(),
+            'commit': get_commit(),
+            'interpreter': platform.python_implementation(),
+            'platform': platform.platform(),
+            'size': size,
+            'rounds': rounds,
+            'time': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'scenarios': results}
+
+
+def get_commit():
+    try:
+        process = subprocess.Popen(['git', 'rev-parse', 'HEAD'], cwd=CURDIR,
+                                   stdout=subprocess.PIPE,
+                                   stderr=subprocess.PIPE)
+    except OSError:
+        return None
+    commit = process.communicate()[0].decode('ASCII').strip()
+    return commit if process.returncode == 0 else None
+
+
+def prepare_data(datadir, size):
+    from robot import run
+    from robot.utils import StringIO
+    data = DataGenerator(size).generate(datadir)
+    run(data.suites, output=data.output, log=None, report=None,
+        stdout=StringIO(), stderr=StringIO())
+    return data
+
+
+def run_scenario(name, data, rounds):
+    results = []
+    for index in range(rounds):
+        outdir = join(data.directory, 'out-%s-%d' % (name, index))
+        os.mkdir(outdir)
+        resultfile = join(outdir, 'result.json')
+        process = subprocess.Popen([sys.executable, abspath(__file__),
+                                    '--child', name, data.directory,
+                                    outdir, resultfile],
+                                   stdout=subprocess.PIPE,
+                                   stderr=subprocess.STDOUT)
+        output = process.communicate()[0]
+        if process.returncode != 0:
+            raise RuntimeError("Running scenario '%s' failed:\n%s"
+                               % (name, output.decode('UTF-8', 'replace')))
+        with open(resultfile) as result:
+            results.append(json.load(result))
+    return best_result(results)
+
+
+def best_result(results):
+    rss = [r['peak_rss'] for r in results if r['peak_rss'] is not None]
+    best = min(results, key=lambda r: r['wall'])
+    phases = dict((name, min(r['phases'][name] for r in results))
+                  for name in best['phases'])
+    return {'wall': best['wall'],
+            'peak_rss': min(rss) if rss else None,
+            'phases': phases}
+
+
+def run_child(name, datadir, outdir, resultfile):
+    scenario = dict(SCENARIOS)[name]
+    phases = Phases()
+    start = time.time()
+    scenario(TestData(datadir), outdir, phases)
+    wall = time.time() - start
+    with open(resultfile, 'w') as output:
+        json.dump({'wall': wall, 'peak_rss': get_peak_rss(),
+                   'phases': phases.times}, output)
+
+
+def get_peak_rss():
+    if not resource:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, OS X bytes.
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def format_result(result, baseline=None):
+    parts = ['%8.3f s' % result['wall']]
+    if baseline:
+        parts.append(format_change(result['wall'], baseline['wall']))
+    if result['peak_rss'] is not None:
+        parts.append('%8d kB' % result['peak_rss'])
+        if baseline and baseline.get('peak_rss'):
+            parts.append(format_change(result['peak_rss'],
+                                       baseline['peak_rss']))
+    phases = ', '.join('%s %.3f s' % item
+                       for item in sorted(result['phases'].items()))
+    return '  '.join(parts) + '  (%s)' % phases
+
+
+def format_change(value, baseline):
+    if not baseline:
+        return '    n/a'
+    return '%+6.1f%%' % ((value - baseline) * 100.0 / baseline)
+
+
+def compare(results, path):
+    with open(path) as baseline:
+        baseline = json.load(baseline)
+    print('\nCompared to %s (%s, commit %s, size %s):'
+          % (path, baseline['version'], baseline.get('commit') or 'unknown',
+             baseline['size']))
+    for name, result in sorted(results['scenarios'].items()):
+        if name in baseline['scenarios']:
+            print('%-8s%s' % (name, format_result(
+                result, baseline['scenarios'][name])))
+
+
+def parse_args(args):
+    try:
+        opts, scenarios = getopt.getopt(args, 's:r:o:c:d:h',
+                                        ['size=', 'rounds=', 'output=',
+                                         'compare=', 'datadir=', 'help'])
+    except getopt.GetoptError as err:
+        sys.exit('%s\n\nUse --help for usage information.' % err)
+    opts = dict((name.lstrip('-')[0], value) for name, value in opts)
+    if 'h' in opts:
+        print(__doc__)
+        sys.exit(251)
+    size = opts.get('s', 'small')
+    if size not in SIZES:
+        sys.exit("Invalid size '%s'." % size)
+    names = [name for name, _ in SCENARIOS]
+    for name in scenarios:
+        if name not in names:
+            sys.exit("Invalid scenario '%s'. Available scenarios: %s."
+                     % (name, ', '.join(names)))
+    try:
+        rounds = int(opts.get('r', 3))
+    except ValueError:
+        sys.exit("Invalid rounds '%s'." % opts['r'])
+    datadir = abspath(opts['d']) if 'd' in opts else None
+    if datadir and exists(datadir) and os.listdir(datadir):
+        sys.exit("Data directory '%s' is not empty." % datadir)
+    return scenarios, size, rounds, datadir, opts.get('o'), opts.get('c')
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--child']:
+        run_child(*sys.argv[2:])
+        sys.exit(0)
+    scenarios, size, rounds, datadir, output, baseline = \
+        parse_args(sys.argv[1:])
+    results = run_benchmarks(scenarios, size, rounds, datadir)
+    if baseline:
+        compare(results, baseline)
+    if output:
+        with open(output, 'w') as outfile:
+            json.dump(results, outfile, indent=2, sort_keys=True)
+        print('\nResults: %s' % abspath(output))
@@ -0,0 +1,77 @@
+"""Timed benchmark scenarios.
+
+Every scenario is a function that gets :class:`~generator.TestData`,
+a directory for its own outputs and a :class:`Phases` object that it uses
+for timing the phases it consists of. Scenarios can use the output file
+created beforehand by executing the generated tests.
+"""
+
+from contextlib import contextmanager
+from os.path import join
+import time
+
+from robot import rebot
+from robot.api import ExecutionResult, ResultWriter, TestSuiteBuilder
+from robot.libdoc import libdoc
+from robot.utils import StringIO
+
+
+class Phases(object):
+    """Collects elapsed times of named phases."""
+
+    def __init__(self):
+        self.times = {}
+
+    @contextmanager
+    def __call__(self, name):
+        start = time.time()
+        try:
+            yield
+        finally:
+            elapsed = time.time() - start
+            self.times[name] = self.times.get(name, 0) + elapsed
+
+
+def build(data, outdir, phase):
+    with phase('build'):
+        TestSuiteBuilder().build(data.suites)
+
+
+def run(data, outdir, phase):
+    with phase('build'):
+        suite = TestSuiteBuilder().build(data.suites)
+    with phase('run'):
+        suite.run(outputdir=outdir, output='output.xml', log=None,
+                  report=None, stdout=StringIO(), stderr=StringIO())
+
+
+def parse(data, outdir, phase):
+    with phase('parse'):
+        ExecutionResult(data.output)
+
+
+def write(data, outdir, phase):
+    with phase('parse'):
+        result = ExecutionResult(data.output)
+    with phase('write'):
+        ResultWriter(result).write_results(outputdir=outdir, log='log.html',
+                                           report='report.html',
+                                           stdout=StringIO())
+
+
+def merge(data, outdir, phase):
+    with phase('merge'):
+        rebot(data.output, data.output, merge=True, outputdir=outdir,
+              output='merged.xml', log=None, report=None, stdout=StringIO(),
+              stderr=StringIO())
+
+
+def libdocs(data, outdir, phase):
+    with phase('library'):
+        libdoc('BuiltIn', join(outdir, 'BuiltIn.html'))
+    with phase('resource'):
+        libdoc(data.resource, join(outdir, 'keywords.html'))
+
+
+SCENARIOS = [('build', build), ('run', run), ('parse', parse),
+             ('write', write), ('merge', merge), ('libdoc', libdocs)]
@@ -14,12 +14,13 @@
 #  limitations under the License.
 
 
-def keyword(name=None, tags=()):
+def keyword(name=None, tags=(), capture_output=True):
     """Decorator to set custom keyword names and tags to functions and methods.
 
-    This decorator creates the ``robot_name`` and ``robot_tags`` attributes on
-    the decorated keyword method or function.  Robot Framework checks them to
-    determine the keyword's name and tags, respectively.
+    This decorator creates the ``robot_name``, ``robot_tags`` and
+    ``robot_capture_output`` attributes on the decorated keyword method or
+    function. Robot Framework checks them to determine the keyword's name,
+    tags, and should its standard output and error be captured, respectively.
 
     library.py::
 
@@ -31,6 +32,10 @@ def keyword(name=None, tags=()):
         def logout():
             # ...
 
+        @keyword(capture_output=False)
+        def fast_check(value):
+            # ...
+
     tests.robot::
 
         Login Via User Panel    myusername    mypassword
@@ -50,5 +55,6 @@ def keyword(name=None, tags=()):
     def decorator(func):
         func.robot_name = name
         func.robot_tags = tags
+        func.robot_capture_output = capture_output
         return func
     return decorator
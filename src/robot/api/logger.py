@@ -53,6 +53,20 @@ optional ``html`` argument. If a message to be logged is supposed to be
 shown as HTML, this argument should be set to ``True``. Alternatively,
 :func:`write` accepts a pseudo log level ``HTML``.
 
+Logging from threads
+--------------------
+
+Messages logged by threads other than the main thread are not written to
+the log file immediately. Instead they are timestamped when they are
+created, queued, and logged as part of the currently running keyword when
+it ends. Messages queued when no keyword is running are logged as part of
+the next keyword when it starts. At most 10 000 messages are queued and
+the oldest messages are dropped, with a warning, if there are more.
+Keywords that wait for their worker threads can also call
+:func:`log_background_messages` to log the queued messages right away.
+This functionality is new in RF 3.0.3. Earlier versions ignored messages
+logged by non-main threads altogether.
+
 Example
 -------
 
@@ -131,6 +145,22 @@ def error(msg, html=False):
     write(msg, 'ERROR', html)
 
 
+def log_background_messages():
+    """Logs messages queued by non-main threads immediately.
+
+    Messages logged by other threads are normally logged when the currently
+    running keyword ends or, if no keyword is running, as part of the next
+    keyword when it starts. Calling this function from the main thread logs
+    them right away, which allows keywords that wait for their worker
+    threads to get the messages logged in the correct place. Calling this
+    function from other threads has no effect.
+
+    New in Robot Framework 3.0.3.
+    """
+    if EXECUTION_CONTEXTS.current is not None:
+        librarylogger.log_background_messages()
+
+
 def console(msg, newline=True, stream='stdout'):
     """Writes the message to the console.
 
@@ -16,6 +16,7 @@
 from robot.errors import DataError
 from robot.model import SuiteVisitor
 from robot.result import ExecutionResult
+from robot.result.outputindex import read_output_index
 from robot.utils import get_error_message
 
 
@@ -51,26 +52,36 @@ class GatherFailedSuites(SuiteVisitor):
 def gather_failed_tests(output):
     if output.upper() == 'NONE':
         return []
-    gatherer = GatherFailedTests()
     try:
-        ExecutionResult(output, include_keywords=False).suite.visit(gatherer)
-        if not gatherer.tests:
+        index = read_output_index(output)
+        if index:
+            tests = index.failed_tests
+        else:
+            gatherer = GatherFailedTests()
+            ExecutionResult(output, include_keywords=False).suite.visit(gatherer)
+            tests = gatherer.tests
+        if not tests:
             raise DataError('All tests passed.')
     except:
         raise DataError("Collecting failed tests from '%s' failed: %s"
                         % (output, get_error_message()))
-    return gatherer.tests
+    return tests
 
 
 def gather_failed_suites(output):
     if output.upper() == 'NONE':
         return []
-    gatherer = GatherFailedSuites()
     try:
-        ExecutionResult(output, include_keywords=False).suite.visit(gatherer)
-        if not gatherer.suites:
+        index = read_output_index(output)
+        if index:
+            suites = index.failed_suites
+        else:
+            gatherer = GatherFailedSuites()
+            ExecutionResult(output, include_keywords=False).suite.visit(gatherer)
+            suites = gatherer.suites
+        if not suites:
             raise DataError('All suites passed.')
     except:
         raise DataError("Collecting failed suites from '%s' failed: %s"
                         % (output, get_error_message()))
-    return gatherer.suites
+    return suites
@@ -67,7 +67,8 @@ class _BaseSettings(object):
                  'StdOut'           : ('stdout', None),
                  'StdErr'           : ('stderr', None),
                  'XUnitSkipNonCritical' : ('xunitskipnoncritical', False)}
-    _output_opts = ['Output', 'Log', 'Report', 'XUnit', 'DebugFile']
+    _output_opts = ['Output', 'Log', 'Report', 'XUnit', 'DebugFile',
+                    'Profile']
 
     def __init__(self, options=None, **extra_options):
         self.start_timestamp = format_time(time.time(), '', '-', '')
@@ -126,6 +127,8 @@ class _BaseSettings(object):
             return [v for v in [self._process_tag_stat_link(v) for v in value] if v]
         if name == 'Randomize':
             return self._process_randomize_value(value)
+        if name == 'ProfileSort':
+            return self._process_profile_sort(value)
         if name == 'RemoveKeywords':
             self._validate_remove_keywords(value)
         if name == 'FlattenKeywords':
@@ -173,6 +176,12 @@ class _BaseSettings(object):
             self._raise_invalid_option_value('--randomize', original)
         return value, seed
 
+    def _process_profile_sort(self, original):
+        value = original.lower()
+        if value not in ('self', 'total', 'max', 'count', 'name'):
+            self._raise_invalid_option_value('--profilesort', original)
+        return value
+
     def _raise_invalid_option_value(self, option_name, given_value):
         raise DataError("Option '%s' does not support value '%s'."
                         % (option_name, given_value))
@@ -187,7 +196,8 @@ class _BaseSettings(object):
     def _get_output_file(self, option):
         """Returns path of the requested output file and creates needed dirs.
 
-        `option` can be 'Output', 'Log', 'Report', 'XUnit' or 'DebugFile'.
+        `option` can be 'Output', 'Log', 'Report', 'XUnit', 'DebugFile'
+        or 'Profile'.
         """
         name = self._opts[option]
         if not name:
@@ -215,7 +225,7 @@ class _BaseSettings(object):
             return '.xml'
         if type_ in ['Log', 'Report']:
             return '.html'
-        if type_ == 'DebugFile':
+        if type_ in ['DebugFile', 'Profile']:
             return '.txt'
         raise FrameworkError("Invalid output file type: %s" % type_)
 
@@ -375,6 +385,7 @@ class _BaseSettings(object):
 class RobotSettings(_BaseSettings):
     _extra_cli_opts = {'Extension'          : ('extension', None),
                        'Output'             : ('output', 'output.xml'),
+                       'OutputIndex'        : ('outputindex', False),
                        'LogLevel'           : ('loglevel', 'INFO'),
                        'DryRun'             : ('dryrun', False),
                        'ExitOnFailure'      : ('exitonfailure', False),
@@ -392,7 +403,17 @@ class RobotSettings(_BaseSettings):
                        'ConsoleTypeQuiet'   : ('quiet', False),
                        'ConsoleWidth'       : ('consolewidth', 78),
                        'ConsoleMarkers'     : ('consolemarkers', 'AUTO'),
-                       'DebugFile'          : ('debugfile', None)}
+                       'DebugFile'          : ('debugfile', None),
+                       'Profile'            : ('profile', None),
+                       'ProfileSort'        : ('profilesort', 'self')}
+
+    def _process_cli_opts(self, opts):
+        _BaseSettings._process_cli_opts(self, opts)
+        output = self['Output']
+        if self['OutputIndex'] and output and \
+                output.lower().endswith(('.gz', '.rbo')):
+            raise DataError("Option '--outputindex' cannot be used with "
+                            "compressed or binary output '%s'." % output)
 
     def get_rebot_settings(self):
         settings = RebotSettings()
@@ -414,6 +435,10 @@ class RobotSettings(_BaseSettings):
     def _escape_as_data(self, value):
         return escape(value)
 
+    @property
+    def output_index(self):
+        return self['OutputIndex']
+
     @property
     def listeners(self):
         return self['Listeners']
@@ -422,6 +447,14 @@ class RobotSettings(_BaseSettings):
     def debug_file(self):
         return self['DebugFile']
 
+    @property
+    def profile(self):
+        return self['Profile']
+
+    @property
+    def profile_sort(self):
+        return self['ProfileSort']
+
     @property
     def suite_config(self):
         return {
@@ -13,6 +13,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import re
+
 from robot.utils import PY2
 
 
@@ -38,109 +40,151 @@ class JsonWriter(object):
             self._writer.write(self._separator)
 
 
-class JsonDumper(object):
-
-    def __init__(self, output):
-        self._output = output
-        self._dumpers = (MappingDumper(self),
-                         IntegerDumper(self),
-                         TupleListDumper(self),
-                         StringDumper(self),
-                         NoneDumper(self),
-                         DictDumper(self))
-
-    def dump(self, data, mapping=None):
-        for dumper in self._dumpers:
-            if dumper.handles(data, mapping):
-                dumper.dump(data, mapping)
-                return
-        raise ValueError('Dumping %s not supported.' % type(data))
-
-    def write(self, data):
-        self._output.write(data)
-
-
-class _Dumper(object):
-    _handled_types = None
-
-    def __init__(self, jsondumper):
-        self._dump = jsondumper.dump
-        self._write = jsondumper.write
-
-    def handles(self, data, mapping):
-        return isinstance(data, self._handled_types)
-
-    def dump(self, data, mapping):
-        raise NotImplementedError
-
+class IdentityMapping(object):
+    """Mapping from objects to values that uses object identity as the key.
 
-class StringDumper(_Dumper):
-    _handled_types = (str, unicode) if PY2 else str
-    _search_and_replace = [('\\', '\\\\'), ('"', '\\"'), ('\t', '\\t'),
-                           ('\n', '\\n'), ('\r', '\\r'), ('</', '\\x3c/')]
+    Keys are stored to keep them alive, which guarantees that their ids
+    stay unique as long as the mapping exists.
+    """
 
-    def dump(self, data, mapping):
-        self._write('"%s"' % (self._escape(data) if data else ''))
+    def __init__(self):
+        self.values = {}
+        self._keys = []
 
-    def _escape(self, string):
-        for search, replace in self._search_and_replace:
-            if search in string:
-                string = string.replace(search, replace)
-        return string
+    def __setitem__(self, key, value):
+        self._keys.append(key)
+        self.values[id(key)] = value
 
+    def __len__(self):
+        return len(self.values)
 
-class IntegerDumper(_Dumper):
-    # Handles also bool
-    _handled_types = (int, long) if PY2 else int
 
-    def dump(self, data, mapping):
-        self._write(str(data).lower())
-
-
-class DictDumper(_Dumper):
-    _handled_types = dict
-
-    def dump(self, data, mapping):
-        self._write('{')
-        last_index = len(data) - 1
-        for index, key in enumerate(sorted(data)):
-            self._dump(key, mapping)
-            self._write(':')
-            self._dump(data[key], mapping)
-            if index < last_index:
-                self._write(',')
-        self._write('}')
+class JsonDumper(object):
+    """Dumps Python data structures as JSON to the given output.
 
+    Written data is collected into a buffer that is flushed to the output
+    in chunks. The buffer is always flushed when :meth:`dump` or
+    :meth:`write` returns.
+    """
+    _flush_threshold = 1000
+    _escapes = [('\\', '\\\\'), ('"', '\\"'), ('\t', '\\t'),
+                ('\n', '\\n'), ('\r', '\\r'), ('</', '\\x3c/')]
+    _escape_needed = re.compile(r'[\\"\t\n\r]|</').search
 
-class TupleListDumper(_Dumper):
-    _handled_types = (tuple, list)
+    def __init__(self, output):
+        self._output = output
+        self._buffer = []
+        self._dumpers = {type(None): self._dump_none,
+                         bool: self._dump_bool,
+                         int: self._dump_integer,
+                         tuple: self._dump_sequence,
+                         list: self._dump_sequence,
+                         dict: self._dump_dict}
+        for string_type in (str, unicode) if PY2 else (str,):
+            self._dumpers[string_type] = self._dump_string
+        if PY2:
+            self._dumpers[long] = self._dump_integer
 
-    def dump(self, data, mapping):
-        self._write('[')
-        last_index = len(data) - 1
-        for index, item in enumerate(data):
-            self._dump(item, mapping)
-            if index < last_index:
-                self._write(',')
-        self._write(']')
+    def dump(self, data, mapping=None):
+        """Dumps ``data`` as JSON.
+
+        :param mapping: Dictionary or :class:`IdentityMapping` whose keys
+            are objects that are written as the matching values instead of
+            dumping them. With dictionaries objects are matched based on
+            equality. :class:`IdentityMapping` matches objects based on
+            their identity, which avoids hashing possibly huge nested
+            structures.
+        """
+        if isinstance(mapping, IdentityMapping):
+            self._mapping = mapping.values
+            self._dump = self._dump_with_identity_mapping
+        elif mapping:
+            self._mapping = mapping
+            self._dump = self._dump_with_mapping
+        else:
+            self._dump = self._dump_without_mapping
+        try:
+            self._dump(data)
+        finally:
+            self._flush()
 
+    def write(self, data):
+        self._buffer.append(data)
+        self._flush()
 
-class MappingDumper(_Dumper):
+    def _dump_with_identity_mapping(self, data):
+        if id(data) in self._mapping:
+            self._buffer.append(self._mapping[id(data)])
+        else:
+            self._dump_without_mapping(data)
 
-    def handles(self, data, mapping):
+    def _dump_with_mapping(self, data):
         try:
-            return mapping and data in mapping
+            mapped = data in self._mapping
         except TypeError:
-            return False
+            mapped = False
+        if mapped:
+            self._buffer.append(self._mapping[data])
+        else:
+            self._dump_without_mapping(data)
+
+    def _dump_without_mapping(self, data):
+        try:
+            dumper = self._dumpers[type(data)]
+        except KeyError:
+            dumper = self._get_dumper(data)
+        dumper(data)
+
+    def _get_dumper(self, data):
+        # Slow path for subclasses of supported types.
+        for type_, dumper in list(self._dumpers.items()):
+            if isinstance(data, type_) and type_ is not bool:
+                self._dumpers[type(data)] = dumper
+                return dumper
+        raise ValueError('Dumping %s not supported.' % type(data))
 
-    def dump(self, data, mapping):
-        self._write(mapping[data])
+    def _dump_string(self, data):
+        if data and self._escape_needed(data):
+            for search, replace in self._escapes:
+                if search in data:
+                    data = data.replace(search, replace)
+        self._buffer.append('"%s"' % data)
 
+    def _dump_bool(self, data):
+        self._buffer.append('true' if data else 'false')
 
-class NoneDumper(_Dumper):
+    def _dump_integer(self, data):
+        self._buffer.append(str(data))
 
-    def handles(self, data, mapping):
-        return data is None
+    def _dump_none(self, data):
+        self._buffer.append('null')
 
-    def dump(self, data, mapping):
-        self._write('null')
+    def _dump_sequence(self, data):
+        buffer = self._buffer
+        dump = self._dump
+        buffer.append('[')
+        for index, item in enumerate(data):
+            if index:
+                buffer.append(',')
+            dump(item)
+        buffer.append(']')
+        if len(buffer) > self._flush_threshold:
+            self._flush()
+
+    def _dump_dict(self, data):
+        buffer = self._buffer
+        dump = self._dump
+        buffer.append('{')
+        for index, key in enumerate(sorted(data)):
+            if index:
+                buffer.append(',')
+            dump(key)
+            buffer.append(':')
+            dump(data[key])
+        buffer.append('}')
+
+    def _flush(self):
+        if self._buffer:
+            self._output.write(''.join(self._buffer))
+            # Clear in place because dump methods hold references to the list.
+            del self._buffer[:]
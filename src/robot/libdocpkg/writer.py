@@ -15,14 +15,15 @@
 
 from robot.errors import DataError
 
-from .htmlwriter import LibdocHtmlWriter
-from .xmlwriter import LibdocXmlWriter
-
 
 def LibdocWriter(format=None):
     format = (format or 'HTML').upper()
+    # Writers are imported lazily to avoid importing `robot.htmldata`
+    # when it is not needed.
     if format == 'HTML':
+        from .htmlwriter import LibdocHtmlWriter
         return LibdocHtmlWriter()
     if format == 'XML':
+        from .xmlwriter import LibdocXmlWriter
         return LibdocXmlWriter()
     raise DataError("Format must be either 'HTML' or 'XML', got '%s'." % format)
@@ -14,6 +14,7 @@
 #  limitations under the License.
 
 import difflib
+import random
 import re
 import time
 import token
@@ -25,6 +26,7 @@ from robot.errors import (ContinueForLoop, DataError, ExecutionFailed,
                           PassExecution, ReturnFromKeyword)
 from robot.running import Keyword, RUN_KW_REGISTER
 from robot.running.context import EXECUTION_CONTEXTS
+from robot.running.parallelrunner import ParallelRunner
 from robot.running.usererrorhandler import UserErrorHandler
 from robot.utils import (DotDict, escape, format_assign_message,
                          get_error_message, get_time, is_falsy, is_integer,
@@ -1327,10 +1329,14 @@ class _Variables(_BuiltInBase):
 
         See `Set Variable If` for another keyword to set variables dynamically.
         """
+        missing = object()
         try:
-            return self._variables[self._get_var_name(name)]
+            value = self._variables.get(self._get_var_name(name), missing)
         except DataError:
+            value = missing
+        if value is missing:
             return self._variables.replace_scalar(default)
+        return value
 
     def log_variables(self, level='INFO'):
         """Logs all variables in the current scope with given log level."""
@@ -1354,9 +1360,7 @@ class _Variables(_BuiltInBase):
         name = self._get_var_name(name)
         msg = self._variables.replace_string(msg) if msg \
             else "Variable %s does not exist." % name
-        try:
-            self._variables[name]
-        except DataError:
+        if not self._variable_exists(name):
             raise AssertionError(msg)
 
     @run_keyword_variant(resolve=0)
@@ -1374,12 +1378,15 @@ class _Variables(_BuiltInBase):
         name = self._get_var_name(name)
         msg = self._variables.replace_string(msg) if msg \
             else "Variable %s exists." % name
+        if self._variable_exists(name):
+            raise AssertionError(msg)
+
+    def _variable_exists(self, name):
+        missing = object()
         try:
-            self._variables[name]
+            return self._variables.get(name, missing) is not missing
         except DataError:
-            pass
-        else:
-            raise AssertionError(msg)
+            return False
 
     def replace_variables(self, text):
         """Replaces variables in the given text with their current values.
@@ -1631,6 +1638,42 @@ class _RunKeyword(_BuiltInBase):
         """
         self._run_keywords(self._split_run_keywords(list(keywords)))
 
+    @run_keyword_variant(resolve=0)
+    def run_keywords_in_parallel(self, *keywords):
+        """Executes all the given keywords concurrently in separate threads.
+
+        Keywords and their arguments are given the same way as with `Run
+        Keywords`. This keyword returns when all the executed keywords have
+        finished, and fails if any of them fails. In that case all errors
+        are reported.
+
+        Examples:
+        | Run Keywords In Parallel | Start database | AND | Start server | port=8080 |
+        | Run Keywords In Parallel | Wait For Service | db | AND | Wait For Service | web |
+
+        Only keywords implemented by test libraries are supported. User
+        keywords, keywords in the BuiltIn library, and keywords executing
+        other keywords cannot be run in parallel because they modify the
+        state of the execution. The executed keywords must also be safe to
+        run concurrently with each other. For example, keywords in the same
+        library instance sharing state without locking may not work
+        correctly.
+
+        Arguments are resolved before the keywords are started. Messages
+        the keywords log and their output to the standard output and error
+        are collected separately for each keyword and written to the log
+        file after all the keywords have finished. If a test or keyword
+        timeout occurs, this keyword stops waiting, reports the keywords
+        that have already finished, and fails. Keywords that are still
+        running cannot be stopped and they continue running on the
+        background.
+
+        New in Robot Framework 3.0.3.
+        """
+        ParallelRunner(self._context).run(
+            self._split_run_keywords(list(keywords))
+        )
+
     def _run_keywords(self, iterable):
         errors = []
         for kw, args in iterable:
@@ -1981,15 +2024,43 @@ class _RunKeyword(_BuiltInBase):
         invalid syntax, test or keyword timeouts, or fatal exceptions (caused
         e.g. by `Fatal Error`) are not caught.
 
+        When ``retry`` is given as timeout, the time to wait between runs is
+        limited so that the keyword is run one more time when the timeout
+        is about to expire.
+
+        ``retry_interval`` can be followed by options in format
+        ``name=value`` separated from the interval and from each other with
+        single spaces:
+
+        - ``backoff=<factor>`` multiplies the interval by the given factor
+          after each failure. The factor must be 1 or bigger.
+        - ``max=<time>`` limits how long the interval can grow.
+        - ``jitter=<fraction>`` randomly makes each interval up to the given
+          fraction (0-1) shorter or longer. Useful when many processes poll
+          the same resource.
+        - ``collapse=<bool>`` removes failed runs from the output file so
+          that only the last run is shown. Errors of the removed runs are
+          summarized in one message. Runs containing warnings or errors are
+          not removed. The bool value is considered true unless it is
+          ``False``, ``No`` or ``None`` (case-insensitively). Removed runs
+          are still reported to listeners, because they are dropped only
+          when the output file is written.
+
+        | Wait Until Keyword Succeeds | 1 min | 100ms backoff=2 max=5s | My keyword |
+        | Wait Until Keyword Succeeds | 10 min | 1s backoff=1.5 jitter=0.2 collapse=yes | Server is ready |
+
         Running the same keyword multiple times inside this keyword can create
         lots of output and considerably increase the size of the generated
         output files. Starting from Robot Framework 2.7, it is possible to
         remove unnecessary keywords from the outputs using
-        ``--RemoveKeywords WUKS`` command line option.
+        ``--RemoveKeywords WUKS`` command line option. The ``collapse``
+        option can be used to keep also the output file produced during
+        execution small.
 
         Support for specifying ``retry`` as a number of times to retry is
         a new feature in Robot Framework 2.9.
         Since Robot Framework 2.9, variable errors are caught by this keyword.
+        ``retry_interval`` options are new in Robot Framework 3.0.3.
         """
         maxtime = count = -1
         try:
@@ -2002,8 +2073,13 @@ class _RunKeyword(_BuiltInBase):
             if count <= 0:
                 raise ValueError('Retry count %d is not positive.' % count)
             message = '%d time%s' % (count, s(count))
-        retry_interval = timestr_to_secs(retry_interval)
+        retry_interval = _RetryInterval(retry_interval)
+        output = self._context.output if retry_interval.collapse else None
+        removed = []
         while True:
+            failure = None
+            if output:
+                output.start_buffering()
             try:
                 return self.run_keyword(name, *args)
             except ExecutionFailed as err:
@@ -2014,7 +2090,26 @@ class _RunKeyword(_BuiltInBase):
                     raise AssertionError("Keyword '%s' failed after retrying "
                                          "%s. The last error was: %s"
                                          % (name, message, err))
-                self._sleep_in_parts(retry_interval)
+                failure = err
+            finally:
+                if output:
+                    if output.end_buffering(discard=failure is not None):
+                        removed.append(failure.message)
+                    if failure is None:
+                        self._log_removed_runs(removed)
+            self._sleep_in_parts(retry_interval.next(maxtime))
+
+    def _log_removed_runs(self, errors):
+        if not errors:
+            return
+        counts = {}
+        for error in errors:
+            counts[error] = counts.get(error, 0) + 1
+        unique = sorted(counts, key=errors.index)
+        self.log('%d failed run%s removed. Errors:\n%s'
+                 % (len(errors), s(errors),
+                    '\n'.join('%s (%d time%s)' % (e, counts[e], s(counts[e]))
+                              for e in unique)))
 
     @run_keyword_variant(resolve=1)
     def set_variable_if(self, condition, *values):
@@ -3393,6 +3488,61 @@ class BuiltIn(_Verify, _Converter, _Variables, _RunKeyword, _Control, _Misc):
     ROBOT_LIBRARY_VERSION = get_version()
 
 
+class _RetryInterval(object):
+    _options = ('backoff', 'max', 'jitter', 'collapse')
+
+    def __init__(self, interval):
+        interval, options = self._split_options(interval)
+        self._interval = timestr_to_secs(interval)
+        self._backoff = self._get_number(options, 'backoff', 1)
+        if self._backoff < 1:
+            raise ValueError("Retry interval backoff must be 1 or bigger, "
+                             "got %s." % options['backoff'])
+        self._max = timestr_to_secs(options['max']) \
+            if 'max' in options else None
+        self._jitter = self._get_number(options, 'jitter', 0)
+        if not 0 <= self._jitter <= 1:
+            raise ValueError("Retry interval jitter must be between 0 and 1, "
+                             "got %s." % options['jitter'])
+        self.collapse = is_truthy(options.get('collapse', False))
+
+    def _split_options(self, interval):
+        if not is_string(interval):
+            return interval, {}
+        tokens = interval.split()
+        options = {}
+        while tokens and '=' in tokens[-1]:
+            name, value = tokens.pop().split('=', 1)
+            if name.lower() not in self._options:
+                raise ValueError("Invalid retry interval option '%s'. "
+                                 "Available options: %s."
+                                 % (name, seq2str(self._options, quote='')))
+            options[name.lower()] = value
+        return ' '.join(tokens), options
+
+    def _get_number(self, options, name, default):
+        if name not in options:
+            return default
+        try:
+            return float(options[name])
+        except ValueError:
+            raise ValueError("Retry interval %s must be a number, got %s."
+                             % (name, options[name]))
+
+    def next(self, maxtime=-1):
+        interval = self._interval
+        if self._max is not None:
+            interval = min(interval, self._max)
+        self._interval *= self._backoff
+        if self._max is not None:
+            self._interval = min(self._interval, self._max)
+        if self._jitter:
+            interval *= random.uniform(1 - self._jitter, 1 + self._jitter)
+        if maxtime > 0:
+            interval = min(interval, maxtime - time.time())
+        return interval
+
+
 class RobotNotRunningError(AttributeError):
     """Used when something cannot be done because Robot is not running.
 
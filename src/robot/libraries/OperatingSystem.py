@@ -17,19 +17,30 @@ import fnmatch
 import glob
 import io
 import os
+import re
+import select
 import shutil
+import struct
 import sys
 import tempfile
+import threading
 import time
+from collections import deque
+
+try:
+    from os import scandir
+except ImportError:    # Python 2, Jython and IronPython
+    scandir = None
 
 from robot.version import get_version
 from robot.api import logger
 from robot.utils import (abspath, ConnectionCache, console_decode, del_env_var,
-                         get_env_var, get_env_vars, get_time, is_truthy,
-                         is_unicode, normpath, parse_time, plural_or_not,
-                         secs_to_timestamp, secs_to_timestr, seq2str,
-                         set_env_var, timestr_to_secs, unic, CONSOLE_ENCODING,
-                         IRONPYTHON, JYTHON, PY2, SYSTEM_ENCODING, WINDOWS)
+                         get_env_var, get_env_vars, get_time, html_escape,
+                         is_truthy, is_unicode, normpath, parse_time,
+                         plural_or_not, secs_to_timestamp, secs_to_timestr,
+                         seq2str, set_env_var, timestr_to_secs, unic,
+                         CONSOLE_ENCODING, IRONPYTHON, JYTHON, PY2,
+                         SYSTEM_ENCODING, WINDOWS)
 
 __version__ = get_version()
 PROCESSES = ConnectionCache('No active processes.')
@@ -54,6 +65,7 @@ class OperatingSystem(object):
     - `Tilde expansion`
     - `Boolean arguments`
     - `Example`
+    - `Importing`
     - `Shortcuts`
     - `Keywords`
 
@@ -142,6 +154,27 @@ class OperatingSystem(object):
     ROBOT_LIBRARY_SCOPE = 'GLOBAL'
     ROBOT_LIBRARY_VERSION = __version__
 
+    def __init__(self, workers=1):
+        """The library can be imported with an optional number of ``workers``.
+
+        When ``workers`` is bigger than one, `Copy Files`, `Move Files`,
+        `Remove Files` and `Copy Directory` process files concurrently
+        using that many threads. This can speed up handling large amounts
+        of files considerably, especially on network and other file
+        systems with high latency. Files are logged in the same order
+        regardless the number of workers, but if processing some file
+        fails, other files may already have been processed. By default
+        files are processed one-by-one.
+
+        Examples:
+        | =Setting= |     =Value=     | =Value=   | =Comment=              |
+        | Library   | OperatingSystem |           | # Process sequentially |
+        | Library   | OperatingSystem | workers=8 | # Use eight threads    |
+
+        New in Robot Framework 3.0.3.
+        """
+        self._pool = _WorkerPool(workers)
+
     def run(self, command):
         """Runs the given command in the system and returns the output.
 
@@ -455,15 +488,21 @@ class OperatingSystem(object):
 
         If the timeout is negative, the keyword is never timed-out. The keyword
         returns immediately, if the path does not exist in the first place.
+
+        On Linux the file system is monitored using inotify so that the
+        keyword notices changes immediately. Elsewhere, or if the path
+        contains a pattern in its directory part, the file system is polled
+        10 times per second.
         """
         path = self._absnorm(path)
         timeout = timestr_to_secs(timeout)
-        maxtime = time.time() + timeout
-        while self._glob(path):
-            if timeout >= 0 and time.time() > maxtime:
-                self._fail("'%s' was not removed in %s."
-                           % (path, secs_to_timestr(timeout)))
-            time.sleep(0.1)
+        maxtime = time.time() + timeout if timeout >= 0 else None
+        with _FileWaiter() as waiter:
+            while self._glob(path):
+                if maxtime and time.time() > maxtime:
+                    self._fail("'%s' was not removed in %s."
+                               % (path, secs_to_timestr(timeout)))
+                waiter.wait(path, maxtime)
         self._link("'%s' was removed.", path)
 
     def wait_until_created(self, path, timeout='1 minute'):
@@ -481,17 +520,64 @@ class OperatingSystem(object):
 
         If the timeout is negative, the keyword is never timed-out. The keyword
         returns immediately, if the path already exists.
+
+        The file system is monitored the same way as with `Wait Until Removed`.
         """
         path = self._absnorm(path)
         timeout = timestr_to_secs(timeout)
-        maxtime = time.time() + timeout
-        while not self._glob(path):
-            if timeout >= 0 and time.time() > maxtime:
-                self._fail("'%s' was not created in %s."
-                           % (path, secs_to_timestr(timeout)))
-            time.sleep(0.1)
+        maxtime = time.time() + timeout if timeout >= 0 else None
+        with _FileWaiter() as waiter:
+            while not self._glob(path):
+                if maxtime and time.time() > maxtime:
+                    self._fail("'%s' was not created in %s."
+                               % (path, secs_to_timestr(timeout)))
+                waiter.wait(path, maxtime)
         self._link("'%s' was created.", path)
 
+    def wait_until_file_contains(self, path, pattern, timeout='1 minute',
+                                 encoding='UTF-8', encoding_errors='strict'):
+        """Waits until the given file contains a line matching ``pattern``.
+
+        The file is read incrementally so that only data added after the
+        previous read is processed. The file does not need to exist when
+        the keyword is called. If the file is truncated, it is read again
+        from the beginning.
+
+        A line matches if it contains the ``pattern`` anywhere in it the
+        same way as with `Grep File`. Also the last line of the file is
+        matched even if it does not end with a newline. The matching line
+        is returned without a possible trailing newline. ``encoding`` and
+        ``encoding_errors`` are used when decoding lines similarly as with
+        `Get File`. Encodings that do not encode newlines as a single byte,
+        such as UTF-16, are not supported.
+
+        The optional ``timeout`` is used the same way as with `Wait Until
+        Created`.
+
+        Examples:
+        | Wait Until File Contains | ${LOG FILE} | Server started |
+        | ${line} = | Wait Until File Contains | /var/log/app.log | ERROR* | timeout=10s |
+
+        New in Robot Framework 3.0.3.
+        """
+        path = self._absnorm(path)
+        timeout = timestr_to_secs(timeout)
+        maxtime = time.time() + timeout if timeout >= 0 else None
+        tail = _FileTail(path, encoding, encoding_errors)
+        pattern = '*%s*' % pattern
+        with _FileWaiter() as waiter:
+            line = tail.find(pattern)
+            while line is None:
+                if maxtime and time.time() > maxtime:
+                    self._fail("File '%s' did not contain pattern '%s' in %s."
+                               % (path, pattern[1:-1],
+                                  secs_to_timestr(timeout)))
+                waiter.wait(path, maxtime)
+                line = tail.find(pattern)
+        pattern = html_escape(pattern[1:-1]).replace('%', '%%')
+        self._link("Pattern '%s' found in file '%%s'." % pattern, path)
+        return line
+
     # Dir/file empty
 
     def directory_should_be_empty(self, path, msg=None):
@@ -630,24 +716,40 @@ class OperatingSystem(object):
         The pattern matching syntax is explained in `introduction`.
         If the path is a pattern, all files matching it are removed.
         """
-        path = self._absnorm(path)
-        matches = self._glob(path)
-        if not matches:
-            self._link("File '%s' does not exist.", path)
-        for match in matches:
-            if not os.path.isfile(match):
-                self._error("Path '%s' is not a file." % match)
-            os.remove(match)
-            self._link("Removed file '%s'.", match)
+        self._remove_files([path])
 
     def remove_files(self, *paths):
-        """Uses `Remove File` to remove multiple files one-by-one.
+        """Uses `Remove File` to remove multiple files.
+
+        All paths are validated before any of the files is removed. Files
+        are removed concurrently if the library has been imported with
+        more than one worker (see `importing`).
 
         Example:
         | Remove Files | ${TEMPDIR}${/}foo.txt | ${TEMPDIR}${/}bar.txt | ${TEMPDIR}${/}zap.txt |
         """
+        self._remove_files(paths)
+
+    def _remove_files(self, paths):
+        files = []
+        seen = set()
         for path in paths:
-            self.remove_file(path)
+            path = self._absnorm(path)
+            matches = self._glob(path)
+            if not matches:
+                self._link("File '%s' does not exist.", path)
+            for match in matches:
+                if not os.path.isfile(match):
+                    self._error("Path '%s' is not a file." % match)
+                if match not in seen:
+                    files.append(match)
+                    seen.add(match)
+        for path in self._pool.map(self._remove_file, files):
+            self._link("Removed file '%s'.", path)
+
+    def _remove_file(self, path):
+        os.remove(path)
+        return path
 
     def empty_directory(self, path):
         """Deletes all the content from the given directory.
@@ -735,11 +837,15 @@ class OperatingSystem(object):
         """
         source, destination = \
             self._prepare_copy_and_move_file(source, destination)
-        if not self._are_source_and_destination_same_file(source, destination):
-            source, destination = self._atomic_copy(source, destination)
-            self._link("Copied file from '%s' to '%s'.", source, destination)
+        self._link(*self._copy_file(source, destination))
         return destination
 
+    def _copy_file(self, source, destination):
+        if self._are_source_and_destination_same_file(source, destination):
+            return self._same_file_message(source, destination)
+        source, destination = self._atomic_copy(source, destination)
+        return "Copied file from '%s' to '%s'.", source, destination
+
     def _prepare_copy_and_move_file(self, source, destination):
         source = self._normalize_copy_and_move_source(source)
         destination = self._normalize_copy_and_move_destination(destination)
@@ -754,11 +860,14 @@ class OperatingSystem(object):
             self._error("Multiple matches with source pattern '%s'." % source)
         if sources:
             source = sources[0]
+        self._verify_copy_and_move_source(source)
+        return source
+
+    def _verify_copy_and_move_source(self, source):
         if not os.path.exists(source):
             self._error("Source file '%s' does not exist." % source)
         if not os.path.isfile(source):
             self._error("Source file '%s' is not a regular file." % source)
-        return source
 
     def _normalize_copy_and_move_destination(self, destination):
         is_dir = os.path.isdir(destination) or destination.endswith(('/', '\\'))
@@ -774,11 +883,11 @@ class OperatingSystem(object):
             self._error("Destination '%s' exists and is not a directory." % path)
 
     def _are_source_and_destination_same_file(self, source, destination):
-        if self._force_normalize(source) == self._force_normalize(destination):
-            self._link("Source '%s' and destination '%s' point to the same "
-                       "file.", source, destination)
-            return True
-        return False
+        return self._force_normalize(source) == self._force_normalize(destination)
+
+    def _same_file_message(self, source, destination):
+        return ("Source '%s' and destination '%s' point to the same file.",
+                source, destination)
 
     def _force_normalize(self, path):
         # TODO: Should normalize_path also support case and link normalization?
@@ -825,11 +934,15 @@ class OperatingSystem(object):
         """
         source, destination = \
             self._prepare_copy_and_move_file(source, destination)
-        if not self._are_source_and_destination_same_file(destination, source):
-            shutil.move(source, destination)
-            self._link("Moved file from '%s' to '%s'.", source, destination)
+        self._link(*self._move_file(source, destination))
         return destination
 
+    def _move_file(self, source, destination):
+        if self._are_source_and_destination_same_file(destination, source):
+            return self._same_file_message(destination, source)
+        shutil.move(source, destination)
+        return "Moved file from '%s' to '%s'.", source, destination
+
     def copy_files(self, *sources_and_destination):
         """Copies specified files to the target directory.
 
@@ -844,14 +957,16 @@ class OperatingSystem(object):
         | Copy Files | ${dir}/file1.txt  | ${dir}/file2.txt | ${dir2} |
         | Copy Files | ${dir}/file-*.txt | ${dir2}          |         |
 
+        Files are copied concurrently if the library has been imported
+        with more than one worker (see `importing`).
+
         See also `Copy File`, `Move File`, and `Move Files`.
 
         New in Robot Framework 2.8.4.
         """
         sources, destination \
             = self._prepare_copy_and_move_files(sources_and_destination)
-        for source in sources:
-            self.copy_file(source, destination)
+        self._copy_or_move_files(self._copy_file, sources, destination)
 
     def _prepare_copy_and_move_files(self, items):
         if len(items) < 2:
@@ -863,10 +978,26 @@ class OperatingSystem(object):
 
     def _glob_files(self, patterns):
         files = []
+        seen = set()
         for pattern in patterns:
-            files.extend(self._glob(self._absnorm(pattern)))
+            for path in self._glob(self._absnorm(pattern)):
+                if path not in seen:
+                    files.append(path)
+                    seen.add(path)
         return files
 
+    def _copy_or_move_files(self, operation, sources, destination):
+        def copy_or_move(source):
+            self._verify_copy_and_move_source(source)
+            target = os.path.join(destination, os.path.basename(source))
+            return operation(source, target)
+        pool = self._pool
+        # Files with same names must be handled in order, the last one winning.
+        if len(set(os.path.basename(s) for s in sources)) < len(sources):
+            pool = _WorkerPool()
+        for result in pool.map(copy_or_move, sources):
+            self._link(*result)
+
     def move_files(self, *sources_and_destination):
         """Moves specified files to the target directory.
 
@@ -878,8 +1009,7 @@ class OperatingSystem(object):
         """
         sources, destination \
             = self._prepare_copy_and_move_files(sources_and_destination)
-        for source in sources:
-            self.move_file(source, destination)
+        self._copy_or_move_files(self._move_file, sources, destination)
 
     def copy_directory(self, source, destination):
         """Copies the source directory into the destination.
@@ -891,13 +1021,53 @@ class OperatingSystem(object):
         source, destination \
             = self._prepare_copy_and_move_directory(source, destination)
         try:
-            shutil.copytree(source, destination)
+            self._copy_tree(source, destination)
         except shutil.Error:
             # https://github.com/robotframework/robotframework/issues/2321
             if not (WINDOWS and JYTHON):
                 raise
         self._link("Copied directory from '%s' to '%s'.", source, destination)
 
+    def _copy_tree(self, source, destination):
+        # Like `shutil.copytree` but files are copied using the worker pool.
+        os.makedirs(destination)
+        directories = [(source, destination)]
+        files = []
+        errors = []
+        for src, dst in directories:    # Grows while sub-directories are found.
+            try:
+                entries = list(_scandir(src))
+            except EnvironmentError as err:
+                errors.append((src, dst, str(err)))
+                continue
+            for entry in entries:
+                target = os.path.join(dst, entry.name)
+                if not entry.is_dir():
+                    files.append((entry.path, target))
+                    continue
+                try:
+                    os.mkdir(target)
+                except EnvironmentError as err:
+                    errors.append((entry.path, target, str(err)))
+                else:
+                    directories.append((entry.path, target))
+        errors.extend(e for e in self._pool.map(self._copy_tree_file, files)
+                      if e)
+        for src, dst in reversed(directories):
+            try:
+                shutil.copystat(src, dst)
+            except EnvironmentError as err:
+                errors.append((src, dst, str(err)))
+        if errors:
+            raise shutil.Error(errors)
+
+    def _copy_tree_file(self, paths):
+        try:
+            shutil.copy2(*paths)
+        except EnvironmentError as err:
+            return paths + (str(err),)
+        return None
+
     def _prepare_copy_and_move_directory(self, source, destination):
         source = self._absnorm(source)
         destination = self._absnorm(destination)
@@ -1347,27 +1517,33 @@ class OperatingSystem(object):
         self._info("%s director%s." % (count, 'y' if count == 1 else 'ies'))
         return count
 
-    def _list_dir(self, path, pattern=None, absolute=False):
+    def _list_dir(self, path, pattern=None, absolute=False, include=None):
         path = self._absnorm(path)
         self._link("Listing contents of directory '%s'.", path)
         if not os.path.isdir(path):
             self._error("Directory '%s' does not exist." % path)
         # result is already unicode but unic also handles NFC normalization
-        items = sorted(unic(item) for item in os.listdir(path))
+        entries = [(unic(entry.name), entry) for entry in _scandir(path)]
         if pattern:
-            items = [i for i in items if fnmatch.fnmatchcase(i, pattern)]
+            matches = re.compile(fnmatch.translate(pattern)).match
+            entries = [(name, entry) for name, entry in entries
+                       if matches(name)]
+        if include:
+            entries = [(name, entry) for name, entry in entries
+                       if include(entry)]
+        items = sorted(name for name, _ in entries)
         if is_truthy(absolute):
             path = os.path.normpath(path)
             items = [os.path.join(path, item) for item in items]
         return items
 
     def _list_files_in_dir(self, path, pattern=None, absolute=False):
-        return [item for item in self._list_dir(path, pattern, absolute)
-                if os.path.isfile(os.path.join(path, item))]
+        return self._list_dir(path, pattern, absolute,
+                              include=lambda entry: entry.is_file())
 
     def _list_dirs_in_dir(self, path, pattern=None, absolute=False):
-        return [item for item in self._list_dir(path, pattern, absolute)
-                if os.path.isdir(os.path.join(path, item))]
+        return self._list_dir(path, pattern, absolute,
+                              include=lambda entry: entry.is_dir())
 
     def touch(self, path):
         """Emulates the UNIX touch command.
@@ -1466,3 +1642,282 @@ class _Process:
         if output.endswith('\n'):
             output = output[:-1]
         return console_decode(output, force=True)
+
+
+def _scandir(path):
+    """Returns entries in the given directory like `os.scandir`.
+
+    Entries returned by `os.scandir` cache file type information so that
+    it is typically not necessary to call `os.stat` separately. On
+    interpreters not having `os.scandir` a minimal replacement is used.
+    """
+    if scandir:
+        return scandir(path)
+    return [_DirEntry(path, name) for name in os.listdir(path)]
+
+
+class _DirEntry(object):
+
+    def __init__(self, directory, name):
+        self.name = name
+        self.path = os.path.join(directory, name)
+
+    def is_file(self):
+        return os.path.isfile(self.path)
+
+    def is_dir(self):
+        return os.path.isdir(self.path)
+
+
+class _WorkerPool(object):
+    """Calls a function with given items using multiple threads.
+
+    Results are yielded in the order of the items. If calling the function
+    fails, results of successful calls are yielded first and the first
+    error is raised after that. With less than two workers the function is
+    called in the current thread and processing stops at the first error.
+    """
+
+    def __init__(self, workers=1):
+        try:
+            self.workers = int(workers)
+        except ValueError:
+            raise ValueError("Invalid number of workers '%s'." % workers)
+        if self.workers < 1:
+            raise ValueError("Number of workers must be positive, got %d."
+                             % self.workers)
+
+    def map(self, function, items):
+        items = list(items)
+        if self.workers < 2 or len(items) < 2:
+            return (function(item) for item in items)
+        return self._map_concurrently(function, items)
+
+    def _map_concurrently(self, function, items):
+        pending = deque(enumerate(items))
+        results = {}
+        errors = {}
+
+        def work():
+            while not errors:
+                try:
+                    index, item = pending.popleft()
+                except IndexError:
+                    return
+                try:
+                    results[index] = function(item)
+                except:
+                    errors[index] = sys.exc_info()[1]
+
+        threads = [threading.Thread(target=work, name='OperatingSystem worker')
+                   for _ in range(min(self.workers, len(items)))]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        try:
+            # Joining in small pieces allows timeouts and signals to interrupt.
+            for thread in threads:
+                while thread.is_alive():
+                    thread.join(0.1)
+        finally:
+            pending.clear()
+        for index in sorted(results):
+            yield results[index]
+        if errors:
+            raise errors[min(errors)]
+
+
+class _FileWaiter(object):
+    """Waits for changes in directories containing watched paths.
+
+    Uses inotify when it is available and polls otherwise. Waiting is
+    limited also with inotify in case some change is not notified, which
+    can happen, for example, with network file systems.
+
+    Nothing is initialized before the first wait so that there is no
+    overhead if the waited condition holds already when checked first.
+    """
+    _poll_interval = 0.1
+    _max_wait = 1.0
+
+    def __init__(self):
+        self._inotify = None
+        self._polling = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._inotify:
+            self._inotify.close()
+
+    def wait(self, path, maxtime=None):
+        """Waits until something changes in the directory containing path.
+
+        If the nearest existing directory containing the path is not yet
+        watched, only starts watching it and returns immediately. Callers
+        thus check their condition again after the watch has been added,
+        and no changes are missed.
+        """
+        if not self._polling and self._watch(path):
+            return
+        timeout = self._poll_interval if self._polling else self._max_wait
+        if maxtime is not None:
+            timeout = max(min(timeout, maxtime - time.time()), 0)
+        if self._polling:
+            time.sleep(timeout)
+        else:
+            self._inotify.wait(timeout)
+
+    def _watch(self, path):
+        if not self._inotify:
+            self._inotify = _Inotify.create()
+        directory = self._get_directory(path)
+        if not (self._inotify and directory):
+            self._polling = True
+            return False
+        watched = self._inotify.is_watched(directory)
+        if not (watched or self._inotify.watch(directory)):
+            self._polling = True
+        return not watched
+
+    def _get_directory(self, path):
+        directory = os.path.dirname(path)
+        if any(char in directory for char in '*?['):
+            return None
+        while not os.path.isdir(directory):
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                return None
+            directory = parent
+        return directory
+
+
+class _Inotify(object):
+    # IN_MODIFY, IN_ATTRIB, IN_CLOSE_WRITE, IN_MOVED_FROM, IN_MOVED_TO,
+    # IN_CREATE, IN_DELETE, IN_DELETE_SELF and IN_MOVE_SELF
+    _mask = 0x2 | 0x4 | 0x8 | 0x40 | 0x80 | 0x100 | 0x200 | 0x400 | 0x800
+    _ignored = 0x8000
+    _event = struct.Struct('iIII')
+    _libc = None
+
+    @classmethod
+    def create(cls):
+        libc = cls._get_libc()
+        if not libc:
+            return None
+        try:
+            return cls(libc)
+        except EnvironmentError:
+            return None
+
+    @classmethod
+    def _get_libc(cls):
+        # Finding libc is slow so it is done only once. False means that
+        # inotify is not available.
+        if cls._libc is None:
+            cls._libc = cls._load_libc()
+        return cls._libc
+
+    @classmethod
+    def _load_libc(cls):
+        if not sys.platform.startswith('linux') or JYTHON or IRONPYTHON:
+            return False
+        try:
+            import ctypes
+            import ctypes.util
+            libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+            libc.inotify_init, libc.inotify_add_watch
+        except (ImportError, AttributeError, EnvironmentError):
+            return False
+        return libc
+
+    def __init__(self, libc):
+        import ctypes
+        self._libc = libc
+        self._fd = libc.inotify_init()
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init failed')
+        self._watches = {}
+
+    def is_watched(self, directory):
+        return directory in self._watches.values()
+
+    def watch(self, directory):
+        path = directory
+        if is_unicode(path):
+            path = path.encode(sys.getfilesystemencoding() or 'UTF-8')
+        wd = self._libc.inotify_add_watch(self._fd, path, self._mask)
+        if wd < 0:
+            return False
+        self._watches[wd] = directory
+        return True
+
+    def wait(self, timeout):
+        if select.select([self._fd], [], [], timeout)[0]:
+            self._read_events()
+
+    def _read_events(self):
+        data = os.read(self._fd, 65536)
+        while data:
+            wd, mask, cookie, length = self._event.unpack_from(data)
+            if mask & self._ignored:
+                self._watches.pop(wd, None)
+            data = data[self._event.size + length:]
+
+    def close(self):
+        os.close(self._fd)
+
+
+class _FileTail(object):
+    """Reads lines added to a possibly growing file."""
+
+    def __init__(self, path, encoding='UTF-8', errors='strict'):
+        # Data is split into lines before decoding.
+        if u'\n'.encode(encoding) != b'\n':
+            raise RuntimeError("Encoding '%s' is not supported because it does "
+                               "not encode newlines as single '\\n' bytes."
+                               % encoding)
+        self._path = path
+        self._encoding = encoding
+        self._errors = errors
+        self._position = 0
+        self._pending = b''
+
+    def find(self, pattern):
+        for line in self._read_lines():
+            if fnmatch.fnmatchcase(line, pattern):
+                return line
+        return None
+
+    def _read_lines(self):
+        data = self._read()
+        lines = (self._pending + data).split(b'\n')
+        self._pending = lines.pop()
+        for line in lines:
+            yield self._decode(line)
+        if self._pending:
+            try:
+                yield self._decode(self._pending, errors='strict')
+            except UnicodeError:    # Possibly incomplete multibyte character.
+                pass
+
+    def _read(self):
+        try:
+            size = os.path.getsize(self._path)
+        except EnvironmentError:
+            return b''
+        if size < self._position:
+            self._position = 0
+            self._pending = b''
+        if size == self._position:
+            return b''
+        with open(self._path, 'rb') as f:
+            f.seek(self._position)
+            data = f.read()
+        self._position += len(data)
+        return data
+
+    def _decode(self, line, errors=None):
+        line = line.decode(self._encoding, errors or self._errors)
+        return line[:-1] if line.endswith('\r') else line
@@ -16,8 +16,11 @@
 import ctypes
 import os
 import subprocess
+import sys
+import threading
 import time
 import signal as signal_module
+from collections import deque
 
 from robot.utils import (ConnectionCache, abspath, cmdline2list, console_decode,
                          is_list_like, is_truthy, NormalizedDict, py2to3,
@@ -40,6 +43,7 @@ class Process(object):
 
     - Running processes in system and waiting for their completion using
       `Run Process` keyword.
+    - Running multiple processes concurrently using `Run Processes`.
     - Starting processes on background using `Start Process`.
     - Waiting started process to complete using `Wait For Process` or
       stopping them with `Terminate Process` or `Terminate All Processes`.
@@ -346,6 +350,146 @@ class Process(object):
         finally:
             self._processes.current = current
 
+    def run_processes(self, *commands, **configuration):
+        """Runs multiple processes concurrently and waits for them to complete.
+
+        Each of the given ``*commands`` can be a list containing the command
+        to execute and arguments passed to it, or a string containing only
+        the command. When `running processes in shell`, a string can contain
+        the whole command line similarly as with `Run Process`. Lists can be
+        created, for example, with `Split Command Line`.
+
+        ``**configuration`` is shared by all the processes and it accepts the
+        same arguments as `Run Process` with the following exceptions:
+
+        - ``max_processes`` sets the maximum number of processes running at
+          the same time. The default is the number of CPUs in the system.
+        - ``timeout`` limits the time running all the processes may take.
+          If it is reached, processes that have not been started are not
+          started at all, and running processes are handled according to
+          ``on_timeout`` that works the same way as with `Wait For Process`.
+          Also with this keyword the default action is ``terminate``.
+        - Outputs cannot be redirected to files and ``alias`` is not
+          supported. Standard error can be redirected to standard output
+          using ``stderr=STDOUT``.
+
+        Outputs of the processes are read while they are running, so large
+        outputs do not cause processes to hang.
+
+        Returns a list of `result objects` in the same order as the commands
+        were given. The list contains Python ``None`` in place of processes
+        that were not started or were left running due to the timeout.
+        Return codes and execution times of the processes are logged.
+
+        Examples:
+        | @{results} = | Run Processes | ${command1} | ${command2} |
+        | Should Be Equal As Integers | ${results[0].rc} | 0 |
+        | @{results} = | Run Processes | @{commands} | max_processes=4 | timeout=1min | on_timeout=kill |
+
+        This keyword does not change the `active process` and the started
+        processes cannot be used with other keywords.
+
+        New in Robot Framework 3.0.3.
+        """
+        max_processes = configuration.pop('max_processes', None)
+        timeout = configuration.pop('timeout', None)
+        on_timeout = configuration.pop('on_timeout', 'terminate').lower()
+        self._verify_run_processes_configuration(configuration)
+        conf = ProcessConfiguration(**configuration)
+        commands = [conf.get_command(*self._split_command(command))
+                    for command in commands]
+        pool = _ProcessPool(commands, conf,
+                            self._get_max_processes(max_processes))
+        logger.info('Running %d process%s using at most %d at a time.'
+                    % (len(commands), '' if len(commands) == 1 else 'es',
+                       pool.max_processes))
+        logger.debug(u'Process configuration:\n%s' % conf)
+        pool.start()
+        timeout = timestr_to_secs(timeout) if timeout else None
+        left_running = ()
+        if not pool.wait(timeout):
+            logger.info('Processes did not complete in %s.'
+                        % secs_to_timestr(timeout))
+            left_running = self._manage_processes_timeout(pool, on_timeout)
+        return self._get_processes_results(pool, left_running)
+
+    def _verify_run_processes_configuration(self, configuration):
+        for name in 'stdout', 'stderr', 'alias':
+            value = configuration.get(name)
+            if value and not (name == 'stderr' and value == 'STDOUT'):
+                raise RuntimeError("Keyword argument '%s' is not supported by "
+                                   "this keyword." % name)
+
+    def _split_command(self, command):
+        if not is_list_like(command):
+            return command, []
+        command = list(command)
+        if not command:
+            raise RuntimeError('Command cannot be empty.')
+        return command[0], command[1:]
+
+    def _get_max_processes(self, max_processes):
+        if max_processes is not None:
+            try:
+                value = int(max_processes)
+            except (ValueError, TypeError):
+                value = 0
+            if value < 1:
+                raise RuntimeError("Maximum number of processes must be a "
+                                   "positive integer, got '%s'."
+                                   % max_processes)
+            return value
+        try:
+            from multiprocessing import cpu_count
+            return cpu_count()
+        except (ImportError, NotImplementedError):
+            return 1
+
+    def _manage_processes_timeout(self, pool, on_timeout):
+        running = pool.stop()
+        if on_timeout not in ('terminate', 'kill'):
+            logger.info('Leaving processes intact.')
+            return running
+        if on_timeout == 'terminate':
+            logger.info('Gracefully terminating processes.')
+            self._send_signal_to_processes(running, self._send_terminate_signal)
+            if pool.wait(self.TERMINATE_TIMEOUT):
+                return ()
+            logger.info('Graceful termination failed.')
+        logger.info('Forcefully killing processes.')
+        self._send_signal_to_processes(pool.stop(), self._send_kill_signal)
+        if not pool.wait(self.KILL_TIMEOUT):
+            raise RuntimeError('Failed to kill processes.')
+        return ()
+
+    def _send_signal_to_processes(self, processes, sender):
+        for process in processes.values():
+            try:
+                sender(process)
+            except OSError:
+                logger.debug('Ignored OSError because process was stopped.')
+
+    def _get_processes_results(self, pool, left_running):
+        results = [result if index not in left_running else None
+                   for index, result in enumerate(pool.results)]
+        for index, (command, result) in enumerate(zip(pool.commands, results)):
+            if is_list_like(command):
+                command = self.join_command_line(command)
+            command = system_decode(command)
+            if result:
+                logger.info(u'Process %d completed in %s with rc %d:\n%s'
+                            % (index + 1, secs_to_timestr(pool.elapsed[index]),
+                               result.rc, command))
+            elif index in left_running:
+                logger.info(u'Process %d was left running:\n%s'
+                            % (index + 1, command))
+            else:
+                logger.info(u'Process %d was not started:\n%s'
+                            % (index + 1, command))
+        if pool.errors:
+            raise pool.errors[0]
+        return results
+
     def start_process(self, command, *arguments, **configuration):
         """Starts a new process on background.
 
@@ -532,15 +676,24 @@ class Process(object):
 
     def _kill(self, process):
         logger.info('Forcefully killing process.')
+        self._send_kill_signal(process)
+        if not self._process_is_stopped(process, self.KILL_TIMEOUT):
+            raise RuntimeError('Failed to kill process.')
+
+    def _send_kill_signal(self, process):
         if hasattr(os, 'killpg'):
             os.killpg(process.pid, signal_module.SIGKILL)
         else:
             process.kill()
-        if not self._process_is_stopped(process, self.KILL_TIMEOUT):
-            raise RuntimeError('Failed to kill process.')
 
     def _terminate(self, process):
         logger.info('Gracefully terminating process.')
+        self._send_terminate_signal(process)
+        if not self._process_is_stopped(process, self.TERMINATE_TIMEOUT):
+            logger.info('Graceful termination failed.')
+            self._kill(process)
+
+    def _send_terminate_signal(self, process):
         # Sends signal to the whole process group both on POSIX and on Windows
         # if supported by the interpreter.
         if hasattr(os, 'killpg'):
@@ -554,9 +707,6 @@ class Process(object):
                 process.send_signal(signal_module.CTRL_BREAK_EVENT)
         else:
             process.terminate()
-        if not self._process_is_stopped(process, self.TERMINATE_TIMEOUT):
-            logger.info('Graceful termination failed.')
-            self._kill(process)
 
     def terminate_all_processes(self, kill=False):
         """Terminates all still running processes started by this library.
@@ -950,3 +1100,79 @@ env:     %s""" % (self.cwd, self.shell, self._stream_name(self.stdout_stream),
             return stream.name
         return {subprocess.PIPE: 'PIPE',
                 subprocess.STDOUT: 'STDOUT'}.get(stream, stream)
+
+
+class _ProcessPool(object):
+    """Runs commands with a limited number of processes running concurrently.
+
+    Each worker thread starts a process and reads its outputs until it ends.
+    Processes are started while holding a lock so that `stop` always returns
+    all processes that have been started but have not yet completed.
+    """
+
+    def __init__(self, commands, config, max_processes):
+        self.commands = commands
+        self.max_processes = max_processes
+        self.results = [None] * len(commands)
+        self.elapsed = [None] * len(commands)
+        self.errors = []
+        self._config = config
+        self._pending = deque(range(len(commands)))
+        self._running = {}
+        self._stopped = False
+        self._lock = threading.Lock()
+        self._threads = [threading.Thread(target=self._work,
+                                          name='Process pool')
+                         for _ in range(min(max_processes, len(commands)))]
+
+    def start(self):
+        for thread in self._threads:
+            thread.daemon = True
+            thread.start()
+
+    def wait(self, timeout=None):
+        """Waits for processes to complete. Returns `False` on timeout."""
+        max_time = time.time() + timeout if timeout is not None else None
+        for thread in self._threads:
+            # Joining in small pieces allows timeouts and signals to interrupt.
+            while thread.is_alive():
+                if max_time is not None and time.time() > max_time:
+                    return False
+                thread.join(0.1)
+        return True
+
+    def stop(self):
+        """Stops starting new processes and returns running processes.
+
+        Processes are returned as a dictionary mapping indices of the
+        commands to `subprocess.Popen` objects.
+        """
+        with self._lock:
+            self._stopped = True
+            return dict(self._running)
+
+    def _work(self):
+        while True:
+            with self._lock:
+                if self._stopped or not self._pending:
+                    return
+                index = self._pending.popleft()
+                start = time.time()
+                try:
+                    process = subprocess.Popen(self.commands[index],
+                                               **self._config.popen_config)
+                except:
+                    self.errors.append(sys.exc_info()[1])
+                    self._stopped = True
+                    return
+                self._running[index] = process
+            stdout, stderr = process.communicate()
+            elapsed = time.time() - start
+            result = ExecutionResult(process, **self._config.result_config)
+            result.rc = process.returncode or 0
+            result._stdout = result._format_output(stdout or b'')
+            result._stderr = result._format_output(stderr or b'')
+            with self._lock:
+                del self._running[index]
+                self.results[index] = result
+                self.elapsed[index] = elapsed
@@ -13,8 +13,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from robot.utils import (Matcher, NormalizedDict, is_string, py2to3, setter,
-                         unic)
+from robot.utils import (Matcher, NormalizedDict, is_string, normalize, py2to3,
+                         setter, unic)
 
 
 @py2to3
@@ -25,10 +25,14 @@ class Tags(object):
 
     @setter
     def _tags(self, tags):
+        self._normalized = None
         if not tags:
             return ()
         if is_string(tags):
             tags = (tags,)
+        if isinstance(tags, Tags):
+            self._normalized = tags._normalized
+            return tags._tags
         return self._normalize(tags)
 
     def _normalize(self, tags):
@@ -38,6 +42,12 @@ class Tags(object):
                 normalized.pop(removed)
         return tuple(normalized)
 
+    def _get_normalized(self):
+        if self._normalized is None:
+            self._normalized = frozenset(normalize(t, ignore='_')
+                                         for t in self._tags)
+        return self._normalized
+
     def add(self, tags):
         self._tags = tuple(self) + tuple(Tags(tags))
 
@@ -73,13 +83,22 @@ class Tags(object):
 
 @py2to3
 class TagPatterns(object):
+    _max_cache_size = 10000
 
     def __init__(self, patterns):
         self._patterns = tuple(TagPattern(p) for p in Tags(patterns))
+        self._cache = {}
 
     def match(self, tags):
-        tags = tags if isinstance(tags, Tags) else Tags(tags)
-        return any(p.match(tags) for p in self._patterns)
+        tags = normalize_tags(tags)
+        try:
+            return self._cache[tags]
+        except KeyError:
+            if len(self._cache) >= self._max_cache_size:
+                self._cache.clear()
+            match = self._cache[tags] = any(p._match(tags)
+                                            for p in self._patterns)
+            return match
 
     def __contains__(self, tag):
         return self.match(tag)
@@ -97,6 +116,21 @@ class TagPatterns(object):
         return u'[%s]' % u', '.join(pattern.__unicode__() for pattern in self)
 
 
+def normalize_tags(tags):
+    """Returns tags normalized and as a frozenset.
+
+    Normalized tags are cached by :class:`Tags` objects, which makes calling
+    this function repeatedly with the same object cheap. Normalized sets are
+    also used as keys when caching pattern matching results.
+    """
+    if isinstance(tags, Tags):
+        return tags._get_normalized()
+    if is_string(tags):
+        tag = normalize(tags, ignore='_')
+        return frozenset([tag]) if tag not in ('', 'none') else frozenset()
+    return Tags(tags)._get_normalized()
+
+
 def TagPattern(pattern):
     pattern = pattern.replace(' ', '')
     if 'NOT' in pattern:
@@ -108,14 +142,30 @@ def TagPattern(pattern):
     return SingleTagPattern(pattern)
 
 
+class _TagPattern(object):
+
+    def match(self, tags):
+        return self._match(normalize_tags(tags))
+
+    def _match(self, tags):
+        """Matches against normalized tags given as a frozenset."""
+        raise NotImplementedError
+
+
 @py2to3
-class SingleTagPattern(object):
+class SingleTagPattern(_TagPattern):
 
     def __init__(self, pattern):
         self._matcher = Matcher(pattern, ignore='_')
+        self._normalized = normalize(pattern, ignore='_')
+        # Tags are already normalized, so the matcher's regexp is used as-is.
+        self._regexp = self._matcher._regexp \
+            if '*' in pattern or '?' in pattern else None
 
-    def match(self, tags):
-        return self._matcher.match_any(tags)
+    def _match(self, tags):
+        if self._regexp is None:
+            return self._normalized in tags
+        return any(self._regexp.match(tag) for tag in tags)
 
     def __iter__(self):
         yield self
@@ -128,13 +178,13 @@ class SingleTagPattern(object):
 
 
 @py2to3
-class AndTagPattern(object):
+class AndTagPattern(_TagPattern):
 
     def __init__(self, patterns):
         self._patterns = tuple(TagPattern(p) for p in patterns)
 
-    def match(self, tags):
-        return all(p.match(tags) for p in self._patterns)
+    def _match(self, tags):
+        return all(p._match(tags) for p in self._patterns)
 
     def __iter__(self):
         return iter(self._patterns)
@@ -144,13 +194,13 @@ class AndTagPattern(object):
 
 
 @py2to3
-class OrTagPattern(object):
+class OrTagPattern(_TagPattern):
 
     def __init__(self, patterns):
         self._patterns = tuple(TagPattern(p) for p in patterns)
 
-    def match(self, tags):
-        return any(p.match(tags) for p in self._patterns)
+    def _match(self, tags):
+        return any(p._match(tags) for p in self._patterns)
 
     def __iter__(self):
         return iter(self._patterns)
@@ -160,16 +210,16 @@ class OrTagPattern(object):
 
 
 @py2to3
-class NotTagPattern(object):
+class NotTagPattern(_TagPattern):
 
     def __init__(self, must_match, *must_not_match):
         self._first = TagPattern(must_match)
         self._rest = OrTagPattern(must_not_match)
 
-    def match(self, tags):
+    def _match(self, tags):
         if not self._first:
-            return not self._rest.match(tags)
-        return self._first.match(tags) and not self._rest.match(tags)
+            return not self._rest._match(tags)
+        return self._first._match(tags) and not self._rest._match(tags)
 
     def __iter__(self):
         yield self._first
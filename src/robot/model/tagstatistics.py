@@ -20,7 +20,7 @@ from robot.utils import NormalizedDict, PY3
 
 from .criticality import Criticality
 from .stats import CombinedTagStat, CriticalTagStat, TagStat
-from .tags import SingleTagPattern, TagPatterns
+from .tags import SingleTagPattern, TagPatterns, normalize_tags
 
 
 if PY3:
@@ -64,6 +64,8 @@ class TagStatisticsBuilder(object):
         self._included = TagPatterns(included)
         self._excluded = TagPatterns(excluded)
         self._info = TagStatInfo(docs, links)
+        self._included_tags = {}
+        self._matching_stats = {}
         self.stats = TagStatistics(
             self._info.get_critical_stats(criticality),
             self._info.get_critical_stats(criticality, critical=False),
@@ -82,15 +84,33 @@ class TagStatisticsBuilder(object):
                 self.stats.tags[tag].add_test(test)
 
     def _is_included(self, tag):
+        try:
+            return self._included_tags[tag]
+        except KeyError:
+            included = self._included_tags[tag] = self._tag_is_included(tag)
+            return included
+
+    def _tag_is_included(self, tag):
         if self._included and not self._included.match(tag):
             return False
         return not self._excluded.match(tag)
 
     def _add_to_critical_and_combined_statistics(self, test):
-        stats = self.stats
-        for stat in stats.critical + stats.non_critical + stats.combined:
-            if stat.match(test.tags):
-                stat.add_test(test)
+        for stat in self._get_matching_stats(test.tags):
+            stat.add_test(test)
+
+    def _get_matching_stats(self, tags):
+        # Tests often have same tags so matching results are cached.
+        key = normalize_tags(tags)
+        try:
+            return self._matching_stats[key]
+        except KeyError:
+            stats = self.stats
+            matching = self._matching_stats[key] \
+                = [stat for stat in chain(stats.critical, stats.non_critical,
+                                          stats.combined)
+                   if stat.match(tags)]
+            return matching
 
 
 class TagStatInfo(object):
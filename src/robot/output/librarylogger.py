@@ -26,7 +26,7 @@ from robot.errors import DataError
 from robot.utils import unic, console_encode
 
 from .logger import LOGGER
-from .loggerhelper import Message
+from .loggerhelper import LoggingThread, Message
 
 
 LOGGING_THREADS = ('MainThread', 'RobotFrameworkTimeoutThread')
@@ -40,8 +40,23 @@ def write(msg, level, html=False):
         msg = unic(msg)
     if level.upper() not in ('TRACE', 'DEBUG', 'INFO', 'HTML', 'WARN', 'ERROR'):
         raise DataError("Invalid log level '%s'." % level)
-    if threading.currentThread().getName() in LOGGING_THREADS:
-        LOGGER.log_message(Message(msg, level, html))
+    msg = Message(msg, level, html)
+    thread = threading.currentThread()
+    if thread.getName() in LOGGING_THREADS:
+        LOGGER.log_message(msg)
+    elif isinstance(thread, LoggingThread):
+        thread.log_message(msg)
+    else:
+        LOGGER.log_background_message(msg)
+
+
+def log_background_messages():
+    if _in_logging_thread():
+        LOGGER.log_background_messages()
+
+
+def _in_logging_thread():
+    return threading.currentThread().getName() in LOGGING_THREADS
 
 
 def trace(msg, html=False):
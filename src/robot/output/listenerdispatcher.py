@@ -0,0 +1,121 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from collections import deque
+
+try:
+    from queue import Queue
+except ImportError:    # Python 2
+    from Queue import Queue
+
+from robot.utils import get_error_details
+
+from .listenermethods import ListenerMethod
+from .logger import LOGGER
+from .loggerhelper import LoggingThread
+
+
+class ListenerDispatcher(object):
+    """Calls methods of an asynchronous listener in a background thread.
+
+    Calls are delivered in the order they are dispatched. Arguments are
+    copied so that the listener sees them as they were when dispatched.
+    The queue is bounded so that a slow listener slows down execution
+    instead of consuming all memory. Errors and messages logged by the
+    listener are reported in the main thread when the next call is
+    dispatched or when the dispatcher is closed, because logging is not
+    thread safe. Calls dispatched after closing are run synchronously.
+    """
+    _stop = object()
+
+    def __init__(self, listener_name, queue_size=1000):
+        self.listener_name = listener_name
+        self._queue = Queue(queue_size)
+        self._errors = deque()
+        self._messages = deque()
+        self._thread = None
+        self._closed = False
+
+    def dispatch(self, method, args):
+        self._report()
+        if self._closed:
+            self._call(method, args)
+            self._report()
+            return
+        if not self._thread:
+            self._thread = ListenerThread(self)
+            self._thread.start()
+        self._queue.put((method, self._copy(args)))
+
+    def _copy(self, item):
+        if isinstance(item, dict):
+            return dict((key, self._copy(item[key])) for key in item)
+        if isinstance(item, (list, tuple)):
+            return type(item)(self._copy(i) for i in item)
+        return item
+
+    def log_message(self, msg):
+        self._messages.append(msg)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is self._stop:
+                return
+            self._call(*item)
+
+    def _call(self, method, args):
+        try:
+            method(*args)
+        except:
+            message, details = get_error_details()
+            self._errors.append((method.__name__, message, details))
+
+    def close(self):
+        self._closed = True
+        if self._thread:
+            self._queue.put(self._stop)
+            self._thread.join()
+            self._thread = None
+        self._report()
+
+    def _report(self):
+        if not (self._messages or self._errors):
+            return
+        # Like with synchronous listeners, messages logged by the listener
+        # are not sent to listeners to avoid recursion.
+        ListenerMethod.called = True
+        try:
+            while self._messages:
+                LOGGER.log_message(self._messages.popleft())
+            while self._errors:
+                name, message, details = self._errors.popleft()
+                LOGGER.error("Calling method '%s' of listener '%s' failed: %s"
+                             % (name, self.listener_name, message))
+                LOGGER.info("Details:\n%s" % details)
+        finally:
+            ListenerMethod.called = False
+
+
+class ListenerThread(LoggingThread):
+
+    def __init__(self, dispatcher):
+        LoggingThread.__init__(self, target=dispatcher._run,
+                               name='Listener %s' % dispatcher.listener_name)
+        self.daemon = True
+        self.dispatcher = dispatcher
+
+    def log_message(self, msg):
+        self.dispatcher.log_message(msg)
@@ -32,7 +32,9 @@ class ListenerMethods(object):
         for listener in listeners:
             method = getattr(listener, method_name)
             if method:
-                self._methods.append(ListenerMethod(method, listener))
+                Method = AsyncListenerMethod if listener.dispatcher \
+                    else ListenerMethod
+                self._methods.append(Method(method, listener))
 
     def __call__(self, *args):
         if self._methods:
@@ -107,3 +109,14 @@ class ListenerMethod(object):
             LOGGER.info("Details:\n%s" % details)
         finally:
             ListenerMethod.called = False
+
+
+class AsyncListenerMethod(ListenerMethod):
+
+    def __init__(self, method, listener, library=None):
+        ListenerMethod.__init__(self, method, listener, library)
+        self.dispatcher = listener.dispatcher
+
+    def __call__(self, args):
+        if not self.called:
+            self.dispatcher.dispatch(self.method, args)
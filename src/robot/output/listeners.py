@@ -16,9 +16,10 @@
 import os.path
 
 from robot.errors import DataError
-from robot.utils import (Importer, is_string, py2to3,
+from robot.utils import (Importer, is_string, is_truthy, py2to3,
                          split_args_from_name_or_path, type_name)
 
+from .listenerdispatcher import ListenerDispatcher
 from .listenermethods import ListenerMethods, LibraryListenerMethods
 from .loggerhelper import AbstractLoggerProxy, IsLogged
 from .logger import LOGGER
@@ -35,10 +36,14 @@ class Listeners(object):
     def __init__(self, listeners, log_level='INFO'):
         self._is_logged = IsLogged(log_level)
         listeners = ListenerProxy.import_listeners(listeners,
-                                                   self._method_names)
+                                                   self._method_names,
+                                                   allow_async=True)
+        self._dispatchers = [listener.dispatcher for listener in listeners
+                             if listener.dispatcher]
         for name in self._method_names:
             method = ListenerMethods(name, listeners)
-            if name.endswith(('_file', '_import', 'log_message')):
+            if name.endswith(('_file', '_import', 'log_message')) \
+                    or name == 'close':
                 name = '_' + name
             setattr(self, name, method)
 
@@ -54,8 +59,14 @@ class Listeners(object):
         method(name, attrs)
 
     def output_file(self, file_type, path):
-        method = getattr(self, '_%s_file' % file_type.lower())
-        method(path)
+        method = getattr(self, '_%s_file' % file_type.lower(), None)
+        if method:
+            method(path)
+
+    def close(self):
+        self._close()
+        for dispatcher in self._dispatchers:
+            dispatcher.close()
 
     def __nonzero__(self):
         return any(isinstance(method, ListenerMethods) and method
@@ -118,7 +129,8 @@ class LibraryListeners(object):
 class ListenerProxy(AbstractLoggerProxy):
     _no_method = None
 
-    def __init__(self, listener, method_names, prefix=None):
+    def __init__(self, listener, method_names, prefix=None,
+                 allow_async=False):
         listener, name = self._import_listener(listener)
         AbstractLoggerProxy.__init__(self, listener, method_names, prefix)
         self.name = name
@@ -126,6 +138,8 @@ class ListenerProxy(AbstractLoggerProxy):
         if self.version == 3:
             self.start_keyword = self.end_keyword = None
             self.library_import = self.resource_import = self.variables_import = None
+        self.dispatcher = self._get_dispatcher(listener) if allow_async \
+            else None
 
     def _import_listener(self, listener):
         if not is_string(listener):
@@ -152,13 +166,22 @@ class ListenerProxy(AbstractLoggerProxy):
                             % (self.name, listener.ROBOT_LISTENER_API_VERSION))
         return version
 
+    def _get_dispatcher(self, listener):
+        # Listeners using API version 3 get model objects that they can
+        # modify and are thus always called synchronously.
+        if self.version == 2 \
+                and is_truthy(getattr(listener, 'ROBOT_LISTENER_ASYNC', False)):
+            return ListenerDispatcher(self.name)
+        return None
+
     @classmethod
     def import_listeners(cls, listeners, method_names, prefix=None,
-                         raise_on_error=False):
+                         raise_on_error=False, allow_async=False):
         imported = []
         for listener in listeners:
             try:
-                imported.append(cls(listener, method_names, prefix))
+                imported.append(cls(listener, method_names, prefix,
+                                    allow_async))
             except DataError as err:
                 name = listener if is_string(listener) else type_name(listener)
                 msg = "Taking listener '%s' into use failed: %s" % (name, err)
@@ -14,12 +14,15 @@
 #  limitations under the License.
 
 import os
+import threading
+from collections import deque
 
 from robot.errors import DataError
+from robot.utils import plural_or_not
 
 from .console import ConsoleOutput
 from .filelogger import FileLogger
-from .loggerhelper import AbstractLogger, AbstractLoggerProxy
+from .loggerhelper import AbstractLogger, AbstractLoggerProxy, Message
 from .stdoutlogsplitter import StdoutLogSplitter
 
 
@@ -32,6 +35,7 @@ class Logger(AbstractLogger):
 
     NOTE: This API is likely to change in future versions.
     """
+    _max_background_messages = 10000
 
     def __init__(self, register_console_logger=True):
         self._console_logger = None
@@ -41,6 +45,9 @@ class Logger(AbstractLogger):
         self._library_listeners = None
         self._other_loggers = []
         self._message_cache = []
+        self._background_messages = deque(maxlen=self._max_background_messages)
+        self._dropped_background_messages = 0
+        self._background_lock = threading.Lock()
         self._started_keywords = 0
         self._error_occurred = False
         self._error_listener = None
@@ -155,6 +162,37 @@ class Logger(AbstractLogger):
 
     log_message = message
 
+    def log_background_message(self, msg):
+        """Queue a message logged by a non-main thread.
+
+        Queued messages are logged when the currently running keyword ends
+        or when :meth:`log_background_messages` is called. Messages queued
+        when no keyword is running are logged as part of the next keyword
+        when it starts. Queuing is thread safe, but logging queued messages
+        must be done from the main thread. If the queue is full, the oldest
+        message is dropped.
+        """
+        messages = self._background_messages
+        with self._background_lock:
+            if len(messages) == messages.maxlen:
+                self._dropped_background_messages += 1
+            messages.append(msg)
+
+    def log_background_messages(self):
+        messages = self._background_messages
+        while messages:
+            self.log_message(messages.popleft())
+        with self._background_lock:
+            dropped = self._dropped_background_messages
+            self._dropped_background_messages = 0
+        if dropped:
+            self.log_message(Message('%d message%s logged by non-main threads '
+                                     'dropped because more than %d messages '
+                                     'were queued.'
+                                     % (dropped, plural_or_not(dropped),
+                                        self._max_background_messages),
+                                     'WARN'))
+
     def log_output(self, output):
         for msg in StdoutLogSplitter(output):
             self.log_message(msg)
@@ -184,12 +222,19 @@ class Logger(AbstractLogger):
 
     def start_keyword(self, keyword):
         # TODO: Could _prev_log_message_handlers be used also here?
+        # Queued background messages belong to the running keyword or, if no
+        # keyword is running, they are logged as part of the started keyword.
+        if self._started_keywords:
+            self.log_background_messages()
         self._started_keywords += 1
         self.log_message = self._log_message
         for logger in self.start_loggers:
             logger.start_keyword(keyword)
+        if self._started_keywords == 1:
+            self.log_background_messages()
 
     def end_keyword(self, keyword):
+        self.log_background_messages()
         self._started_keywords -= 1
         for logger in self.end_loggers:
             logger.end_keyword(keyword)
@@ -206,6 +251,7 @@ class Logger(AbstractLogger):
             logger.output_file(file_type, path)
 
     def close(self):
+        self.log_background_messages()
         for logger in self:
             logger.close()
         self.__init__(register_console_logger=False)
@@ -13,6 +13,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import threading
+
 from robot.errors import DataError
 from robot.model import Message as BaseMessage
 from robot.utils import get_timestamp, is_unicode, unic
@@ -103,6 +105,17 @@ class Message(BaseMessage):
         self._message = message
 
 
+class LoggingThread(threading.Thread):
+    """Base class for threads handling messages logged by libraries.
+
+    Messages logged using the public logging API in these threads are passed
+    to :meth:`log_message` instead of the global logger.
+    """
+
+    def log_message(self, msg):
+        raise NotImplementedError
+
+
 class IsLogged(object):
 
     def __init__(self, level):
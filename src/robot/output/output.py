@@ -25,7 +25,8 @@ class Output(AbstractLogger):
 
     def __init__(self, settings):
         AbstractLogger.__init__(self)
-        self._xmllogger = XmlLogger(settings.output, settings.log_level)
+        self._xmllogger = XmlLogger(settings.output, settings.log_level,
+                                    index=settings.output_index)
         self.listeners = Listeners(settings.listeners, settings.log_level)
         self.library_listeners = LibraryListeners(settings.log_level)
         self._register_loggers(DebugFile(settings.debug_file))
@@ -67,6 +68,12 @@ class Output(AbstractLogger):
     def message(self, msg):
         LOGGER.log_message(msg)
 
+    def start_buffering(self):
+        self._xmllogger.start_buffering()
+
+    def end_buffering(self, discard=False):
+        return self._xmllogger.end_buffering(discard)
+
     def set_log_level(self, level):
         pyloggingconf.set_level(level)
         self.listeners.set_log_level(level)
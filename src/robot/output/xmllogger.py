@@ -13,9 +13,13 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import os
+
 from robot.errors import DataError
-from robot.utils import XmlWriter, NullMarkupWriter, get_timestamp, unic
+from robot.utils import (BinaryOutputWriter, NullMarkupWriter, XmlWriter,
+                         binary_file_writer, get_timestamp, is_string, unic)
 from robot.version import get_full_version
+from robot.result.outputindex import OutputIndexWriter, get_index_path
 from robot.result.visitor import ResultVisitor
 
 from .loggerhelper import IsLogged
@@ -23,17 +27,38 @@ from .loggerhelper import IsLogged
 
 class XmlLogger(ResultVisitor):
 
-    def __init__(self, path, log_level='TRACE', generator='Robot'):
+    def __init__(self, path, log_level='TRACE', generator='Robot',
+                 index=False):
         self._log_message_is_logged = IsLogged(log_level)
         self._error_message_is_logged = IsLogged('WARN')
-        self._writer = self._get_writer(path, generator)
+        self._output = self._get_output(path, index)
+        self._writer = self._get_writer(self._output or path, generator)
+        self._index = OutputIndexWriter(get_index_path(path)) \
+            if self._output else None
+        self._path = path
         self._errors = []
+        self._buffered_writers = []
+
+    def _get_output(self, path, index):
+        if not (index and path):
+            return None
+        if not is_string(path) or path.lower().endswith(('.gz', '.rbo')):
+            raise DataError('Output index can only be written for '
+                            'uncompressed XML outputs.')
+        try:
+            return _ByteCountingOutput(path)
+        except EnvironmentError as err:
+            raise DataError("Opening output file '%s' failed: %s" %
+                            (path, err.strerror))
 
     def _get_writer(self, path, generator):
         if not path:
             return NullMarkupWriter()
         try:
-            writer = XmlWriter(path, write_empty=False)
+            if is_string(path) and path.lower().endswith('.rbo'):
+                writer = BinaryOutputWriter(path)
+            else:
+                writer = XmlWriter(path, write_empty=False)
         except EnvironmentError as err:
             raise DataError("Opening output file '%s' failed: %s" %
                             (path, err.strerror))
@@ -41,13 +66,41 @@ class XmlLogger(ResultVisitor):
                                'generated': get_timestamp()})
         return writer
 
+    def _offset(self):
+        return self._output.position
+
     def close(self):
+        while self._buffered_writers:
+            self.end_buffering()
         self.start_errors()
         for msg in self._errors:
             self._write_message(msg)
         self.end_errors()
         self._writer.end('robot')
         self._writer.close()
+        if self._index:
+            self._index.write(self._path)
+
+    def start_buffering(self):
+        """Starts buffering written items until :meth:`end_buffering`.
+
+        Buffering can be nested.
+        """
+        self._buffered_writers.append(self._writer)
+        self._writer = _BufferingWriter()
+
+    def end_buffering(self, discard=False):
+        """Writes or discards items buffered since :meth:`start_buffering`.
+
+        Items containing warnings or errors are never discarded. Returns
+        ``True`` if items were discarded and ``False`` otherwise.
+        """
+        buffer = self._writer
+        self._writer = self._buffered_writers.pop()
+        if discard and not buffer.warnings:
+            return True
+        buffer.write_to(self._writer)
+        return False
 
     def set_log_level(self, level):
         return self._log_message_is_logged.set_level(level)
@@ -83,6 +136,8 @@ class XmlLogger(ResultVisitor):
         self._writer.end('kw')
 
     def start_test(self, test):
+        if self._index:
+            self._index.start_test(test, self._offset())
         self._writer.start('test', {'id': test.id, 'name': test.name})
 
     def end_test(self, test):
@@ -92,8 +147,12 @@ class XmlLogger(ResultVisitor):
             self._writer.element('timeout', attrs={'value': unic(test.timeout)})
         self._write_status(test, {'critical': 'yes' if test.critical else 'no'})
         self._writer.end('test')
+        if self._index:
+            self._index.end_test(test, self._offset())
 
     def start_suite(self, suite):
+        if self._index:
+            self._index.start_suite(suite, self._offset())
         attrs = {'id': suite.id, 'name': suite.name, 'source': suite.source}
         self._writer.start('suite', attrs)
 
@@ -103,6 +162,8 @@ class XmlLogger(ResultVisitor):
             self._write_metadata(suite.metadata)
         self._write_status(suite)
         self._writer.end('suite')
+        if self._index:
+            self._index.end_suite(suite, self._offset())
 
     def _write_metadata(self, metadata):
         self._writer.start('metadata')
@@ -159,3 +220,48 @@ class XmlLogger(ResultVisitor):
         if extra_attrs:
             attrs.update(extra_attrs)
         self._writer.element('status', item.message, attrs)
+
+
+class _BufferingWriter(object):
+    """Records calls to the _MarkupWriter interface to be replayed later."""
+
+    def __init__(self):
+        self._calls = []
+        self.warnings = False
+
+    def start(self, *args, **kwargs):
+        self._calls.append(('start', args, kwargs))
+
+    def end(self, *args, **kwargs):
+        self._calls.append(('end', args, kwargs))
+
+    def element(self, name, content=None, attrs=None, *args, **kwargs):
+        if name == 'msg' and attrs and attrs['level'] in ('WARN', 'ERROR'):
+            self.warnings = True
+        self._calls.append(('element', (name, content, attrs) + args, kwargs))
+
+    def write_to(self, writer):
+        for method, args, kwargs in self._calls:
+            getattr(writer, method)(*args, **kwargs)
+
+
+class _ByteCountingOutput(object):
+    """Writes text to a file as UTF-8 and counts the written bytes.
+
+    Asking the position from a text file flushes it, which is slow.
+    """
+
+    def __init__(self, path):
+        self._file = binary_file_writer(path)
+        self._newline = os.linesep if os.linesep != '\n' else None
+        self.position = 0
+
+    def write(self, text):
+        if self._newline:
+            text = text.replace('\n', self._newline)
+        data = text.encode('UTF-8')
+        self._file.write(data)
+        self.position += len(data)
+
+    def close(self):
+        self._file.close()
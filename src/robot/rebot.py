@@ -39,7 +39,6 @@ if 'robot' not in sys.modules and __name__ == '__main__':
 
 from robot.conf import RebotSettings
 from robot.errors import DataError
-from robot.reporting import ResultWriter
 from robot.output import LOGGER
 from robot.utils import Application
 from robot.run import RobotFramework
@@ -131,6 +130,9 @@ Options
                           specified. Given path, similarly as paths given to
                           --log, --report and --xunit, is relative to
                           --outputdir unless given as an absolute path.
+                          Output is gzip compressed if the path has extension
+                          `.gz` (e.g. `--output output.xml.gz`) and written in
+                          a compact binary format if the extension is `.rbo`.
  -l --log file            HTML log file. Can be disabled by giving a special
                           name `NONE`. Default: log.html
                           Examples: `--log mylog.html`, `-l none`
@@ -343,6 +345,7 @@ class Rebot(RobotFramework):
                              env_options='REBOT_OPTIONS', logger=LOGGER)
 
     def main(self, datasources, **options):
+        from robot.reporting import ResultWriter
         settings = RebotSettings(options)
         LOGGER.register_console_logger(**settings.console_output_config)
         LOGGER.disable_message_cache()
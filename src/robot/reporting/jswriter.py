@@ -13,7 +13,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from robot.htmldata import JsonWriter
+from robot.htmldata.jsonwriter import IdentityMapping, JsonWriter
 
 
 class JsResultWriter(object):
@@ -77,7 +77,7 @@ class SuiteWriter(object):
         self._split_threshold = split_threshold
 
     def write(self, suite, variable):
-        mapping = {}
+        mapping = IdentityMapping()
         self._write_parts_over_threshold(suite, mapping)
         self._write_json('%s = ' % variable, suite, mapping=mapping)
 
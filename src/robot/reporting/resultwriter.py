@@ -119,7 +119,8 @@ class Results(object):
             self._result = ExecutionResult(include_keywords=include_keywords,
                                            flattened_keywords=flattened,
                                            merge=self._settings.merge,
-                                           *self._sources)
+                                           *self._sources,
+                                           **self._selection_options)
             self._result.configure(self._settings.status_rc,
                                    self._settings.suite_config,
                                    self._settings.statistics_config)
@@ -130,6 +131,15 @@ class Results(object):
             self.return_code = self._result.return_code
         return self._result
 
+    @property
+    def _selection_options(self):
+        # Selecting suites and tests already when reading outputs requires
+        # that the root suite is not renamed before filtering.
+        if self._settings['Name']:
+            return {}
+        return {'include_suites': self._settings['SuiteNames'],
+                'include_tests': self._settings['TestNames']}
+
     @property
     def js_result(self):
         if self._js_result is None:
@@ -98,7 +98,8 @@ class Result(object):
         """Save results as a new output XML file.
 
         :param path: Path to save results to. If omitted, overwrites the
-            original file.
+            original file. If the path has extension ``.rbo``, results are
+            saved using the compact binary format.
         """
         from robot.reporting.outputwriter import OutputWriter
         self.visit(OutputWriter(path or self.source))
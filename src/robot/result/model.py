@@ -34,8 +34,12 @@ __ http://robotframework.org/robotframework/latest/RobotFrameworkUserGuide.html#
 
 from itertools import chain
 
-from robot.model import TotalStatisticsBuilder, Criticality
+from robot.model import Criticality, Tags
+from robot.model.testcase import TestCases as TestCaseList
+from robot.model.testsuite import TestSuites as TestSuiteList
+from robot.model.totalstatistics import TotalStatistics
 from robot import model, utils
+from robot.utils import setter
 
 from .configurer import SuiteConfigurer
 from .messagefilter import MessageFilter
@@ -118,21 +122,66 @@ class TestCase(model.TestCase):
 
     See the base class for documentation of attributes not documented here.
     """
-    __slots__ = ['status', 'message', 'starttime', 'endtime']
+    __slots__ = ['_status', 'message', '_starttime', '_endtime']
     keyword_class = Keyword
 
     def __init__(self, name='', doc='', tags=None, timeout=None, status='FAIL',
                  message='', starttime=None, endtime=None):
         model.TestCase.__init__(self, name, doc, tags, timeout)
-        #: Status as a string ``PASS`` or ``FAIL``. See also :attr:`passed`.
-        self.status = status
+        self._status = status
         #: Test message. Typically a failure message but can be set also when
         #: test passes.
         self.message = message
-        #: Test case execution start time in format ``%Y%m%d %H:%M:%S.%f``.
-        self.starttime = starttime
-        #: Test case execution end time in format ``%Y%m%d %H:%M:%S.%f``.
-        self.endtime = endtime
+        self._starttime = starttime
+        self._endtime = endtime
+
+    @property
+    def status(self):
+        """Status as a string ``PASS`` or ``FAIL``. See also :attr:`passed`."""
+        return self._status
+
+    @status.setter
+    def status(self, status):
+        if self.parent and (status == 'PASS') is not self.passed:
+            self.parent._test_status_changed(self)
+        self._status = status
+
+    @property
+    def starttime(self):
+        """Test case execution start time in format ``%Y%m%d %H:%M:%S.%f``."""
+        return self._starttime
+
+    @starttime.setter
+    def starttime(self, starttime):
+        self._starttime = starttime
+        self._statistics_changed()
+
+    @property
+    def endtime(self):
+        """Test case execution end time in format ``%Y%m%d %H:%M:%S.%f``."""
+        return self._endtime
+
+    @endtime.setter
+    def endtime(self, endtime):
+        self._endtime = endtime
+        self._statistics_changed()
+
+    @setter
+    def tags(self, tags):
+        """Test tags as a :class:`~.model.tags.Tags` object."""
+        self._statistics_changed()
+        return TestTags(tags, self)
+
+    def _statistics_changed(self):
+        if self.parent:
+            self.parent._invalidate_statistics()
+
+    def copy(self, **attributes):
+        copied = model.TestCase.copy(self, **attributes)
+        if 'tags' not in attributes:
+            # Tags notify their test when modified, so they cannot be shared.
+            copied.tags = self.tags
+        return copied
 
     @property
     def elapsedtime(self):
@@ -160,17 +209,85 @@ class TestCase(model.TestCase):
         return self.parent.criticality.test_is_critical(self)
 
 
+class TestTags(Tags):
+    """Tags that notify the owning test when they are modified in place."""
+
+    def __init__(self, tags=None, test=None):
+        Tags.__init__(self, tags)
+        self._test = test
+
+    def add(self, tags):
+        Tags.add(self, tags)
+        self._test._statistics_changed()
+
+    def remove(self, tags):
+        Tags.remove(self, tags)
+        self._test._statistics_changed()
+
+
+class TestCases(TestCaseList):
+    """Test list that invalidates statistics of its suite when modified."""
+    __slots__ = []
+
+    def _check_type_and_set_attrs(self, *tests):
+        tests = TestCaseList._check_type_and_set_attrs(self, *tests)
+        self._items_changed()
+        return tests
+
+    def pop(self, *index):
+        self._items_changed()
+        return TestCaseList.pop(self, *index)
+
+    def clear(self):
+        self._items_changed()
+        TestCaseList.clear(self)
+
+    def _items_changed(self):
+        parent = self._common_attrs['parent']
+        if parent:
+            parent._invalidate_statistics()
+
+
+class TestSuites(TestSuiteList):
+    """Suite list that invalidates statistics of its suite when modified."""
+    __slots__ = []
+
+    def _check_type_and_set_attrs(self, *suites):
+        suites = TestSuiteList._check_type_and_set_attrs(self, *suites)
+        # Added suites may have been moved from a tree with different
+        # criticality.
+        for suite in suites:
+            suite._clear_statistics()
+        self._items_changed()
+        return suites
+
+    def pop(self, *index):
+        self._items_changed()
+        return TestSuiteList.pop(self, *index)
+
+    def clear(self):
+        self._items_changed()
+        TestSuiteList.clear(self)
+
+    def _items_changed(self):
+        parent = self._common_attrs['parent']
+        if parent:
+            parent._invalidate_statistics()
+
+
 class TestSuite(model.TestSuite):
     """Represents results of a single test suite.
 
     See the base class for documentation of attributes not documented here.
     """
-    __slots__ = ['message', 'starttime', 'endtime', '_criticality']
+    __slots__ = ['message', 'starttime', 'endtime', '_criticality',
+                 '_statistics']
     test_class = TestCase
     keyword_class = Keyword
 
     def __init__(self, name='', doc='', metadata=None, source=None,
                  message='', starttime=None, endtime=None):
+        self._statistics = None
         model.TestSuite.__init__(self, name, doc, metadata, source)
         #: Possible suite setup or teardown error message.
         self.message = message
@@ -201,8 +318,73 @@ class TestSuite(model.TestSuite):
             print stats.critical.failed
             print stats.all.total
             print stats.message
+
+        The returned object is created based on statistics cached by this
+        suite and its child suites. Caches are updated automatically when
+        tests are added or removed or when their status, tags or times
+        change. Other modifications, such as changing the ``parent`` of
+        tests or suites directly, require calling
+        :meth:`invalidate_statistics` explicitly.
+        """
+        stats = TotalStatistics()
+        self._add_statistics(stats, self._get_statistics())
+        return stats
+
+    def _get_statistics(self):
+        if self._statistics is None:
+            criticality = self.criticality
+            stats = TotalStatistics()
+            for suite in self.suites:
+                self._add_statistics(stats, suite._get_statistics())
+            for test in self.tests:
+                stats.all.add_test(test)
+                if criticality.test_is_critical(test):
+                    stats.critical.add_test(test)
+            self._statistics = stats
+        return self._statistics
+
+    def _add_statistics(self, target, source):
+        for target_stat, source_stat in zip(target, source):
+            target_stat.passed += source_stat.passed
+            target_stat.failed += source_stat.failed
+            target_stat.elapsed += source_stat.elapsed
+
+    def _test_status_changed(self, test):
+        # Called before the status is changed. Passed and failed counts of
+        # suites having statistics cached are updated in place. Tests that
+        # have been removed from this suite may still have it as a parent.
+        if self._statistics is None or test not in self.tests:
+            return
+        critical = test.critical
+        passed, failed = (-1, 1) if test.passed else (1, -1)
+        suite = self
+        while suite and suite._statistics is not None:
+            stats = suite._statistics
+            for stat in (stats.all, stats.critical) if critical else (stats.all,):
+                stat.passed += passed
+                stat.failed += failed
+            suite = suite.parent
+
+    def _invalidate_statistics(self):
+        # If a suite has no statistics cached, its parents have none either.
+        suite = self
+        while suite and suite._statistics is not None:
+            suite._statistics = None
+            suite = suite.parent
+
+    def _clear_statistics(self):
+        self._statistics = None
+        for suite in self.suites:
+            suite._clear_statistics()
+
+    def invalidate_statistics(self):
+        """Clears statistics cached by this suite, its parents and children.
+
+        Needed only if the suite structure is modified in a way that is
+        not tracked automatically. See :attr:`statistics` for details.
         """
-        return TotalStatisticsBuilder(self).stats
+        self._invalidate_statistics()
+        self._clear_statistics()
 
     @property
     def full_message(self):
@@ -235,7 +417,7 @@ class TestSuite(model.TestSuite):
         if self.parent:
             return self.parent.criticality
         if self._criticality is None:
-            self.set_criticality()
+            self._criticality = Criticality()
         return self._criticality
 
     def set_criticality(self, critical_tags=None, non_critical_tags=None):
@@ -255,6 +437,19 @@ class TestSuite(model.TestSuite):
         if self.parent:
             raise TypeError('Criticality can only be set to the root suite.')
         self._criticality = Criticality(critical_tags, non_critical_tags)
+        self._clear_statistics()
+
+    @setter
+    def suites(self, suites):
+        """Child suites as a :class:`~.TestSuites` object."""
+        self._invalidate_statistics()
+        return TestSuites(self.__class__, self, suites)
+
+    @setter
+    def tests(self, tests):
+        """Tests as a :class:`~.TestCases` object."""
+        self._invalidate_statistics()
+        return TestCases(self.test_class, self, tests)
 
     def remove_keywords(self, how):
         """Remove keywords based on the given condition.
@@ -0,0 +1,209 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Sidecar index for random access to suites and tests in output files.
+
+The index is a JSON file stored next to the output file with ``.idx``
+suffix. It contains byte offsets, statuses and elapsed times of all suites
+and tests in the output, and is only used if the size and modification
+time of the output file match the ones recorded in the index.
+"""
+
+import io
+import json
+import os
+
+from robot.model import SuiteNamePatterns, TestNamePatterns
+from robot.utils import is_string
+
+
+INDEX_VERSION = 1
+
+
+def get_index_path(output):
+    return output + '.idx'
+
+
+def read_output_index(output):
+    """Returns :class:`OutputIndex` for the output or ``None`` if not usable.
+
+    ``None`` is returned if the index does not exist, cannot be read, or
+    does not match the output file anymore.
+    """
+    if not is_string(output):
+        return None
+    path = get_index_path(output)
+    if not os.path.isfile(path):
+        return None
+    try:
+        with open(path) as index:
+            data = json.load(index)
+        if data['version'] != INDEX_VERSION \
+                or data['size'] != os.path.getsize(output) \
+                or data['mtime'] != os.path.getmtime(output):
+            return None
+        return OutputIndex(data['suites'], data['tests'])
+    except (EnvironmentError, ValueError, KeyError, TypeError):
+        return None
+
+
+class OutputIndex(object):
+    """Suites and tests in an output file along with their locations.
+
+    Suites are ``(name, parent, start, end, status, elapsed)`` tuples where
+    ``parent`` is the index of the parent suite or ``-1`` with the root
+    suite. Tests are ``(name, parent, start, end, status, elapsed)`` tuples
+    where ``parent`` is the index of the suite containing the test.
+    """
+
+    def __init__(self, suites=None, tests=None):
+        self.suites = [tuple(s) for s in suites or ()]
+        self.tests = [tuple(t) for t in tests or ()]
+        self._longnames = self._get_suite_longnames(self.suites)
+
+    def _get_suite_longnames(self, suites):
+        longnames = []
+        for name, parent, _, _, _, _ in suites:
+            longnames.append(name if parent < 0
+                             else '%s.%s' % (longnames[parent], name))
+        return longnames
+
+    def test_longname(self, test):
+        return '%s.%s' % (self._longnames[test[1]], test[0])
+
+    @property
+    def failed_tests(self):
+        return [self.test_longname(t) for t in self.tests if t[4] != 'PASS']
+
+    @property
+    def failed_suites(self):
+        failed = set(t[1] for t in self.tests if t[4] != 'PASS')
+        return [self._longnames[index] for index in sorted(failed)]
+
+    def get_skipped_ranges(self, include_suites=None, include_tests=None):
+        """Returns byte ranges of suites and tests that would be filtered out.
+
+        The logic matches :class:`robot.model.filter.Filter` when it is used
+        with the given suite and test name patterns. Only suites and tests
+        that are certainly filtered are returned. If nothing would be left,
+        no ranges are returned and filtering can report errors normally.
+        """
+        include_suites = SuiteNamePatterns(include_suites)
+        include_tests = TestNamePatterns(include_tests)
+        if not (include_suites or include_tests):
+            return []
+        selected = self._get_selected_suites(include_suites)
+        needed_tests = [self._test_is_needed(t, selected, include_tests)
+                        for t in self.tests]
+        needed_suites = [False] * len(self.suites)
+        for test, needed in zip(self.tests, needed_tests):
+            if needed:
+                self._mark_needed(test[1], needed_suites)
+        if not any(needed_tests):
+            return []
+        ranges = []
+        for suite, needed in zip(self.suites, needed_suites):
+            parent = suite[1]
+            if not needed and parent >= 0 and needed_suites[parent]:
+                ranges.append((suite[2], suite[3]))
+        for test, needed in zip(self.tests, needed_tests):
+            if not needed and needed_suites[test[1]]:
+                ranges.append((test[2], test[3]))
+        return sorted(ranges)
+
+    def _get_selected_suites(self, include_suites):
+        selected = []
+        for (name, parent, _, _, _, _), longname \
+                in zip(self.suites, self._longnames):
+            selected.append(not include_suites
+                            or parent >= 0 and selected[parent]
+                            or include_suites.match(name, longname))
+        return selected
+
+    def _test_is_needed(self, test, selected_suites, include_tests):
+        if not selected_suites[test[1]]:
+            return False
+        return not include_tests \
+            or include_tests.match(test[0], self.test_longname(test))
+
+    def _mark_needed(self, index, needed_suites):
+        while index >= 0 and not needed_suites[index]:
+            needed_suites[index] = True
+            index = self.suites[index][1]
+
+
+class OutputIndexWriter(object):
+    """Collects suite and test offsets while an output file is written."""
+
+    def __init__(self, path):
+        self._path = path
+        self._suites = []
+        self._tests = []
+        self._stack = []
+
+    def start_suite(self, suite, offset):
+        parent = self._stack[-1][0] if self._stack else -1
+        self._stack.append((len(self._suites), len(self._tests)))
+        self._suites.append([suite.name, parent, offset, None, None, None])
+
+    def end_suite(self, suite, offset):
+        index, first_test = self._stack.pop()
+        self._suites[index][3:] = [offset, suite.status, suite.elapsedtime]
+        teardown = suite.keywords.teardown
+        # Matches how suite teardown failures are handled when reading results.
+        if teardown and teardown.status == 'FAIL':
+            for test in self._tests[first_test:]:
+                test[4] = 'FAIL'
+
+    def start_test(self, test, offset):
+        self._tests.append([test.name, self._stack[-1][0], offset,
+                            None, None, None])
+
+    def end_test(self, test, offset):
+        self._tests[-1][3:] = [offset, test.status, test.elapsedtime]
+
+    def write(self, output):
+        data = {'version': INDEX_VERSION,
+                'size': os.path.getsize(output),
+                'mtime': os.path.getmtime(output),
+                'suites': self._suites,
+                'tests': self._tests}
+        with open(self._path, 'w') as index:
+            json.dump(data, index, separators=(',', ':'))
+
+
+class SkippingReader(object):
+    """File-like object that skips the given byte ranges when reading."""
+
+    def __init__(self, path, skipped_ranges):
+        self.name = path
+        self._file = io.open(path, 'rb')
+        self._skipped = list(reversed(skipped_ranges))
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            return b''.join(iter(lambda: self.read(65536), b''))
+        position = self._file.tell()
+        while self._skipped and self._skipped[-1][0] <= position:
+            start, end = self._skipped.pop()
+            if end > position:
+                self._file.seek(end)
+                position = end
+        if self._skipped:
+            size = min(size, self._skipped[-1][0] - position)
+        return self._file.read(size)
+
+    def close(self):
+        self._file.close()
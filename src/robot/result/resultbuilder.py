@@ -15,12 +15,14 @@
 
 from robot.errors import DataError
 from robot.model import SuiteVisitor
-from robot.utils import ET, ETSource, get_error_message, unic
+from robot.utils import (BinaryOutputParser, ET, ETSource, get_error_message,
+                         is_binary_output, unic)
 
 from .executionresult import Result, CombinedResult
 from .flattenkeywordmatcher import (FlattenByNameMatcher, FlattenByTypeMatcher,
                                     FlattenByTagMatcher)
 from .merger import Merger
+from .outputindex import SkippingReader, read_output_index
 from .xmlelementhandlers import XmlElementHandler
 
 
@@ -40,7 +42,12 @@ def ExecutionResult(*sources, **options):
     """
     if not sources:
         raise DataError('One or more data source needed.')
-    if options.pop('merge', False):
+    merge = options.pop('merge', False)
+    if merge or len(sources) > 1:
+        # Longnames in indices do not match suites and tests after combining.
+        options.pop('include_suites', None)
+        options.pop('include_tests', None)
+    if merge:
         return _merge_results(sources[0], sources[1:], options)
     if len(sources) > 1:
         return _combine_results(sources, options)
@@ -78,7 +85,8 @@ class ExecutionResultBuilder(object):
     :func:`ExecutionResult` factory method.
     """
 
-    def __init__(self, source, include_keywords=True, flattened_keywords=None):
+    def __init__(self, source, include_keywords=True, flattened_keywords=None,
+                 include_suites=None, include_tests=None):
         """
         :param source: Path to the XML output file to build
             :class:`~.executionresult.Result` objects from.
@@ -88,11 +96,20 @@ class ExecutionResultBuilder(object):
         :param flatten_keywords: List of patterns controlling what keywords to
             flatten. See the documentation of ``--flattenkeywords`` option for
             more details.
+        :param include_suites: Suite name patterns that will be used for
+            filtering results. If the output file has a valid index (see
+            ``--outputindex``), suites and tests that would be filtered out
+            are not parsed at all. Filtering itself must still be done
+            separately.
+        :param include_tests: Test name patterns used similarly as
+            ``include_suites``.
         """
         self._source = source \
             if isinstance(source, ETSource) else ETSource(source)
         self._include_keywords = include_keywords
         self._flattened_keywords = flattened_keywords
+        self._include_suites = include_suites
+        self._include_tests = include_tests
 
     def build(self, result):
         # Parsing is performance optimized. Do not change without profiling!
@@ -105,7 +122,10 @@ class ExecutionResultBuilder(object):
         return result
 
     def _parse(self, source, start, end):
-        context = ET.iterparse(source, events=('start', 'end'))
+        if is_binary_output(source):
+            context = self._parse_binary(source)
+        else:
+            context = self._iterparse(source)
         if not self._include_keywords:
             context = self._omit_keywords(context)
         elif self._flattened_keywords:
@@ -117,6 +137,33 @@ class ExecutionResultBuilder(object):
                 end(elem)
                 elem.clear()
 
+    def _iterparse(self, source):
+        index = None
+        if self._include_suites or self._include_tests:
+            index = read_output_index(source)
+        skipped = index.get_skipped_ranges(self._include_suites,
+                                           self._include_tests) \
+            if index else None
+        if not skipped:
+            return ET.iterparse(source, events=('start', 'end'))
+        return self._iterparse_and_skip(source, skipped)
+
+    def _iterparse_and_skip(self, source, skipped):
+        reader = SkippingReader(source, skipped)
+        try:
+            for event in ET.iterparse(reader, events=('start', 'end')):
+                yield event
+        finally:
+            reader.close()
+
+    def _parse_binary(self, source):
+        # Keywords are skipped already when parsing to avoid decoding them.
+        # Teardowns aren't omitted for the same reason as in `_omit_keywords`.
+        skip = None
+        if not self._include_keywords:
+            skip = lambda elem: elem.get('type') != 'teardown'
+        return BinaryOutputParser(source, skip)
+
     def _omit_keywords(self, context):
         omitted_kws = 0
         for event, elem in context:
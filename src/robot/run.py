@@ -40,8 +40,6 @@ if 'robot' not in sys.modules and __name__ == '__main__':
 from robot.conf import RobotSettings
 from robot.model import ModelModifier
 from robot.output import LOGGER, pyloggingconf
-from robot.reporting import ResultWriter
-from robot.running import TestSuiteBuilder
 from robot.utils import Application, unic
 
 
@@ -163,7 +161,17 @@ Options
                           can also be further processed with Rebot tool. Can be
                           disabled by giving a special value `NONE`. In this
                           case, also log and report are automatically disabled.
+                          Output is gzip compressed if the path has extension
+                          `.gz` (e.g. `--output output.xml.gz`) and written in
+                          a compact binary format if the extension is `.rbo`.
                           Default: output.xml
+    --outputindex         Write an index of suites and tests in the XML output
+                          file into a separate file with the same name as the
+                          output and an extra `.idx` extension. The index is
+                          used by --rerunfailed, --rerunfailedsuites and by
+                          Rebot when selecting suites or tests with --suite
+                          or --test to avoid parsing the whole output file.
+                          Cannot be used with compressed or binary outputs.
  -l --log file            HTML log file. Can be disabled by giving a special
                           value `NONE`. Default: log.html
                           Examples: `--log mylog.html`, `-l NONE`
@@ -174,6 +182,17 @@ Options
     --xunitskipnoncritical  Mark non-critical tests on xUnit output as skipped.
  -b --debugfile file      Debug file written during execution. Not created
                           unless this option is specified.
+    --profile file        Measure execution times of keywords and write
+                          counts and total, self and max times per keyword,
+                          library or resource file, and suite into the given
+                          text file. Same information is also written in JSON
+                          format into a file with the same base name and
+                          `.json` extension. Time spent resolving variables in
+                          arguments and finding keywords is reported
+                          separately. Not created unless this option is
+                          specified.
+    --profilesort self|total|max|count|name  Sort profile results based on
+                          the given column. The default is `self`.
  -T --timestampoutputs    When this option is used, timestamp in a format
                           `YYYYMMDD-hhmmss` is added to all generated output
                           files between their basename and extension. For
@@ -431,6 +450,9 @@ class RobotFramework(Application):
                              env_options='ROBOT_OPTIONS', logger=LOGGER)
 
     def main(self, datasources, **options):
+        # Imported here, not at module level, to keep `import robot` fast.
+        from robot.reporting import ResultWriter
+        from robot.running import TestSuiteBuilder
         settings = RobotSettings(options)
         LOGGER.register_console_logger(**settings.console_output_config)
         LOGGER.info('Settings:\n%s' % unic(settings))
@@ -14,13 +14,14 @@
 #  limitations under the License.
 
 from robot.errors import DataError
-from robot.utils import is_string, is_dict_like, split_from_equals
-from robot.variables import VariableSplitter
+from robot.utils import is_string, is_dict_like, split_from_equals, unescape
+from robot.variables import VariableSplitter, is_list_var
 
 from .argumentvalidator import ArgumentValidator
 
 
 class ArgumentResolver(object):
+    _max_plans = 1000
 
     def __init__(self, argspec, resolve_named=True,
                  resolve_variables_until=None, dict_to_kwargs=False):
@@ -29,8 +30,13 @@ class ArgumentResolver(object):
         self._variable_replacer = VariableReplacer(resolve_variables_until)
         self._dict_to_kwargs = DictToKwargs(argspec, dict_to_kwargs)
         self._argument_validator = ArgumentValidator(argspec)
+        self._resolve_until = resolve_variables_until
+        self._plans = {}
 
     def resolve(self, arguments, variables=None):
+        plan = self._get_plan(arguments) if variables else None
+        if plan:
+            return plan.resolve(variables)
         positional, named = self._named_resolver.resolve(arguments, variables)
         positional, named = self._variable_replacer.replace(positional, named,
                                                             variables)
@@ -39,6 +45,113 @@ class ArgumentResolver(object):
                                           dryrun=not variables)
         return positional, named
 
+    def _get_plan(self, arguments):
+        try:
+            key = tuple(arguments)
+            return self._plans[key]
+        except KeyError:
+            pass
+        except TypeError:
+            return None
+        if len(self._plans) >= self._max_plans:
+            self._plans.clear()
+        plan = self._plans[key] = self._create_plan(key)
+        return plan
+
+    def _create_plan(self, arguments):
+        if not (all(is_string(arg) for arg in arguments) and
+                self._named_resolver.names_are_static(arguments)):
+            return None
+        positional, named = self._named_resolver.resolve(arguments)
+        return BindingPlan(positional, named, self._resolve_until,
+                           self._dict_to_kwargs, self._argument_validator)
+
+
+class BindingPlan(object):
+    """Tells how certain arguments are bound to a keyword.
+
+    When names of named arguments contain no variables, which arguments
+    are named does not depend on variable values. Arguments containing no
+    variables can also be unescaped in advance, and when the number of
+    arguments and the names used are fixed, arguments can be validated
+    already when the plan is created. Plans are cached based on the
+    arguments so that only variables need to be replaced when the same
+    keyword is run again.
+    """
+
+    def __init__(self, positional, named, resolve_until, dict_to_kwargs,
+                 validator):
+        self._positional = list(positional)
+        self._resolve_until = resolve_until
+        self._static_positional = self._get_static_positional(self._positional)
+        self._named = [self._get_named(item) for item in named]
+        self._dict_to_kwargs = dict_to_kwargs
+        self._validator = validator
+        self._validated = self._validate_in_advance()
+
+    def _get_static_positional(self, positional):
+        if any('{' in arg for arg in positional[:self._resolve_until]):
+            return None
+        if self._resolve_until is None:
+            return [unescape(arg) for arg in positional]
+        return ([unescape(arg) for arg in positional[:self._resolve_until]] +
+                positional[self._resolve_until:])
+
+    def _get_named(self, item):
+        if not isinstance(item, tuple):
+            return item, None, True, True
+        name, value = item
+        return (self._get_static_value(name), self._get_static_value(value),
+                '{' in name, '{' in value)
+
+    def _get_static_value(self, value):
+        return value if '{' in value else unescape(value)
+
+    def _validate_in_advance(self):
+        if any(is_list_var(arg) for arg in self._positional):
+            return False
+        if any(value is None or replace_name
+               for name, value, replace_name, _ in self._named):
+            return False
+        named = [(name, value) for name, value, _, _ in self._named]
+        if self._dict_to_kwargs.may_handle(self._positional, named):
+            return False
+        # Possible errors are reported when resolving so that errors
+        # related to variables are reported first like normally.
+        try:
+            self._validator.validate(self._positional, named)
+        except DataError:
+            return False
+        return True
+
+    def resolve(self, variables):
+        if self._static_positional is not None:
+            positional = list(self._static_positional)
+        else:
+            positional = variables.replace_list(self._positional,
+                                                self._resolve_until)
+        named = list(self._replace_named(variables.replace_scalar)) \
+            if self._named else []
+        if not self._validated:
+            positional, named = self._dict_to_kwargs.handle(positional, named)
+            self._validator.validate(positional, named)
+        return positional, named
+
+    def _replace_named(self, replace_scalar):
+        for name, value, replace_name, replace_value in self._named:
+            if value is None:
+                items = replace_scalar(name).items()
+            else:
+                if replace_name:
+                    name = replace_scalar(name)
+                if replace_value:
+                    value = replace_scalar(value)
+                items = [(name, value)]
+            for name, value in items:
+                if not is_string(name):
+                    raise DataError('Argument names must be strings.')
+                yield name, value
+
 
 class NamedArgumentResolver(object):
 
@@ -77,6 +190,16 @@ class NamedArgumentResolver(object):
             name = variables.replace_scalar(name)
         return name in self._argspec.positional
 
+    def names_are_static(self, arguments):
+        if self._argspec.kwargs or not self._argspec.supports_named:
+            return True
+        for arg in arguments:
+            if '=' in arg:
+                name, value = split_from_equals(arg)
+                if value is not None and ('{' in name or '\\' in name):
+                    return False
+        return True
+
     def _raise_positional_after_named(self):
         raise DataError("%s '%s' got positional argument after named arguments."
                         % (self._argspec.type, self._argspec.name))
@@ -87,6 +210,9 @@ class NullNamedArgumentResolver(object):
     def resolve(self, arguments, variables=None):
         return arguments, {}
 
+    def names_are_static(self, arguments):
+        return True
+
 
 class DictToKwargs(object):
 
@@ -99,6 +225,10 @@ class DictToKwargs(object):
             named = positional.pop().items()
         return positional, named
 
+    def may_handle(self, positional, named):
+        return (self._enabled and not named and
+                len(positional) == self._maxargs + 1)
+
     def _extra_arg_has_kwargs(self, positional, named):
         if named or len(positional) != self._maxargs + 1:
             return False
@@ -30,6 +30,7 @@ class ArgumentSpec(object):
         self.varargs = varargs
         self.kwargs = kwargs
         self.supports_named = supports_named
+        self._resolvers = {}
 
     @property
     def minargs(self):
@@ -41,9 +42,11 @@ class ArgumentSpec(object):
 
     def resolve(self, arguments, variables=None, resolve_named=True,
                 resolve_variables_until=None, dict_to_kwargs=False):
-        resolver = ArgumentResolver(self, resolve_named,
-                                    resolve_variables_until, dict_to_kwargs)
-        return resolver.resolve(arguments, variables)
+        # Resolvers are cached because they cache binding plans.
+        key = (resolve_named, resolve_variables_until, dict_to_kwargs)
+        if key not in self._resolvers:
+            self._resolvers[key] = ArgumentResolver(self, *key)
+        return self._resolvers[key].resolve(arguments, variables)
 
     def map(self, positional, named, replace_defaults=True):
         mapper = ArgumentMapper(self)
@@ -39,8 +39,9 @@ class ExecutionContexts(object):
     def namespaces(self):
         return (context.namespace for context in self)
 
-    def start_suite(self, suite, namespace, output, dry_run=False):
-        ctx = _ExecutionContext(suite, namespace, output, dry_run)
+    def start_suite(self, suite, namespace, output, dry_run=False,
+                    profiler=None):
+        ctx = _ExecutionContext(suite, namespace, output, dry_run, profiler)
         self._contexts.append(ctx)
         return ctx
 
@@ -55,13 +56,15 @@ EXECUTION_CONTEXTS = ExecutionContexts()
 class _ExecutionContext(object):
     _started_keywords_threshold = 42  # Jython on Windows don't work with higher
 
-    def __init__(self, suite, namespace, output, dry_run=False):
+    def __init__(self, suite, namespace, output, dry_run=False,
+                 profiler=None):
         self.suite = suite
         self.test = None
         self.timeouts = set()
         self.namespace = namespace
         self.output = output
         self.dry_run = dry_run
+        self.profiler = profiler
         self.in_suite_teardown = False
         self.in_test_teardown = False
         self.in_keyword_teardown = 0
@@ -180,8 +183,17 @@ class _ExecutionContext(object):
         self._started_keywords -= 1
 
     def get_runner(self, name):
+        if self.profiler:
+            return self.profiler.measure(self.profiler.KEYWORD_LOOKUP,
+                                         self.namespace.get_runner, name)
         return self.namespace.get_runner(name)
 
+    def resolve_arguments(self, resolver, arguments):
+        if self.profiler:
+            return self.profiler.measure(self.profiler.VARIABLE_RESOLUTION,
+                                         resolver, arguments, self.variables)
+        return resolver(arguments, self.variables)
+
     def trace(self, message):
         self.output.trace(message)
 
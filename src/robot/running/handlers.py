@@ -54,6 +54,8 @@ class _RunnableHandler(object):
         self._handler_name = handler_name
         self._method = self._get_initial_handler(library, handler_name,
                                                  handler_method)
+        self._capture_output = utils.is_truthy(
+            getattr(handler_method, 'robot_capture_output', True))
         doc, tags_from_doc = utils.split_tags_from_doc(doc or '')
         tags_from_attr = self._get_tags_from_attribute(handler_method)
         self._doc = doc
@@ -102,6 +104,10 @@ class _RunnableHandler(object):
     def libname(self):
         return self.library.name
 
+    @property
+    def capture_output(self):
+        return self._capture_output and self.library.capture_output
+
     def create_runner(self, name):
         return LibraryKeywordRunner(self)
 
@@ -14,9 +14,11 @@
 #  limitations under the License.
 
 from operator import attrgetter
+import re
 
 from robot.errors import DataError
 from robot.utils import NormalizedDict
+from robot.variables import VariableIterator
 
 from .usererrorhandler import UserErrorHandler
 
@@ -31,10 +33,12 @@ class HandlerStore(object):
         self.source_type = source_type
         self._normal = NormalizedDict(ignore='_')
         self._embedded = []
+        self._embedded_index = EmbeddedArgumentsIndex()
 
     def add(self, handler, embedded=False):
         if embedded:
             self._embedded.append(handler)
+            self._embedded_index.add(handler)
         elif handler.name not in self._normal:
             self._normal[handler.name] = handler
         else:
@@ -53,7 +57,8 @@ class HandlerStore(object):
     def __contains__(self, name):
         if name in self._normal:
             return True
-        return any(template.matches(name) for template in self._embedded)
+        return any(template.matches(name)
+                   for template in self._embedded_index.get_candidates(name))
 
     def create_runner(self, name):
         return self[name].create_runner(name)
@@ -65,7 +70,8 @@ class HandlerStore(object):
             return self._find_embedded(name)
 
     def _find_embedded(self, name):
-        embedded = [template for template in self._embedded
+        embedded = [template
+                    for template in self._embedded_index.get_candidates(name)
                     if template.matches(name)]
         if len(embedded) == 1:
             return embedded[0]
@@ -83,3 +89,62 @@ class HandlerStore(object):
                  % (source, name)]
         names = sorted(handler.name for handler in found)
         raise DataError('\n    '.join(error + names))
+
+
+class EmbeddedArgumentsIndex(object):
+    """Finds keywords with embedded arguments that may match a name.
+
+    Keywords are indexed by the literal text before their first argument
+    and candidates are further filtered by the literal text after the last
+    argument. Candidates still need to be matched using their regexps.
+
+    Texts are compared case-insensitively. Only the ASCII parts of them are
+    indexed and all keywords are returned as candidates for names containing
+    non-ASCII characters, because case-insensitive regexp matching does not
+    always agree with lower-casing with them.
+    """
+    _non_ascii = re.compile(u'[^\x00-\x7f]')
+
+    def __init__(self):
+        self._handlers = []
+        self._by_prefix = {}
+        self._prefix_lengths = []
+
+    def add(self, handler):
+        prefix, suffix = self._get_prefix_and_suffix(handler.name)
+        self._handlers.append(handler)
+        if prefix not in self._by_prefix:
+            self._by_prefix[prefix] = []
+            self._prefix_lengths = sorted(set(self._prefix_lengths)
+                                          | set([len(prefix)]))
+        self._by_prefix[prefix].append((handler, suffix))
+
+    def _get_prefix_and_suffix(self, name):
+        prefix = suffix = None
+        for before, _, suffix in VariableIterator(name, identifiers='$'):
+            if prefix is None:
+                prefix = before
+        if prefix is None:
+            prefix, suffix = name, ''
+        return self._ascii_start(prefix), self._ascii_end(suffix)
+
+    def _ascii_start(self, text):
+        match = self._non_ascii.search(text)
+        return (text[:match.start()] if match else text).lower()
+
+    def _ascii_end(self, text):
+        matches = list(self._non_ascii.finditer(text))
+        return (text[matches[-1].end():] if matches else text).lower()
+
+    def get_candidates(self, name):
+        if self._non_ascii.search(name):
+            return list(self._handlers)
+        name = name.lower()
+        candidates = []
+        for length in self._prefix_lengths:
+            if length > len(name):
+                break
+            for handler, suffix in self._by_prefix.get(name[:length], ()):
+                if name.endswith(suffix) and length + len(suffix) <= len(name):
+                    candidates.append(handler)
+        return candidates
@@ -55,6 +55,21 @@ class LibraryKeywordRunner(object):
                 assigner.assign(return_value)
                 return return_value
 
+    def prepare(self, kw, context):
+        """Prepares running ``kw`` outside the normal execution flow.
+
+        Returns a result object for the keyword, messages that should be
+        logged before it is run, and a callable that runs the keyword with
+        its arguments already resolved. Used by `Run Keywords In Parallel`.
+        """
+        result = self._get_result(kw, VariableAssignment(()))
+        messages = list(self.pre_run_messages or ())
+        positional, named = \
+            context.resolve_arguments(self._handler.resolve_arguments, kw.args)
+        handler = self._handler.current_handler()
+        named = dict(named)
+        return result, messages, lambda: handler(*positional, **named)
+
     def _get_result(self, kw, assignment):
         handler = self._handler
         return KeywordResult(kwname=self.name,
@@ -70,7 +85,7 @@ class LibraryKeywordRunner(object):
             for message in self.pre_run_messages:
                 context.output.message(message)
         positional, named = \
-            self._handler.resolve_arguments(args, context.variables)
+            context.resolve_arguments(self._handler.resolve_arguments, args)
         context.output.trace(lambda: self._trace_log_args(positional, named))
         runner = self._runner_for(context, self._handler.current_handler(),
                                   positional, dict(named))
@@ -92,6 +107,8 @@ class LibraryKeywordRunner(object):
         return min(context.timeouts) if context.timeouts else None
 
     def _run_with_output_captured_and_signal_monitor(self, runner, context):
+        if not self._handler.capture_output:
+            return self._run_with_signal_monitoring(runner, context)
         with OutputCapturer():
             return self._run_with_signal_monitoring(runner, context)
 
@@ -163,7 +180,7 @@ class RunKeywordRunner(LibraryKeywordRunner):
     def _get_dry_run_keywords(self, args):
         if self.name == 'Run Keyword If':
             return list(self._get_run_kw_if_keywords(args))
-        if self.name == 'Run Keywords':
+        if self.name in ('Run Keywords', 'Run Keywords In Parallel'):
             return list(self._get_run_kws_keywords(args))
         if self._default_dry_run_keywords:
             return self._get_default_run_kw_keywords(args)
@@ -36,6 +36,7 @@ __ http://robotframework.org/robotframework/latest/RobotFrameworkUserGuide.html#
 import warnings
 
 from robot import model
+from robot.errors import DataError
 from robot.conf import RobotSettings
 from robot.output import LOGGER, Output, pyloggingconf
 from robot.utils import setter
@@ -233,6 +234,7 @@ class TestSuite(model.TestSuite):
         API for executing tests in files or directories.
         """
         from .namespace import IMPORTER
+        from .profiler import Profiler
         from .signalhandler import STOP_SIGNAL_MONITOR
         from .runner import Runner
 
@@ -244,11 +246,24 @@ class TestSuite(model.TestSuite):
                 with STOP_SIGNAL_MONITOR:
                     IMPORTER.reset()
                     output = Output(settings)
-                    runner = Runner(output, settings)
+                    profiler = Profiler() if settings.profile else None
+                    runner = Runner(output, settings, profiler)
                     self.visit(runner)
                 output.close(runner.result)
+                if profiler:
+                    self._write_profile(profiler, settings)
         return runner.result
 
+    def _write_profile(self, profiler, settings):
+        try:
+            path, json_path = profiler.write(settings.profile,
+                                             settings.profile_sort)
+        except DataError as err:
+            LOGGER.error(err.message)
+        else:
+            LOGGER.output_file('Profile', path)
+            LOGGER.output_file('Profile', json_path)
+
 
 class Variable(object):
 
@@ -22,7 +22,7 @@ from robot.libraries import STDLIBS
 from robot.output import LOGGER, Message
 from robot.parsing.settings import Library, Variables, Resource
 from robot.utils import (eq, find_file, is_string, OrderedDict, printable_name,
-                         seq2str2, RecommendationFinder)
+                         seq2str2, RecommendationIndex)
 
 from .usererrorhandler import UserErrorHandler
 from .userkeyword import UserLibrary
@@ -234,6 +234,8 @@ class KeywordStore(object):
         self.libraries = OrderedDict()
         self.resources = ImportCache()
         self.search_order = ()
+        self._recommendation_finder = None
+        self._recommendation_owners = None
 
     def get_library(self, name_or_instance):
         if name_or_instance is None:
@@ -269,13 +271,24 @@ class KeywordStore(object):
 
     def _raise_no_keyword_found(self, name):
         msg = "No keyword with name '%s' found." % name
-        finder = KeywordRecommendationFinder(self.user_keywords,
-                                             self.libraries,
-                                             self.resources)
+        finder = self._get_recommendation_finder()
         recommendations = finder.recommend_similar_keywords(name)
         msg = finder.format_recommendations(msg, recommendations)
         raise DataError(msg)
 
+    def _get_recommendation_finder(self):
+        # Finder is recreated when libraries or resources, or their
+        # keywords in case a library has been reloaded, change.
+        owners = [(owner, owner.handlers, len(owner.handlers))
+                  for owner in chain(self.libraries.values(),
+                                     self.resources.values())]
+        if owners != self._recommendation_owners:
+            self._recommendation_finder = \
+                KeywordRecommendationFinder(self.user_keywords,
+                                            self.libraries, self.resources)
+            self._recommendation_owners = owners
+        return self._recommendation_finder
+
     def _get_runner(self, name):
         if not name:
             raise DataError('Keyword name cannot be empty.')
@@ -405,18 +418,24 @@ class KeywordRecommendationFinder(object):
         self.user_keywords = user_keywords
         self.libraries = libraries
         self.resources = resources
+        self._indexes = {}
 
     def recommend_similar_keywords(self, name):
         """Return keyword names similar to `name`."""
-        candidates = self._get_candidates('.' in name)
+        use_full_name = '.' in name
+        if use_full_name not in self._indexes:
+            self._indexes[use_full_name] = self._create_index(use_full_name)
+        return self._indexes[use_full_name].find_recommendations(name)
+
+    def _create_index(self, use_full_name):
+        candidates = self._get_candidates(use_full_name)
         normalizer = lambda name: candidates.get(name, name).lower().replace(
             '_', ' ')
-        finder = RecommendationFinder(normalizer)
-        return finder.find_recommendations(name, candidates)
+        return RecommendationIndex(candidates, normalizer)
 
     @staticmethod
     def format_recommendations(msg, recommendations):
-        return RecommendationFinder.format_recommendations(
+        return RecommendationIndex.format_recommendations(
             msg, recommendations)
 
     def _get_candidates(self, use_full_name):
@@ -26,8 +26,9 @@ class OutputCapturer(object):
         self._library_import = library_import
         self._python_out = PythonCapturer(stdout=True)
         self._python_err = PythonCapturer(stdout=False)
-        self._java_out = JavaCapturer(stdout=True)
-        self._java_err = JavaCapturer(stdout=False)
+        if JYTHON:
+            self._java_out = JavaCapturer(stdout=True)
+            self._java_err = JavaCapturer(stdout=False)
 
     def __enter__(self):
         if self._library_import:
@@ -49,12 +50,20 @@ class OutputCapturer(object):
             sys.__stderr__.write(console_encode(stderr, stream=sys.__stderr__))
 
     def _release(self):
-        stdout = self._python_out.release() + self._java_out.release()
-        stderr = self._python_err.release() + self._java_err.release()
+        stdout = self._python_out.release()
+        stderr = self._python_err.release()
+        if JYTHON:
+            stdout += self._java_out.release()
+            stderr += self._java_err.release()
         return stdout, stderr
 
 
 class PythonCapturer(object):
+    # Buffers are reused because capturing happens around every library
+    # keyword call. Capturers can be nested, so there can be multiple
+    # buffers in use at the same time. Buffers are always emptied before
+    # they are returned to the pool.
+    _free_buffers = []
 
     def __init__(self, stdout=True):
         if stdout:
@@ -63,7 +72,9 @@ class PythonCapturer(object):
         else:
             self._original = sys.stderr
             self._set_stream = self._set_stderr
-        self._stream = StringIO()
+        free = self._free_buffers
+        self._buffer = free.pop() if free else StringIO()
+        self._stream = CaptureStream(self._buffer)
         self._set_stream(self._stream)
 
     def _set_stdout(self, stream):
@@ -73,44 +84,75 @@ class PythonCapturer(object):
         sys.stderr = stream
 
     def release(self):
-        # Original stream must be restored before closing the current
+        # Original stream must be restored before reading the current
         self._set_stream(self._original)
+        self._stream.release()
+        buffer = self._buffer
+        if not buffer.tell():
+            self._free_buffers.append(buffer)
+            return u''
         try:
-            return self._get_value(self._stream)
+            return self._get_value(buffer)
         finally:
-            self._stream.close()
-            self._avoid_at_exit_errors(self._stream)
+            if self._reset(buffer):
+                self._free_buffers.append(buffer)
 
-    def _get_value(self, stream):
+    def _get_value(self, buffer):
         try:
-            return console_decode(stream.getvalue())
+            return console_decode(buffer.getvalue())
         except UnicodeError:
             # Error occurs if non-ASCII chars logged both as str and unicode.
-            stream.buf = console_decode(stream.buf)
-            stream.buflist = [console_decode(item) for item in stream.buflist]
-            return stream.getvalue()
+            buffer.buf = console_decode(buffer.buf)
+            buffer.buflist = [console_decode(item) for item in buffer.buflist]
+            return buffer.getvalue()
 
-    def _avoid_at_exit_errors(self, stream):
-        # Avoid ValueError at program exit when logging module tries to call
-        # methods of streams it has intercepted that are already closed.
-        # Which methods are called, and does logging silence possible errors,
-        # depends on Python/Jython version. For related discussion see
-        # http://bugs.python.org/issue6333
-        stream.write = lambda s: None
-        stream.flush = lambda: None
+    def _reset(self, buffer):
+        try:
+            buffer.seek(0)
+            buffer.truncate()
+        except (ValueError, UnicodeError):
+            return False
+        return True
 
 
-if not JYTHON:
+def _ignore(data):
+    pass
 
-    class JavaCapturer(object):
 
-        def __init__(self, stdout=True):
-            pass
+class CaptureStream(object):
+    """Stream that replaces ``sys.stdout`` or ``sys.stderr`` during capturing.
+
+    Writes go directly to the underlying buffer until the stream is released.
+    After that writes are ignored to avoid them ending up in the output of
+    later keywords if someone has stored a reference to the stream. This
+    happens, for example, when a `logging.StreamHandler` is created while
+    the output is captured.
+    """
+    closed = False
+
+    def __init__(self, buffer):
+        self._buffer = buffer
+        self.write = buffer.write
+
+    def writelines(self, lines):
+        for line in lines:
+            self.write(line)
+
+    def flush(self):
+        pass
+
+    def release(self):
+        self.write = _ignore
+
+    def close(self):
+        self.release()
+        self.closed = True
+
+    def __getattr__(self, name):
+        return getattr(self._buffer, name)
 
-        def release(self):
-            return u''
 
-else:
+if JYTHON:
 
     from java.io import ByteArrayOutputStream, PrintStream
     from java.lang import System
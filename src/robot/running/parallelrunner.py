@@ -0,0 +1,205 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import sys
+import threading
+
+from robot.errors import (DataError, ExecutionFailures, HandlerExecutionFailed,
+                          TimeoutError)
+from robot.output import LOGGER, LoggingThread
+from robot.utils import (ErrorDetails, RERAISED_EXCEPTIONS, StringIO,
+                         console_decode, console_encode, get_timestamp)
+
+from .librarykeywordrunner import LibraryKeywordRunner, RunKeywordRunner
+from .model import Keyword
+from .usererrorhandler import UserErrorHandler
+
+
+class ParallelRunner(object):
+    """Runs library keywords concurrently in separate threads.
+
+    Keywords are run with their arguments already resolved, and their log
+    messages and output are collected separately for each thread. Results
+    are reported in the main thread in the original order after all the
+    keywords have finished, because outputs and listeners are not thread
+    safe.
+
+    If a test or keyword timeout occurs, waiting is stopped and only the
+    keywords that have finished are reported. Threads cannot be stopped,
+    so the keywords that are still running continue on the background.
+    """
+
+    def __init__(self, context):
+        self._context = context
+
+    def run(self, calls):
+        keywords = [self._get_keyword(name, args) for name, args in calls]
+        timeout = self._get_timeout()
+        with _OutputRouter(keywords):
+            for kw in keywords:
+                kw.start()
+            finished = [kw for kw in keywords if kw.wait(timeout)]
+        errors = []
+        for kw in finished:
+            failure = kw.report(self._context)
+            if failure:
+                errors.extend(failure.get_errors())
+        if len(finished) < len(keywords):
+            raise TimeoutError(timeout.get_message(),
+                               test_timeout=timeout.type == 'Test')
+        if errors:
+            raise ExecutionFailures(errors)
+
+    def _get_timeout(self):
+        timeouts = [t for t in self._context.timeouts if t.active]
+        if not timeouts:
+            return None
+        timeout = min(timeouts)
+        if timeout.error:
+            raise DataError(timeout.error)
+        return timeout
+
+    def _get_keyword(self, name, args):
+        kw = Keyword(name, args=args)
+        runner = self._context.get_runner(name)
+        if isinstance(runner, UserErrorHandler):
+            runner.run(kw, self._context)
+        if not isinstance(runner, LibraryKeywordRunner) \
+                or isinstance(runner, RunKeywordRunner) \
+                or runner.libname == 'BuiltIn':
+            raise DataError("Keyword '%s' cannot be run in parallel. Only "
+                            "keywords in test libraries other than BuiltIn "
+                            "are supported." % name)
+        return ParallelKeyword(*runner.prepare(kw, self._context))
+
+
+class ParallelKeyword(object):
+
+    def __init__(self, result, messages, runner):
+        self.result = result
+        self.messages = messages
+        self.stdout = StringIO()
+        self.stderr = StringIO()
+        self.failure = None
+        self._reraised = None
+        self._runner = runner
+        self._thread = _KeywordThread(self)
+
+    def start(self):
+        self._thread.start()
+
+    def run(self):
+        self.result.starttime = get_timestamp()
+        try:
+            self._runner()
+        except RERAISED_EXCEPTIONS as err:
+            self._reraised = err
+        except:
+            self.failure = HandlerExecutionFailed(ErrorDetails())
+        self.result.endtime = get_timestamp()
+
+    def wait(self, timeout=None):
+        """Waits until the keyword has finished or ``timeout`` has occurred.
+
+        Returns ``True`` if the keyword finished and ``False`` otherwise.
+        """
+        # Joining in small pieces allows signals to interrupt.
+        while self._thread.is_alive():
+            if timeout and timeout.timed_out():
+                return False
+            self._thread.join(self._get_join_time(timeout))
+        if self._reraised:
+            raise self._reraised
+        return True
+
+    def _get_join_time(self, timeout):
+        if not timeout:
+            return 0.1
+        return min(max(timeout.time_left(), 0.001), 0.1)
+
+    def report(self, context):
+        result = self.result
+        starttime, endtime = result.starttime, result.endtime
+        context.start_keyword(result)
+        for msg in self.messages:
+            context.output.message(msg)
+        stdout = console_decode(self.stdout.getvalue())
+        stderr = console_decode(self.stderr.getvalue())
+        if stdout:
+            LOGGER.log_output(stdout)
+        if stderr:
+            LOGGER.log_output(stderr)
+            sys.__stderr__.write(console_encode(stderr, stream=sys.__stderr__))
+        if self.failure:
+            context.fail(self.failure.full_message)
+            if self.failure.traceback:
+                context.debug(self.failure.traceback)
+        result.status = 'FAIL' if self.failure else 'PASS'
+        result.starttime, result.endtime = starttime, endtime
+        context.end_keyword(result)
+        return self.failure
+
+
+class _KeywordThread(LoggingThread):
+
+    def __init__(self, keyword):
+        LoggingThread.__init__(self, target=keyword.run,
+                               name='Parallel %s' % keyword.result.name)
+        self.daemon = True
+        self.keyword = keyword
+
+    def log_message(self, msg):
+        self.keyword.messages.append(msg)
+
+
+class _OutputRouter(object):
+    """Routes standard output and error of keyword threads to their buffers.
+
+    Output of other threads goes to the original streams.
+    """
+
+    def __init__(self, keywords):
+        self._stdouts = dict((kw._thread, kw.stdout) for kw in keywords)
+        self._stderrs = dict((kw._thread, kw.stderr) for kw in keywords)
+        self._stdout = self._stderr = None
+
+    def __enter__(self):
+        self._stdout, self._stderr = sys.stdout, sys.stderr
+        sys.stdout = _RoutingStream(self._stdouts, self._stdout)
+        sys.stderr = _RoutingStream(self._stderrs, self._stderr)
+        return self
+
+    def __exit__(self, *exc_info):
+        sys.stdout, sys.stderr = self._stdout, self._stderr
+
+
+class _RoutingStream(object):
+
+    def __init__(self, outputs, original):
+        self._outputs = outputs
+        self._original = original
+
+    def write(self, data):
+        self._stream.write(data)
+
+    def flush(self):
+        self._stream.flush()
+
+    @property
+    def _stream(self):
+        return self._outputs.get(threading.current_thread(), self._original)
+
+    def __getattr__(self, name):
+        return getattr(self._original, name)
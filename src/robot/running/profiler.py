@@ -0,0 +1,189 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Keyword level profiler enabled with the ``--profile`` option.
+
+Execution time is collected per keyword, per library or resource file and
+per suite. Time spent resolving variables in arguments and looking up
+keywords is collected separately and is not included in the self time of
+the keyword running them.
+"""
+
+import json
+import os
+from timeit import default_timer
+
+from robot.errors import DataError
+from robot.utils import file_writer, get_error_message
+
+
+class Profiler(object):
+    """Collects execution times of keywords and other measured operations.
+
+    :class:`~robot.running.statusreporter.StatusReporter` calls
+    :meth:`start_keyword` and :meth:`end_keyword` and other code measures
+    time spent in operations like variable resolution using :meth:`measure`.
+    Keywords started but not ended when results are got are ignored.
+    """
+    VARIABLE_RESOLUTION = 'Variable resolution'
+    KEYWORD_LOOKUP = 'Keyword lookup'
+    sort_keys = ('self', 'total', 'max', 'count', 'name')
+
+    def __init__(self, timer=default_timer):
+        self.timer = timer
+        self.keywords = ProfileStats()
+        self.libraries = ProfileStats()
+        self.suites = ProfileStats()
+        self.operations = ProfileStats()
+        self._stack = []
+
+    def start_keyword(self, keyword, suite, start=None):
+        """Starts measuring `keyword` executed in `suite`.
+
+        `keyword` is a :class:`~robot.result.model.Keyword` and `suite` is
+        the long name of the suite. Keyword names are formed from library
+        and keyword names and libraries of keywords in test case files are
+        identified by the suite name. FOR loops are not measured separately
+        and their time is considered to belong to the enclosing keyword.
+        """
+        if keyword.type in (keyword.FOR_LOOP_TYPE, keyword.FOR_ITEM_TYPE):
+            keys = ()
+        else:
+            library = keyword.libname or suite
+            name = '%s.%s' % (library, keyword.kwname)
+            keys = ((self.keywords, name), (self.libraries, library),
+                    (self.suites, suite))
+        self._start(keys, start)
+
+    def end_keyword(self, end=None):
+        self._end(end)
+
+    def measure(self, operation, function, *args):
+        """Calls `function` with `args` measuring the time it takes."""
+        self._start(((self.operations, operation),))
+        try:
+            return function(*args)
+        finally:
+            self._end()
+
+    def _start(self, keys, start=None):
+        for stats, key in keys:
+            stats.start(key)
+        if start is None:
+            start = self.timer()
+        self._stack.append([keys, start, 0])
+
+    def _end(self, end=None):
+        keys, start, children = self._stack.pop()
+        if end is None:
+            end = self.timer()
+        elapsed = end - start
+        for stats, key in keys:
+            stats.end(key, elapsed, elapsed - children)
+        # FOR loops have no keys and their own time belongs to the parent.
+        if self._stack:
+            self._stack[-1][2] += elapsed if keys else children
+
+    def get_report(self, sort='self'):
+        """Returns collected times as a dictionary suitable for JSON.
+
+        Times are in seconds and items are sorted based on `sort` that can
+        be ``self``, ``total``, ``max``, ``count`` or ``name``.
+        """
+        return dict((name, stats.get_items(sort)) for name, stats
+                    in [('keywords', self.keywords),
+                        ('libraries', self.libraries),
+                        ('suites', self.suites),
+                        ('operations', self.operations)])
+
+    def write(self, path, sort='self'):
+        """Writes the text report to `path` and JSON to a ``.json`` file.
+
+        Returns paths to the written text and JSON files.
+        """
+        base, ext = os.path.splitext(path)
+        json_path = base + '.json'
+        if ext.lower() == '.json':
+            path = base + '.txt'
+        report = self.get_report(sort)
+        try:
+            with file_writer(path) as output:
+                ProfileTextWriter(output).write(report)
+            with open(json_path, 'w') as output:
+                json.dump(report, output, indent=1, sort_keys=True)
+        except EnvironmentError:
+            raise DataError("Writing profile file failed: %s"
+                            % get_error_message())
+        return path, json_path
+
+
+class ProfileStats(object):
+    """Counts, total, self and max times of named items.
+
+    Recursive calls and nested items with the same name are not counted
+    into total and max times twice.
+    """
+
+    def __init__(self):
+        self._items = {}
+        self._active = {}
+
+    def start(self, name):
+        self._active[name] = self._active.get(name, 0) + 1
+
+    def end(self, name, elapsed, self_time):
+        active = self._active[name] = self._active[name] - 1
+        if name not in self._items:
+            self._items[name] = [0, 0.0, 0.0, 0.0]
+        item = self._items[name]
+        item[0] += 1
+        item[2] += self_time
+        if not active:
+            item[1] += elapsed
+            item[3] = max(item[3], elapsed)
+
+    def get_items(self, sort='self'):
+        items = [{'name': name, 'count': count, 'total': round(total, 6),
+                  'self': round(self_time, 6), 'max': round(max_time, 6)}
+                 for name, (count, total, self_time, max_time)
+                 in self._items.items()]
+        items.sort(key=lambda item: item['name'])
+        if sort != 'name':
+            items.sort(key=lambda item: item[sort], reverse=True)
+        return items
+
+
+class ProfileTextWriter(object):
+    _headers = [('keywords', 'Keywords'),
+                ('libraries', 'Libraries and resource files'),
+                ('suites', 'Suites'),
+                ('operations', 'Operations')]
+
+    def __init__(self, output):
+        self._output = output
+
+    def write(self, report):
+        for index, (name, header) in enumerate(self._headers):
+            if index:
+                self._output.write('\n')
+            self._write_section(header, report[name])
+
+    def _write_section(self, header, items):
+        self._output.write('%s\n%s\n' % (header, '=' * len(header)))
+        self._output.write('%8s %10s %10s %10s  %s\n'
+                           % ('Count', 'Total', 'Self', 'Max', 'Name'))
+        for item in items:
+            self._output.write('%(count)8d %(total)10.3f %(self)10.3f '
+                               '%(max)10.3f  %(name)s\n' % item)
@@ -30,10 +30,11 @@ from .timeouts import TestTimeout
 
 class Runner(SuiteVisitor):
 
-    def __init__(self, output, settings):
+    def __init__(self, output, settings, profiler=None):
         self.result = None
         self._output = output
         self._settings = settings
+        self._profiler = profiler
         self._variables = VariableScopes(settings)
         self._suite = None
         self._suite_status = None
@@ -67,7 +68,7 @@ class Runner(SuiteVisitor):
         ns.start_suite()
         ns.variables.set_from_variable_table(suite.resource.variables)
         EXECUTION_CONTEXTS.start_suite(result, ns, self._output,
-                                       self._settings.dry_run)
+                                       self._settings.dry_run, self._profiler)
         self._context.set_suite_variables(result)
         if not self._suite_status.failures:
             ns.handle_imports()
@@ -27,11 +27,17 @@ class StatusReporter(object):
         self._test_passed = None
 
     def __enter__(self):
+        profiler = self._context.profiler
+        if profiler:
+            start = profiler.timer()
         if self._context.test:
             self._test_passed = self._context.test.passed
         self._result.starttime = get_timestamp()
         self._context.start_keyword(self._result)
         self._warn_if_deprecated(self._result.doc, self._result.name)
+        if profiler:
+            profiler.start_keyword(self._result,
+                                   self._context.suite.longname, start)
 
     def _warn_if_deprecated(self, doc, name):
         if doc.startswith('*DEPRECATED') and '*' in doc[1:]:
@@ -52,6 +58,8 @@ class StatusReporter(object):
             context.test.passed = self._test_passed and result.passed
         result.endtime = get_timestamp()
         context.end_keyword(result)
+        if context.profiler:
+            context.profiler.end_keyword()
         if failure is not exc_val:
             raise failure
 
@@ -21,7 +21,7 @@ from robot.libraries import STDLIBS
 from robot.output import LOGGER
 from robot.utils import (getdoc, get_error_details, Importer, is_java_init,
                          is_java_method, JYTHON, normalize, seq2str2, unic,
-                         is_list_like, PY2, PYPY, type_name)
+                         is_list_like, is_truthy, PY2, PYPY, type_name)
 
 from .arguments import EmbeddedArguments
 from .context import EXECUTION_CONTEXTS
@@ -80,6 +80,7 @@ class _BaseTestLibrary(object):
         self.has_listener = None  # Set when first instance is created
         self._doc = None
         self.doc_format = self._get_doc_format(libcode)
+        self.capture_output = self._get_capture_output(libcode)
         self.scope = LibraryScope(libcode, self)
         self.init = self._create_init_handler(libcode)
         self.positional_args, self.named_args \
@@ -129,6 +130,9 @@ class _BaseTestLibrary(object):
     def _get_doc_format(self, libcode):
         return self._get_attr(libcode, 'ROBOT_LIBRARY_DOC_FORMAT', upper=True)
 
+    def _get_capture_output(self, libcode):
+        return is_truthy(getattr(libcode, 'ROBOT_LIBRARY_CAPTURE_OUTPUT', True))
+
     def _create_init_handler(self, libcode):
         return InitHandler(self, self._resolve_init_method(libcode))
 
@@ -17,7 +17,8 @@ import os
 
 from robot.errors import DataError
 from robot.output import LOGGER
-from robot.utils import is_string, unic
+from robot.model import Tags
+from robot.utils import is_string, split_tags_from_doc, unic
 
 from .builder import ResourceFileBuilder
 from .arguments import EmbeddedArguments, UserKeywordArgumentParser
@@ -86,6 +87,9 @@ class UserKeywordHandler(object):
         self.keywords = keyword.keywords.normal
         self.return_value = tuple(keyword.return_)
         self.teardown = keyword.keywords.teardown
+        self._shortdoc_and_tags = None
+        self._doc_and_tags_are_static = not ('{' in self.doc or
+                                             any('{' in t for t in self.tags))
 
     @property
     def longname(self):
@@ -95,6 +99,21 @@ class UserKeywordHandler(object):
     def shortdoc(self):
         return self.doc.splitlines()[0] if self.doc else ''
 
+    def get_shortdoc_and_tags(self, variables):
+        """Returns short documentation and tags with variables replaced.
+
+        Results are cached if documentation and tags contain no variables.
+        """
+        if self._shortdoc_and_tags:
+            return self._shortdoc_and_tags
+        doc = variables.replace_string(self.doc, ignore_errors=True)
+        doc, tags = split_tags_from_doc(doc)
+        tags = variables.replace_list(self.tags, ignore_errors=True) + tags
+        shortdoc_and_tags = (doc.splitlines()[0] if doc else '', Tags(tags))
+        if self._doc_and_tags_are_static:
+            self._shortdoc_and_tags = shortdoc_and_tags
+        return shortdoc_and_tags
+
     def create_runner(self, name):
         return UserKeywordRunner(self)
 
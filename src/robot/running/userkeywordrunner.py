@@ -18,7 +18,7 @@ from robot.errors import (ExecutionFailed, ExecutionPassed, ExitForLoop,
                           ReturnFromKeyword, UserKeywordExecutionFailed,
                           VariableError)
 from robot.result import Keyword as KeywordResult
-from robot.utils import DotDict, prepr, split_tags_from_doc
+from robot.utils import DotDict, prepr
 from robot.variables import is_list_var, VariableAssignment
 
 from .arguments import DefaultValue
@@ -57,12 +57,10 @@ class UserKeywordRunner(object):
 
     def _get_result(self, kw, assignment, variables):
         handler = self._handler
-        doc = variables.replace_string(handler.doc, ignore_errors=True)
-        doc, tags = split_tags_from_doc(doc)
-        tags = variables.replace_list(handler.tags, ignore_errors=True) + tags
+        doc, tags = handler.get_shortdoc_and_tags(variables)
         return KeywordResult(kwname=self.name,
                              libname=handler.libname,
-                             doc=doc.splitlines()[0] if doc else '',
+                             doc=doc,
                              args=kw.args,
                              assign=tuple(assignment),
                              tags=tags,
@@ -70,7 +68,7 @@ class UserKeywordRunner(object):
 
     def _run(self, context, args, result):
         variables = context.variables
-        args = self._resolve_arguments(args, variables)
+        args = context.resolve_arguments(self._resolve_arguments, args)
         with context.user_keyword:
             self._set_arguments(args, context)
             timeout = self._get_timeout(variables)
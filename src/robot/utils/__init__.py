@@ -35,6 +35,8 @@ or::
 
 from .argumentparser import ArgumentParser, cmdline2list
 from .application import Application
+from .binaryoutput import (BinaryOutputParser, BinaryOutputWriter,
+                           is_binary_output)
 from .compat import isatty, py2to3, StringIO, with_metaclass
 from .compress import compress_text
 from .connectioncache import ConnectionCache
@@ -55,7 +57,7 @@ from .misc import (getdoc, plural_or_not, printable_name, roundup, seq2str,
 from .normalizing import lower, normalize, NormalizedDict
 from .platform import (IRONPYTHON, JYTHON, PY2, PY3, PYPY, PYTHON, UNIXY,
                        WINDOWS, RERAISED_EXCEPTIONS)
-from .recommendations import RecommendationFinder
+from .recommendations import RecommendationFinder, RecommendationIndex
 from .robotenv import get_env_var, set_env_var, del_env_var, get_env_vars
 from .robotinspect import is_java_init, is_java_method
 from .robotio import binary_file_writer, file_writer
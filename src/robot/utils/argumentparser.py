@@ -27,6 +27,7 @@ from robot.version import get_full_version
 
 from .misc import plural_or_not
 from .encoding import console_decode, system_decode
+from .importer import invalidate_import_caches
 from .platform import PY2
 from .utf8reader import Utf8Reader
 from .robottypes import is_falsy, is_integer, is_list_like, is_string, is_unicode
@@ -172,7 +173,7 @@ class ArgumentParser(object):
         if self._auto_version and opts.get('version'):
             self._raise_version()
         if self._auto_pythonpath and opts.get('pythonpath'):
-            sys.path = self._get_pythonpath(opts['pythonpath']) + sys.path
+            self._add_pythonpath(opts['pythonpath'])
         for auto, opt in [(self._auto_help, 'help'),
                           (self._auto_version, 'version'),
                           (self._auto_escape, 'escape'),
@@ -318,6 +319,12 @@ class ArgumentParser(object):
         elif opt in [o.rstrip('=') for o in self._long_opts]:
             self._raise_option_multiple_times_in_usage('--' + opt)
 
+    def _add_pythonpath(self, paths):
+        paths = self._get_pythonpath(paths)
+        if any(path not in sys.path for path in paths):
+            invalidate_import_caches()
+        sys.path = paths + sys.path
+
     def _get_pythonpath(self, paths):
         if is_string(paths):
             paths = [paths]
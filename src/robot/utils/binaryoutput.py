@@ -0,0 +1,306 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Compact binary alternative for XML output files.
+
+The format consists of a header followed by records that each start with
+a record type byte:
+
+- ``STRINGS``: Index of the first string and count followed by length
+  prefixed UTF-8 strings that are added to the string table. Element names,
+  attribute names and selected attribute values and texts are stored only
+  once and later referred by their index in this table. Strings added
+  inside a skippable element are repeated after it so that they are known
+  also if the element is skipped. Already known strings are ignored.
+- ``START``: Start of an element with child elements. Contains the element
+  name and attributes.
+- ``SKIPPABLE``: Same as ``START`` but also contains the length of the
+  element body, which allows skipping it without decoding anything.
+- ``ELEMENT``: An element without children. Contains the element name,
+  attributes and text.
+- ``END``: End of the latest ``START`` or ``SKIPPABLE`` element.
+
+Attribute values and texts are encoded as unsigned 32-bit integers. If the
+lowest bit is set, the remaining bits contain the length of the UTF-8 encoded
+value that follows. Otherwise they contain an index to the string table.
+"""
+
+import io
+import os.path
+import struct
+
+try:
+    import mmap
+except ImportError:    # Not available on Jython and IronPython
+    mmap = None
+
+from .robottypes import is_string
+
+
+MAGIC = b'RBO\x01'
+STRINGS, START, SKIPPABLE, ELEMENT, END = range(1, 6)
+
+_byte = struct.Struct('<B')
+_uint = struct.Struct('<I')
+_attr = struct.Struct('<II')       # name index, value
+_length = struct.Struct('<Q')
+_header = struct.Struct('<BIB')    # record type, name index, attribute count
+_strings_header = struct.Struct('<BII')  # record type, first index, count
+_end = _byte.pack(END)
+
+
+def is_binary_output(source):
+    """Returns ``True`` if ``source`` is a path to a binary output file."""
+    if not (is_string(source) and os.path.isfile(source)):
+        return False
+    with io.open(source, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+class BinaryOutputWriter(object):
+    """Writes output files using the compact binary format.
+
+    Has the same ``start``, ``element``, ``end`` and ``close`` methods as
+    :class:`~robot.utils.markupwriters.XmlWriter` configured with
+    ``write_empty=False``. Lengths of elements listed in ``skippable``
+    are written before their bodies when the elements end. Data is kept
+    in a buffer of limited size where lengths can be patched cheaply,
+    and lengths of larger elements are patched in the file.
+    """
+    _interned_attrs = frozenset(('name', 'library', 'type', 'level',
+                                 'status', 'critical', 'html'))
+    _interned_texts = frozenset(('tag', 'var'))
+    _buffer_size = 1024 * 1024
+
+    def __init__(self, path, skippable=('kw',)):
+        self._output = io.open(path, 'wb')
+        self._output.write(MAGIC)
+        self._written = len(MAGIC)
+        self._buffer = bytearray()
+        self._skippable = frozenset(skippable)
+        self._strings = {}
+        self._string_list = []
+        self._new_strings = 0
+        self._open_skippables = []
+
+    def start(self, name, attrs=None, newline=True):
+        if name in self._skippable:
+            self._write(self._encode_start(SKIPPABLE, name, attrs),
+                        _length.pack(0))
+            self._open_skippables.append((name, self._position(),
+                                          len(self._string_list)))
+        else:
+            self._write(self._encode_start(START, name, attrs))
+
+    def end(self, name, newline=True):
+        self._write(_end)
+        if self._open_skippables and self._open_skippables[-1][0] == name:
+            name, body_start, strings = self._open_skippables.pop()
+            self._patch_length(body_start - _length.size,
+                               self._position() - body_start)
+            if strings < len(self._string_list):
+                self._write_strings(strings)
+
+    def _position(self):
+        return self._written + len(self._buffer)
+
+    def _patch_length(self, position, length):
+        if position >= self._written:
+            _length.pack_into(self._buffer, position - self._written, length)
+        else:
+            self._flush()
+            self._output.seek(position)
+            self._output.write(_length.pack(length))
+            self._output.seek(0, os.SEEK_END)
+
+    def element(self, name, content=None, attrs=None, escape=True,
+                newline=True, replace_newlines=False):
+        attrs = self._non_empty(attrs)
+        if content or attrs:
+            intern = name in self._interned_texts
+            self._write(self._encode_start(ELEMENT, name, attrs),
+                        self._encode_value(content or '', intern))
+
+    def close(self):
+        while self._open_skippables:
+            self.end(self._open_skippables[-1][0])
+        self._flush()
+        self._output.close()
+
+    def _non_empty(self, attrs):
+        if not attrs:
+            return []
+        return [(name, attrs[name]) for name in attrs if attrs[name]]
+
+    def _encode_start(self, type, name, attrs):
+        if not isinstance(attrs, list):
+            attrs = self._non_empty(attrs)
+        parts = [_header.pack(type, self._string_index(name), len(attrs))]
+        for name, value in attrs:
+            parts.append(_uint.pack(self._string_index(name)))
+            parts.append(self._encode_value(value, name in self._interned_attrs))
+        return b''.join(parts)
+
+    def _encode_value(self, value, intern=False):
+        if intern:
+            return _uint.pack(self._string_index(value) << 1)
+        value = value.encode('UTF-8')
+        return _uint.pack(len(value) << 1 | 1) + value
+
+    def _string_index(self, string):
+        try:
+            return self._strings[string]
+        except KeyError:
+            index = self._strings[string] = len(self._string_list)
+            self._string_list.append(string)
+            self._new_strings += 1
+            return index
+
+    def _write(self, *parts):
+        if self._new_strings:
+            self._write_strings(len(self._string_list) - self._new_strings)
+        buffer = self._buffer
+        for part in parts:
+            buffer += part
+        if len(buffer) > self._buffer_size:
+            self._flush()
+
+    def _write_strings(self, first):
+        strings = self._string_list[first:]
+        self._buffer += _strings_header.pack(STRINGS, first, len(strings))
+        for string in strings:
+            string = string.encode('UTF-8')
+            self._buffer += _uint.pack(len(string))
+            self._buffer += string
+        self._new_strings = 0
+
+    def _flush(self):
+        self._output.write(self._buffer)
+        self._written += len(self._buffer)
+        self._buffer = bytearray()
+
+
+class BinaryElement(dict):
+    """Minimal element with the parts of the ElementTree API parsers need.
+
+    Attributes are stored in the element itself, which makes ``get`` fast.
+    """
+    __slots__ = ['tag', 'text']
+
+    @property
+    def attrib(self):
+        return self
+
+    def clear(self):
+        dict.clear(self)
+        self.text = None
+
+
+class BinaryOutputParser(object):
+    """Parses binary output files created by :class:`BinaryOutputWriter`.
+
+    Iterating over the parser yields ``(event, element)`` pairs similarly
+    as ``ET.iterparse(source, events=('start', 'end'))``. If ``skip`` is
+    given, it is called with each skippable element before its body is
+    parsed and, if it returns ``True``, the whole element is skipped
+    without decoding it or generating any events.
+    """
+
+    def __init__(self, source, skip=None):
+        self._source = source
+        self._skip = skip
+
+    def __iter__(self):
+        with io.open(self._source, 'rb') as source:
+            if source.read(len(MAGIC)) != MAGIC:
+                raise ValueError('Not a binary output file.')
+            data = self._read(source)
+        return self._parse(data, len(MAGIC))
+
+    def _read(self, source):
+        # Memory mapping keeps memory usage constant regardless the file size.
+        # The map is closed automatically when it is garbage collected.
+        if mmap:
+            return mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+        source.seek(0)
+        return source.read()
+
+    def _parse(self, data, pos):
+        # Performance optimized. Do not change without profiling!
+        unpack_byte = _byte.unpack_from
+        unpack_uint = _uint.unpack_from
+        unpack_length = _length.unpack_from
+        unpack_header = _header.unpack_from
+        unpack_attr = _attr.unpack_from
+        skip = self._skip
+        strings = []
+        stack = []
+        end = len(data)
+        while pos < end:
+            type, = unpack_byte(data, pos)
+            if type == END:
+                pos += 1
+                yield 'end', stack.pop()
+                continue
+            if type == STRINGS:
+                type, index, count = _strings_header.unpack_from(data, pos)
+                pos += 9
+                for index in range(index, index + count):
+                    length, = unpack_uint(data, pos)
+                    pos += 4
+                    if index == len(strings):
+                        strings.append(data[pos:pos+length].decode('UTF-8'))
+                    pos += length
+                continue
+            type, name, count = unpack_header(data, pos)
+            pos += 6
+            elem = BinaryElement()
+            elem.tag = strings[name]
+            elem.text = None
+            for _ in range(count):
+                name, value = unpack_attr(data, pos)
+                pos += 8
+                if value & 1:
+                    length = value >> 1
+                    elem[strings[name]] = data[pos:pos+length].decode('UTF-8')
+                    pos += length
+                else:
+                    elem[strings[name]] = strings[value >> 1]
+            if type == ELEMENT:
+                value, = unpack_uint(data, pos)
+                pos += 4
+                if value & 1:
+                    length = value >> 1
+                    elem.text = data[pos:pos+length].decode('UTF-8')
+                    pos += length
+                else:
+                    elem.text = strings[value >> 1]
+                yield 'start', elem
+                yield 'end', elem
+            elif type == SKIPPABLE:
+                length, = unpack_length(data, pos)
+                pos += 8
+                if skip and skip(elem):
+                    pos += length
+                else:
+                    stack.append(elem)
+                    yield 'start', elem
+            elif type == START:
+                stack.append(elem)
+                yield 'start', elem
+            else:
+                raise ValueError("Invalid record type %d." % type)
+        if stack:
+            raise ValueError('Binary output file is truncated.')
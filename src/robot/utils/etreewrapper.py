@@ -13,45 +13,54 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import gzip
+import os.path
 from io import BytesIO
 
 from .compat import py2to3
 from .platform import IRONPYTHON
+from .robotio import is_gzip_file
 from .robottypes import is_string
 
 
-_ERROR = 'No valid ElementTree XML parser module found'
-
-
-if not IRONPYTHON:
-    try:
-        from xml.etree import cElementTree as ET
-    except ImportError:
+def _import_etree():
+    if IRONPYTHON:
+        # Cannot use standard ET available on IronPython because it is broken
+        # both in 2.7.0 and 2.7.1:
+        # http://ironpython.codeplex.com/workitem/31923
+        # http://ironpython.codeplex.com/workitem/21407
+        candidates = ['elementtree.ElementTree']
+    else:
+        candidates = ['xml.etree.cElementTree', 'cElementTree',
+                      'xml.etree.ElementTree', 'elementtree.ElementTree']
+    for name in candidates:
         try:
-            import cElementTree as ET
+            etree = __import__(name, fromlist=['ElementTree'])
         except ImportError:
-            try:
-                from xml.etree import ElementTree as ET
-            except ImportError:
-                try:
-                    from elementtree import ElementTree as ET
-                except ImportError:
-                    raise ImportError(_ERROR)
-else:
-    # Cannot use standard ET available on IronPython because it is broken
-    # both in 2.7.0 and 2.7.1:
-    # http://ironpython.codeplex.com/workitem/31923
-    # http://ironpython.codeplex.com/workitem/21407
-    try:
-        from elementtree import ElementTree as ET
-    except ImportError:
-        raise ImportError(_ERROR)
-    from StringIO import StringIO
-
-
-# cElementTree.VERSION seems to always be 1.0.6. We want real API version.
-if ET.VERSION < '1.3' and hasattr(ET, 'tostringlist'):
-    ET.VERSION = '1.3'
+            continue
+        # cElementTree.VERSION seems to always be 1.0.6. We want real API
+        # version.
+        if etree.VERSION < '1.3' and hasattr(etree, 'tostringlist'):
+            etree.VERSION = '1.3'
+        return etree
+    raise ImportError('No valid ElementTree XML parser module found')
+
+
+class _LazyElementTree(object):
+    """Proxy to the ElementTree module importing it on first use.
+
+    Importing ElementTree is relatively slow and most of the times it is
+    not needed, for example, when just running tests.
+    """
+    _module = None
+
+    def __getattr__(self, name):
+        if not _LazyElementTree._module:
+            _LazyElementTree._module = _import_etree()
+        return getattr(_LazyElementTree._module, name)
+
+
+ET = _LazyElementTree()
 
 
 @py2to3
@@ -81,8 +90,16 @@ class ETSource(object):
                 and not self._source.lstrip().startswith('<')
 
     def _open_source_if_necessary(self):
-        if self._source_is_file_name() or not is_string(self._source):
+        if self._source_is_file_name():
+            return self._open_file_if_compressed(self._source)
+        if not is_string(self._source):
             return None
         if IRONPYTHON:
+            from StringIO import StringIO
             return StringIO(self._source)
         return BytesIO(self._source.encode('UTF-8'))
+
+    def _open_file_if_compressed(self, path):
+        if os.path.isfile(path) and is_gzip_file(path):
+            return gzip.open(path, 'rb')
+        return None
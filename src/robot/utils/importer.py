@@ -26,11 +26,37 @@ from .robotpath import abspath, normpath
 from .robottypes import type_name, is_unicode
 
 if PY3:
-    from importlib import invalidate_caches as invalidate_import_caches
+    from importlib import invalidate_caches as _invalidate_caches
 else:
-    invalidate_import_caches = lambda: None
+    _invalidate_caches = lambda: None
 if JYTHON:
     from java.lang.System import getProperty
+try:
+    ModuleNotFoundError
+except NameError:    # Python < 3.6
+    ModuleNotFoundError = ImportError
+
+
+_invalidations = 0
+
+
+def invalidate_import_caches():
+    """Invalidates directory listings cached by the import system.
+
+    Invalidating is needed if modules are created after the directories
+    containing them have been cached, but it is relatively expensive as
+    all directories in the module search path need to be listed again.
+    It is thus done only if importing fails or new directories are added
+    to the module search path using ``--pythonpath``.
+    """
+    global _invalidations
+    _invalidations += 1
+    _invalidate_caches()
+
+
+def get_import_cache_invalidations():
+    """Returns how many times :func:`invalidate_import_caches` was called."""
+    return _invalidations
 
 
 class Importer(object):
@@ -147,11 +173,13 @@ class _Importer(object):
         if name in sys.builtin_module_names:
             raise DataError('Cannot import custom module with same name as '
                             'Python built-in module.')
-        invalidate_import_caches()
         try:
             try:
                 return __import__(name, fromlist=fromlist)
-            except ImportError:
+            except ImportError as error:
+                if retry and self._caches_may_be_stale(error, name, fromlist):
+                    return self._import_after_invalidating_caches(name,
+                                                                  fromlist)
                 # Hack to support standalone Jython. For more information, see:
                 # https://github.com/robotframework/robotframework/issues/515
                 # http://bugs.jython.org/issue1778514
@@ -166,6 +194,22 @@ class _Importer(object):
         except:
             raise DataError(*get_error_details())
 
+    def _caches_may_be_stale(self, error, name, fromlist):
+        # Modules missing from the imported module itself are not retried.
+        if not (PY3 and isinstance(error, ModuleNotFoundError)):
+            return False
+        parts = name.split('.')
+        names = ['.'.join(parts[:index+1]) for index in range(len(parts))]
+        names.extend('%s.%s' % (name, item) for item in fromlist or ())
+        return error.name in names
+
+    def _import_after_invalidating_caches(self, name, fromlist):
+        invalidate_import_caches()
+        self._logger.info("Importing '%s' failed. Invalidated import caches "
+                           "and retrying. Import caches have been invalidated "
+                           "%d times." % (name, get_import_cache_invalidations()))
+        return __import__(name, fromlist=fromlist)
+
     def _verify_type(self, imported):
         if inspect.isclass(imported) or inspect.ismodule(imported):
             return imported
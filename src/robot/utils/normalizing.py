@@ -52,6 +52,49 @@ else:
         return string.lower()
 
 
+class _CachingNormalizer(object):
+    """Normalizes strings using given spec and caches the results.
+
+    Caches are shared by all :class:`NormalizedDict` instances using the same
+    spec. They are cleared if they grow too big.
+    """
+    _max_cache_size = 10000
+    _normalizers = {}
+
+    def __init__(self, ignore=(), caseless=True, spaceless=True):
+        self._cache = {}
+        if list(ignore) == ['_'] and caseless and spaceless:
+            self._normalize = self._normalize_ignoring_underscores
+        else:
+            self._normalize = lambda s: normalize(s, ignore, caseless,
+                                                  spaceless)
+
+    def _normalize_ignoring_underscores(self, string):
+        string = lower(string[:0].join(string.split()))
+        if '_' in string:
+            string = string.replace('_', '')
+        return string
+
+    def __call__(self, string):
+        try:
+            return self._cache[string]
+        except KeyError:
+            if len(self._cache) >= self._max_cache_size:
+                self._cache.clear()
+            normalized = self._cache[string] = self._normalize(string)
+            return normalized
+        except TypeError:    # Unhashable. Fails later anyway.
+            return self._normalize(string)
+
+    @classmethod
+    def get(cls, ignore=(), caseless=True, spaceless=True):
+        ignore = tuple(ignore)
+        key = (ignore, bool(caseless), bool(spaceless))
+        if key not in cls._normalizers:
+            cls._normalizers[key] = cls(ignore, caseless, spaceless)
+        return cls._normalizers[key]
+
+
 class NormalizedDict(MutableMapping):
     """Custom dictionary implementation automatically normalizing keys."""
 
@@ -66,7 +109,8 @@ class NormalizedDict(MutableMapping):
         """
         self._data = {}
         self._keys = {}
-        self._normalize = lambda s: normalize(s, ignore, caseless, spaceless)
+        self._sorted_keys = None
+        self._normalize = _CachingNormalizer.get(ignore, caseless, spaceless)
         if initial:
             self._add_initial(initial)
 
@@ -81,15 +125,21 @@ class NormalizedDict(MutableMapping):
     def __setitem__(self, key, value):
         norm_key = self._normalize(key)
         self._data[norm_key] = value
-        self._keys.setdefault(norm_key, key)
+        if norm_key not in self._keys:
+            self._keys[norm_key] = key
+            self._sorted_keys = None
 
     def __delitem__(self, key):
         norm_key = self._normalize(key)
         del self._data[norm_key]
         del self._keys[norm_key]
+        self._sorted_keys = None
 
     def __iter__(self):
-        return (self._keys[norm_key] for norm_key in sorted(self._keys))
+        if self._sorted_keys is None:
+            self._sorted_keys = [self._keys[norm_key]
+                                 for norm_key in sorted(self._keys)]
+        return iter(self._sorted_keys)
 
     def __len__(self):
         return len(self._data)
@@ -111,6 +161,7 @@ class NormalizedDict(MutableMapping):
         copy = NormalizedDict()
         copy._data = self._data.copy()
         copy._keys = self._keys.copy()
+        copy._sorted_keys = self._sorted_keys
         copy._normalize = self._normalize
         return copy
 
@@ -122,3 +173,4 @@ class NormalizedDict(MutableMapping):
     def clear(self):
         self._data.clear()
         self._keys.clear()
+        self._sorted_keys = None
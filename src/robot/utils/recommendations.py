@@ -27,9 +27,14 @@ class RecommendationFinder(object):
             return []
         norm_name = self.normalizer(name)
         norm_candidates = self._get_normalized_candidates(candidates)
+        return self._find_recommendations(norm_name, norm_candidates,
+                                          norm_candidates, max_matches)
+
+    def _find_recommendations(self, norm_name, norm_candidates, possibilities,
+                              max_matches):
         cutoff = self._calculate_cutoff(norm_name)
         norm_matches = difflib.get_close_matches(norm_name,
-                                                 norm_candidates,
+                                                 possibilities,
                                                  n=max_matches,
                                                  cutoff=cutoff)
         return self._get_original_candidates(norm_candidates, norm_matches)
@@ -73,3 +78,70 @@ class RecommendationFinder(object):
         """
         cutoff = min_cutoff + len(string) * step
         return min(cutoff, max_cutoff)
+
+
+class RecommendationIndex(RecommendationFinder):
+    """Finds recommendations from candidates that are known beforehand.
+
+    Returns the same recommendations as :class:`RecommendationFinder`, but
+    candidates are normalized only once and their bigrams are indexed.
+    The index is used for shortlisting candidates that can be similar enough
+    before the actual similarity comparison.
+    """
+
+    def __init__(self, candidates, normalizer=None):
+        RecommendationFinder.__init__(self, normalizer)
+        self._norm_candidates = self._get_normalized_candidates(candidates)
+        self._norms = sorted(self._norm_candidates)
+        self._bigrams = {}
+        for index, norm in enumerate(self._norms):
+            for bigram, count in self._count_bigrams(norm).items():
+                self._bigrams.setdefault(bigram, []).append((index, count))
+
+    def __len__(self):
+        return len(self._norms)
+
+    def find_recommendations(self, name, max_matches=10):
+        """Return a list of close matches to `name` from indexed candidates."""
+        if not name or not self._norms:
+            return []
+        norm_name = self.normalizer(name)
+        shortlist = self._get_shortlist(norm_name,
+                                        self._calculate_cutoff(norm_name))
+        return self._find_recommendations(norm_name, self._norm_candidates,
+                                          shortlist, max_matches)
+
+    def _count_bigrams(self, string):
+        counts = {}
+        for index in range(len(string) - 1):
+            bigram = string[index:index+2]
+            counts[bigram] = counts.get(bigram, 0) + 1
+        return counts
+
+    def _get_shortlist(self, name, cutoff):
+        """Return candidates that can have similarity ratio above `cutoff`.
+
+        Matching blocks found by `difflib.SequenceMatcher` have `M` matching
+        characters in total and there must be an unmatched character in
+        either string between two blocks. Strings with total length `T`
+        thus have at least `3 * M - T - 1` common bigrams and the ratio
+        `2 * M / T` can reach `cutoff` only if they have at least
+        `(1.5 * cutoff - 1) * T - 1` common bigrams. With small cutoffs
+        this requirement does not exclude anything.
+        """
+        shared = {}
+        for bigram, count in self._count_bigrams(name).items():
+            for index, other in self._bigrams.get(bigram, ()):
+                shared[index] = shared.get(index, 0) + min(count, other)
+        factor = 1.5 * cutoff - 1
+        if factor * len(name) - 1 > 0:
+            indices = sorted(shared)
+        else:
+            indices = range(len(self._norms))
+        shortlist = []
+        for index in indices:
+            norm = self._norms[index]
+            required = factor * (len(name) + len(norm)) - 1 - 1e-9
+            if shared.get(index, 0) >= required:
+                shortlist.append(norm)
+        return shortlist
@@ -13,13 +13,17 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import gzip
 import io
 
 from .platform import PY3
 
 
 def file_writer(path=None, encoding='UTF-8', newline=None):
-    if path:
+    if path and is_gzip_path(path):
+        f = io.TextIOWrapper(gzip.open(path, 'wb', compresslevel=6),
+                             encoding=encoding, newline=newline)
+    elif path:
         f = io.open(path, 'w', encoding=encoding, newline=newline)
     else:
         f = io.StringIO(newline=newline)
@@ -41,3 +45,12 @@ def binary_file_writer(path=None):
     getvalue = f.getvalue
     f.getvalue = lambda encoding='UTF-8': getvalue().decode(encoding)
     return f
+
+
+def is_gzip_path(path):
+    return path.lower().endswith('.gz')
+
+
+def is_gzip_file(path):
+    with io.open(path, 'rb') as f:
+        return f.read(2) == b'\x1f\x8b'
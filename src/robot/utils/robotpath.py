@@ -33,13 +33,14 @@ if sys.version_info < (2,7):
 else:
     _abspath = os.path.abspath
 
-if PY2:
-    from urllib import pathname2url
-
-    def path_to_url(path):
+def path_to_url(path):
+    # urllib is imported lazily because on Python 3 importing it is slow.
+    if PY2:
+        from urllib import pathname2url
         return pathname2url(path.encode('UTF-8'))
-else:
-    from urllib.request import pathname2url as path_to_url
+    from urllib.request import pathname2url
+    return pathname2url(path)
+
 
 if WINDOWS:
     CASE_INSENSITIVE_FILESYSTEM = True
@@ -31,33 +31,62 @@ from .isvar import validate_var
 from .notfound import variable_not_found
 
 
+NOT_FOUND = object()
+
+
 class VariableFinder(object):
 
     def __init__(self, variable_store):
-        self._finders = (StoredFinder(variable_store),
-                         NumberFinder(),
-                         EmptyFinder(),
-                         EnvironmentFinder(),
-                         ExtendedFinder(self))
+        self._stored = StoredFinder(variable_store)
+        self._environment = EnvironmentFinder()
+        self._extended = ExtendedFinder(self)
         self._store = variable_store
 
     def find(self, name):
-        validate_var(name, '$@&%')
-        identifier = name[0]
-        for finder in self._finders:
-            if identifier in finder.identifiers:
-                try:
-                    value = finder.find(name)
-                except (KeyError, ValueError):
-                    continue
-                try:
-                    return self._validate_value(value, identifier, name)
-                except VariableError:
-                    raise
-                except:
-                    raise VariableError("Resolving variable '%s' failed: %s"
-                                        % (name, get_error_message()))
-        variable_not_found(name, self._store.data)
+        plan = ResolutionPlan.get(name)
+        if plan.environment:
+            value = self._environment.find(name)
+        else:
+            value = self._find(name, plan)
+            if value is NOT_FOUND:
+                variable_not_found(name, self._store.data)
+        return self._validate(value, name)
+
+    def get(self, name, default=None):
+        """Returns variable value or ``default`` if the variable is not found.
+
+        Unlike :meth:`find`, does not raise an exception if the variable does
+        not exist. Other errors, for example, invalid variable name or
+        extended variable syntax failing, are still raised.
+        """
+        plan = ResolutionPlan.get(name)
+        if plan.environment:
+            value = self._environment.get(name)
+        else:
+            value = self._find(name, plan, raise_if_missing=False)
+        if value is NOT_FOUND:
+            return default
+        return self._validate(value, name)
+
+    def _find(self, name, plan, raise_if_missing=True):
+        try:
+            return self._stored.find(name)
+        except (KeyError, ValueError):
+            pass
+        if plan.has_value:
+            return plan.value
+        if plan.extended:
+            return self._extended.find(name, raise_if_missing, *plan.extended)
+        return NOT_FOUND
+
+    def _validate(self, value, name):
+        try:
+            return self._validate_value(value, name[0], name)
+        except VariableError:
+            raise
+        except:
+            raise VariableError("Resolving variable '%s' failed: %s"
+                                % (name, get_error_message()))
 
     def _validate_value(self, value, identifier, name):
         if identifier == '@':
@@ -73,6 +102,48 @@ class VariableFinder(object):
         return value
 
 
+class ResolutionPlan(object):
+    """Tells how a variable with a certain name can be found.
+
+    Whether a name is a number, an empty variable or uses the extended
+    variable syntax does not depend on existing variables. That information
+    is thus cached based on the name to avoid trying all finders and
+    handling their exceptions every time a variable is used.
+    """
+    _cache = {}
+    _max_cache_size = 10000
+
+    def __init__(self, name):
+        validate_var(name, '$@&%')
+        self.environment = name[0] in EnvironmentFinder.identifiers
+        self.has_value = False
+        self.value = None
+        self.extended = None
+        if not self.environment:
+            self._initialize(name)
+
+    def _initialize(self, name):
+        for finder in NumberFinder, EmptyFinder:
+            if name[0] in finder.identifiers:
+                try:
+                    self.value = finder.find(name)
+                except (KeyError, ValueError):
+                    continue
+                self.has_value = True
+                return
+        self.extended = ExtendedFinder.split(name)
+
+    @classmethod
+    def get(cls, name):
+        try:
+            return cls._cache[name]
+        except KeyError:
+            if len(cls._cache) >= cls._max_cache_size:
+                cls._cache.clear()
+            plan = cls._cache[name] = cls(name)
+            return plan
+
+
 class StoredFinder(object):
     identifiers = '$@&'
 
@@ -86,14 +157,16 @@ class StoredFinder(object):
 class NumberFinder(object):
     identifiers = '$'
 
-    def find(self, name):
+    @classmethod
+    def find(cls, name):
         number = normalize(name)[2:-1]
         try:
-            return self._get_int(number)
+            return cls._get_int(number)
         except ValueError:
             return float(number)
 
-    def _get_int(self, number):
+    @classmethod
+    def _get_int(cls, number):
         bases = {'0b': 2, '0o': 8, '0x': 16}
         if number.startswith(tuple(bases)):
             return int(number[2:], bases[number[:2]])
@@ -112,37 +185,66 @@ class ExtendedFinder(object):
         (.+?)          # base name (group 1)
         ([^\s\w].+)    # extended part (group 2)
     ''', re.UNICODE|re.VERBOSE).match
+    _compiled = {}
+    _max_cache_size = 1000
 
     def __init__(self, finder):
-        self._find_variable = finder.find
+        self._finder = finder
+
+    @classmethod
+    def split(cls, name):
+        """Returns the base name and the extended part, or `None`."""
+        match = cls._match_extended(name[2:-1])
+        return match.groups() if match else None
+
+    def find(self, name, raise_if_missing, base_name, extended):
+        base_name = '${%s}' % base_name
+        if raise_if_missing:
+            variable = self._find_base(name, base_name)
+        else:
+            variable = self._finder.get(base_name, NOT_FOUND)
+            if variable is NOT_FOUND:
+                return NOT_FOUND
+        try:
+            return eval(self._compile(extended), {'_BASE_VAR_': variable})
+        except:
+            raise VariableError("Resolving variable '%s' failed: %s"
+                                % (name, get_error_message()))
 
-    def find(self, name):
-        match = self._match_extended(name[2:-1])
-        if match is None:
-            raise ValueError
-        base_name, extended = match.groups()
+    def _find_base(self, name, base_name):
         try:
-            variable = self._find_variable('${%s}' % base_name)
+            return self._finder.find(base_name)
         except DataError as err:
             raise VariableError("Resolving variable '%s' failed: %s"
                                 % (name, err.message))
+
+    def _compile(self, extended):
         try:
-            return eval('_BASE_VAR_' + extended, {'_BASE_VAR_': variable})
-        except:
-            raise VariableError("Resolving variable '%s' failed: %s"
-                                % (name, get_error_message()))
+            return self._compiled[extended]
+        except KeyError:
+            if len(self._compiled) >= self._max_cache_size:
+                self._compiled.clear()
+            code = compile('_BASE_VAR_' + extended, '<string>', 'eval')
+            self._compiled[extended] = code
+            return code
 
 
 class EnvironmentFinder(object):
     identifiers = '%'
 
     def find(self, name):
+        value = self.get(name)
+        if value is NOT_FOUND:
+            variable_not_found(name, self._get_candidates(),
+                               "Environment variable '%s' not found." % name)
+        return value
+
+    def get(self, name):
         for getter in get_env_var, get_java_property:
             value = getter(name[2:-1])
             if value is not None:
                 return value
-        variable_not_found(name, self._get_candidates(),
-                           "Environment variable '%s' not found." % name)
+        return NOT_FOUND
 
     def _get_candidates(self):
         candidates = dict(get_java_properties())
@@ -16,7 +16,7 @@
 from functools import partial
 
 from robot.errors import VariableError
-from robot.utils import (is_dict_like, is_list_like, normalize,
+from robot.utils import (is_dict_like, is_list_like, normalize, py2to3,
                          RecommendationFinder)
 
 
@@ -24,23 +24,47 @@ def variable_not_found(name, candidates, msg=None, deco_braces=True):
     """Raise DataError for missing variable name.
 
     Return recommendations for similar variable names if any are found.
+    Recommendations are searched only when the error message is actually
+    needed, because callers often just ignore the error. Candidates are
+    collected immediately, though, because they may change afterwards.
     """
     if msg is None:
         msg = "Variable '%s' not found." % name
-    candidates = _decorate_candidates(name[0], candidates, deco_braces)
-    normalizer = partial(normalize, ignore='$@%&*{}_', caseless=True,
-                         spaceless=True)
-    finder = RecommendationFinder(normalizer)
-    recommendations = finder.find_recommendations(name, candidates)
-    msg = finder.format_recommendations(msg, recommendations)
-    raise VariableError(msg)
-
-
-def _decorate_candidates(identifier, candidates, deco_braces=True):
-    template = '%s{%s}' if deco_braces else '%s%s'
-    is_included = {'$': lambda value: True,
-                   '@': is_list_like,
-                   '&': is_dict_like,
-                   '%': lambda value: True}[identifier]
-    return [template % (identifier, name)
-            for name in candidates if is_included(candidates[name])]
+    candidates = _get_candidates(name[0], candidates)
+    raise VariableError(_NotFoundMessage(name, candidates, msg, deco_braces))
+
+
+def _get_candidates(identifier, candidates):
+    if identifier == '@':
+        return [name for name in candidates if is_list_like(candidates[name])]
+    if identifier == '&':
+        return [name for name in candidates if is_dict_like(candidates[name])]
+    return list(candidates)
+
+
+@py2to3
+class _NotFoundMessage(object):
+
+    def __init__(self, name, candidates, msg, deco_braces=True):
+        self._name = name
+        self._candidates = candidates
+        self._msg = msg
+        self._deco_braces = deco_braces
+        self._message = None
+
+    def __unicode__(self):
+        if self._message is None:
+            self._message = self._get_message()
+            self._candidates = None
+        return self._message
+
+    def _get_message(self):
+        template = '%s{%s}' if self._deco_braces else '%s%s'
+        identifier = self._name[0]
+        candidates = [template % (identifier, name)
+                      for name in self._candidates]
+        normalizer = partial(normalize, ignore='$@%&*{}_', caseless=True,
+                             spaceless=True)
+        finder = RecommendationFinder(normalizer)
+        recommendations = finder.find_recommendations(self._name, candidates)
+        return finder.format_recommendations(self._msg, recommendations)
@@ -88,6 +88,9 @@ class VariableScopes(object):
     def __getitem__(self, name):
         return self.current[name]
 
+    def get(self, name, default=None):
+        return self.current.get(name, default)
+
     def __setitem__(self, name, value):
         self.current[name] = value
 
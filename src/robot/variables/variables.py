@@ -41,6 +41,9 @@ class Variables(object):
     def __getitem__(self, name):
         return self._finder.find(name)
 
+    def get(self, name, default=None):
+        return self._finder.get(name, default)
+
     def __contains__(self, name):
         return name in self.store
 
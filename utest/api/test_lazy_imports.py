@@ -0,0 +1,48 @@
+import subprocess
+import sys
+import unittest
+from os.path import abspath, dirname, join
+
+from robot.utils.asserts import assert_equal
+
+
+SRC = join(dirname(abspath(__file__)), '..', '..', 'src')
+LAZY = ['robot.reporting', 'robot.htmldata', 'robot.libdocpkg',
+        'robot.running', 'xml.etree', 'docutils', 'urllib.request',
+        'http.client', 'email']
+
+
+class TestLazyImports(unittest.TestCase):
+    """Guards start-up time by verifying heavy modules are imported lazily.
+
+    Modules are checked instead of measuring time to avoid flaky results.
+    """
+
+    def test_import_robot(self):
+        self._verify_not_imported('import robot')
+
+    def test_import_libdoc(self):
+        self._verify_not_imported('import robot.libdoc',
+                                  allowed=['robot.running', 'robot.libdocpkg'])
+
+    def test_import_api(self):
+        self._verify_not_imported('import robot.api',
+                                  allowed=['robot.reporting', 'robot.htmldata',
+                                           'robot.running'])
+
+    def _verify_not_imported(self, code, allowed=()):
+        lazy = [name for name in LAZY if name not in allowed]
+        code = ('import sys; %s; print(",".join(sorted(set('
+                'lazy for lazy in %r for name in sys.modules '
+                'if name == lazy or name.startswith(lazy + ".")))))'
+                % (code, lazy))
+        process = subprocess.Popen([sys.executable, '-c', code], cwd=SRC,
+                                   stdout=subprocess.PIPE,
+                                   stderr=subprocess.STDOUT)
+        output = process.communicate()[0].decode('UTF-8').strip()
+        assert_equal(process.returncode, 0, output)
+        assert_equal(output, '')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,9 @@
+import os
 import unittest
 
 from robot.conf.settings import _BaseSettings, RobotSettings, RebotSettings
 from robot.errors import DataError
-from robot.utils.asserts import assert_equal
+from robot.utils.asserts import assert_equal, assert_raises_with_msg
 
 
 class SettingWrapper(_BaseSettings):
@@ -43,7 +44,7 @@ class TestRobotAndRebotSettings(unittest.TestCase):
         assert_equal(RebotSettings({'exclude': 'two'})['Exclude'], ['two'])
 
     def test_output_files_as_none_string(self):
-        for name in 'Output', 'Report', 'Log', 'XUnit', 'DebugFile':
+        for name in 'Output', 'Report', 'Log', 'XUnit', 'DebugFile', 'Profile':
             attr = (name[:-4] if name.endswith('File') else name).lower()
             settings = RobotSettings({name.lower(): 'NoNe'})
             assert_equal(settings[name], None)
@@ -51,7 +52,7 @@ class TestRobotAndRebotSettings(unittest.TestCase):
                 assert_equal(getattr(settings, attr), None)
 
     def test_output_files_as_none_object(self):
-        for name in 'Output', 'Report', 'Log', 'XUnit', 'DebugFile':
+        for name in 'Output', 'Report', 'Log', 'XUnit', 'DebugFile', 'Profile':
             attr = (name[:-4] if name.endswith('File') else name).lower()
             settings = RobotSettings({name.lower(): None})
             assert_equal(settings[name], None)
@@ -97,6 +98,25 @@ class TestRobotAndRebotSettings(unittest.TestCase):
     def _verify_invalid_log_level(self, input):
         self.assertRaises(DataError, RobotSettings, {'loglevel': input})
 
+    def test_profile(self):
+        settings = RobotSettings(outputdir='/tmp', profile='profile')
+        assert_equal(settings.profile, os.path.abspath('/tmp/profile.txt'))
+        assert_equal(settings.profile_sort, 'self')
+        assert_equal(RobotSettings(profilesort='TOTAL').profile_sort, 'total')
+        self.assertRaises(DataError, RobotSettings, {'profilesort': 'bad'})
+
+    def test_output_index(self):
+        assert_equal(RobotSettings().output_index, False)
+        assert_equal(RobotSettings(outputindex=True).output_index, True)
+        assert_equal(RobotSettings(outputindex=True,
+                                   output='NONE').output_index, True)
+        for output in 'out.xml.gz', 'out.RBO':
+            assert_raises_with_msg(DataError,
+                                   "Option '--outputindex' cannot be used "
+                                   "with compressed or binary output '%s'."
+                                   % os.path.abspath(output), RobotSettings,
+                                   outputindex=True, output=output)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -9,7 +9,7 @@ import unittest
 
 from robot.utils import StringIO, PY3
 from robot.utils.asserts import assert_equal, assert_raises
-from robot.htmldata.jsonwriter import JsonDumper
+from robot.htmldata.jsonwriter import IdentityMapping, JsonDumper
 
 
 if PY3:
@@ -83,6 +83,43 @@ class TestJsonDumper(unittest.TestCase):
         assert_equal(output.getvalue(), '[1,[a,{a:1}]]')
         assert_raises(ValueError, dumper.dump, [mapped1])
 
+    def test_dict_mapping_uses_equality(self):
+        output = StringIO()
+        mapping = {'string': 's', ('x', (1, 2)): 't'}
+        data = [''.join(['str', 'ing']), tuple(['x', (1, 2)]), [1]]
+        JsonDumper(output).dump(data, mapping=mapping)
+        assert_equal(output.getvalue(), '[s,t,[1]]')
+
+    def test_identity_mapping_uses_identity(self):
+        output = StringIO()
+        mapped, equal = tuple(['x', (1, 2)]), tuple(['x', (1, 2)])
+        mapping = IdentityMapping()
+        mapping[mapped] = 'p'
+        JsonDumper(output).dump([mapped, equal], mapping=mapping)
+        assert_equal(output.getvalue(), '[p,["x",[1,2]]]')
+
+    def test_dump_subclasses(self):
+        class MyString(str): pass
+        class MyInt(int): pass
+        class MyList(list): pass
+        self._test(MyList([MyString('a\n'), MyInt(42)]), '["a\\n",42]')
+
+    def test_unsupported_type(self):
+        assert_raises(ValueError, self._dump, [1, 2.0])
+
+    def test_large_data_is_written_in_chunks(self):
+        class Output(StringIO):
+            writes = 0
+            def write(self, data):
+                self.writes += 1
+                StringIO.write(self, data)
+        output = Output()
+        data = [[i, 'x'] for i in range(1000)]
+        JsonDumper(output).dump(data)
+        expected = ','.join('[%d,"x"]' % i for i in range(1000))
+        assert_equal(output.getvalue(), '[%s]' % expected)
+        assert_equal(1 < output.writes < 100, True)
+
     if json:
         def test_against_standard_json(self):
             data = ['\\\'\"\r\t\n' + ''.join(chr(i) for i in range(32, 127)),
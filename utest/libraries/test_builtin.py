@@ -0,0 +1,80 @@
+import time
+import unittest
+
+from robot.utils.asserts import (assert_equal, assert_raises_with_msg,
+                                 assert_true)
+
+from robot.libraries.BuiltIn import _RetryInterval
+
+
+class TestRetryInterval(unittest.TestCase):
+
+    def _intervals(self, interval, count=5):
+        interval = _RetryInterval(interval)
+        return [interval.next() for _ in range(count)]
+
+    def test_plain_interval(self):
+        assert_equal(self._intervals('1s', 3), [1, 1, 1])
+        assert_equal(self._intervals(0.5, 3), [0.5, 0.5, 0.5])
+
+    def test_backoff(self):
+        assert_equal(self._intervals('1s backoff=2'), [1, 2, 4, 8, 16])
+        assert_equal(self._intervals('100ms backoff=1.5', 3),
+                     [0.1, 0.15000000000000002, 0.22500000000000003])
+
+    def test_max(self):
+        assert_equal(self._intervals('1s backoff=2 max=5s'), [1, 2, 4, 5, 5])
+        assert_equal(self._intervals('10s max=3s', 2), [3, 3])
+
+    def test_jitter(self):
+        for interval in self._intervals('1s jitter=0.2', 100):
+            assert_true(0.8 <= interval <= 1.2, interval)
+
+    def test_interval_is_limited_by_maxtime(self):
+        interval = _RetryInterval('1 minute')
+        assert_true(interval.next(time.time() + 1) <= 1)
+        assert_equal(interval.next(-1), 60)
+
+    def test_options_are_case_insensitive(self):
+        assert_equal(self._intervals('1s BackOff=3 MAX=5s', 3), [1, 3, 5])
+
+    def test_collapse(self):
+        assert_equal(_RetryInterval('1s').collapse, False)
+        assert_equal(_RetryInterval('1s collapse=yes').collapse, True)
+        assert_equal(_RetryInterval('1s collapse=no').collapse, False)
+
+    def test_invalid_option(self):
+        assert_raises_with_msg(ValueError,
+                               "Invalid retry interval option 'bad'. "
+                               "Available options: backoff, max, jitter "
+                               "and collapse.",
+                               _RetryInterval, '1s bad=1')
+
+    def test_invalid_backoff(self):
+        assert_raises_with_msg(ValueError,
+                               "Retry interval backoff must be 1 or bigger, "
+                               "got 0.5.",
+                               _RetryInterval, '1s backoff=0.5')
+        assert_raises_with_msg(ValueError,
+                               "Retry interval backoff must be a number, "
+                               "got x.",
+                               _RetryInterval, '1s backoff=x')
+
+    def test_invalid_jitter(self):
+        for value in '-0.1', '1.5':
+            assert_raises_with_msg(ValueError,
+                                   "Retry interval jitter must be between 0 "
+                                   "and 1, got %s." % value,
+                                   _RetryInterval, '1s jitter=' + value)
+        assert_raises_with_msg(ValueError,
+                               "Retry interval jitter must be a number, "
+                               "got x.",
+                               _RetryInterval, '1s jitter=x')
+
+    def test_invalid_max(self):
+        assert_raises_with_msg(ValueError, "Invalid time string 'x'.",
+                               _RetryInterval, '1s max=x')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -337,6 +337,55 @@ class TestTagPatterns(unittest.TestCase):
         patterns = TagPatterns([u'is\xe4', u'\xe4iti'])
         assert_equal(seq2str(patterns), u"'is\xe4' and '\xe4iti'")
 
+    def test_special_characters_in_patterns(self):
+        patterns = TagPatterns(['a.b', '[x]*', 'c+?'])
+        assert_true(patterns.match('A_.B'))
+        assert_false(patterns.match('aXb'))
+        assert_true(patterns.match('[X]yz'))
+        assert_false(patterns.match('xyz'))
+        assert_true(patterns.match('c+d'))
+        assert_false(patterns.match('cc+'))
+
+    def test_results_are_cached_per_normalized_tags(self):
+        patterns = TagPatterns('a AND b*')
+        assert_true(patterns.match(['A', 'bx']))
+        assert_true(patterns.match(Tags(['B X', '_a_'])))
+        assert_false(patterns.match(['a']))
+        assert_equal(len(patterns._cache), 2)
+
+    def test_modified_tags_are_matched_correctly(self):
+        patterns = TagPatterns('a NOT b')
+        tags = Tags('a')
+        assert_true(patterns.match(tags))
+        tags.add('B')
+        assert_false(patterns.match(tags))
+        tags.remove('b')
+        assert_true(patterns.match(tags))
+
+    def test_cache_size_is_limited(self):
+        patterns = TagPatterns('x')
+        patterns._max_cache_size = 5
+        for i in range(12):
+            assert_false(patterns.match(str(i)))
+        assert_true(0 < len(patterns._cache) <= 5)
+        assert_true(patterns.match(['x', '1']))
+
+
+class TestNormalizeTags(unittest.TestCase):
+
+    def test_tags(self):
+        tags = Tags(['foo', 'B a r', 'f_O_o', 'NONE'])
+        assert_equal(normalize_tags(tags), frozenset(['foo', 'bar']))
+        assert_true(normalize_tags(tags) is normalize_tags(tags))
+
+    def test_string(self):
+        assert_equal(normalize_tags('Foo Bar'), frozenset(['foobar']))
+        assert_equal(normalize_tags(''), frozenset())
+        assert_equal(normalize_tags('None'), frozenset())
+
+    def test_iterable(self):
+        assert_equal(normalize_tags(['X', 'y', 'x', '']), frozenset(['x', 'y']))
+
 
 class AndOrPatternGenerator(object):
     tags = ['0', '1']
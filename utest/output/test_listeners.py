@@ -1,7 +1,10 @@
 from __future__ import print_function
 
+import threading
+import time
 import unittest
 
+from robot.output.listenerdispatcher import ListenerDispatcher
 from robot.output.listeners import Listeners, LibraryListeners
 from robot.output import LOGGER
 from robot.utils.asserts import *
@@ -169,6 +172,122 @@ if JYTHON:
         stat_message = 'stat message'
 
 
+class AsyncListener(object):
+    ROBOT_LISTENER_API_VERSION = 2
+    ROBOT_LISTENER_ASYNC = True
+
+    def __init__(self):
+        self.events = []
+        self.threads = set()
+
+    def start_keyword(self, name, attrs):
+        time.sleep(0.001)
+        self._record('start', name, attrs)
+
+    def end_keyword(self, name, attrs):
+        self._record('end', name, attrs)
+
+    def end_test(self, name, attrs):
+        raise RuntimeError('Expected error')
+
+    def _record(self, event, name, attrs):
+        self.events.append((event, name, attrs.get('status')))
+        self.threads.add(threading.current_thread())
+
+
+class ErrorCollector(object):
+
+    def __init__(self):
+        self.errors = []
+
+    def message(self, msg):
+        if msg.level == 'ERROR':
+            self.errors.append(msg.message)
+
+
+class TestAsyncListeners(unittest.TestCase):
+
+    def test_events_are_delivered_in_order_in_background(self):
+        listener = AsyncListener()
+        listeners = Listeners([listener])
+        kw = KwMock()
+        for index in range(20):
+            kw.name = 'kw%d' % index
+            listeners.start_keyword(kw)
+            listeners.end_keyword(kw)
+        listeners.close()
+        expected = []
+        for index in range(20):
+            expected.extend([('start', 'kw%d' % index, None),
+                             ('end', 'kw%d' % index, 'PASS')])
+        assert_equal(listener.events, expected)
+        assert_equal(len(listener.threads), 1)
+        assert_true(threading.current_thread() not in listener.threads)
+
+    def test_arguments_are_snapshot(self):
+        listener = AsyncListener()
+        listeners = Listeners([listener])
+        kw = KwMock()
+        listeners.end_keyword(kw)
+        kw.status = 'FAIL'
+        listeners.end_keyword(kw)
+        listeners.close()
+        assert_equal(listener.events, [('end', 'kwmock', 'PASS'),
+                                       ('end', 'kwmock', 'FAIL')])
+
+    def test_attribute_dicts_are_copied(self):
+        received = []
+        dispatcher = ListenerDispatcher('Listener')
+        attrs = {'status': 'PASS', 'tags': ['t1']}
+        dispatcher.dispatch(lambda name, attrs: received.append(attrs),
+                            ('kw', attrs))
+        attrs['status'] = 'FAIL'
+        attrs['tags'].append('t2')
+        dispatcher.close()
+        assert_equal(received, [{'status': 'PASS', 'tags': ['t1']}])
+
+    def test_calls_after_close_are_synchronous(self):
+        listener = AsyncListener()
+        listeners = Listeners([listener])
+        listeners.start_keyword(KwMock())
+        listeners.close()
+        assert_true(threading.current_thread() not in listener.threads)
+        listener.threads.clear()
+        listeners.end_keyword(KwMock())
+        assert_equal(listener.events, [('start', 'kwmock', None),
+                                       ('end', 'kwmock', 'PASS')])
+        assert_equal(listener.threads, set([threading.current_thread()]))
+
+    def test_errors_are_reported_in_main_thread(self):
+        collector = ErrorCollector()
+        LOGGER.register_logger(collector)
+        try:
+            listeners = Listeners([AsyncListener()])
+            listeners.end_test(TestMock())
+            listeners.close()
+        finally:
+            LOGGER.unregister_logger(collector)
+        assert_equal(collector.errors,
+                     ["Calling method 'end_test' of listener 'AsyncListener' "
+                      "failed: Expected error"])
+
+    def test_api_version_3_listeners_are_synchronous(self):
+        class Listener(AsyncListener):
+            ROBOT_LISTENER_API_VERSION = 3
+            def end_suite(self, data, result):
+                self.threads.add(threading.current_thread())
+        listener = Listener()
+        Listeners([listener]).end_suite(SuiteMock())
+        assert_equal(listener.threads, set([threading.current_thread()]))
+
+    def test_async_can_be_disabled_with_false_string(self):
+        class Listener(AsyncListener):
+            ROBOT_LISTENER_ASYNC = 'False'
+        listener = Listener()
+        Listeners([listener]).start_keyword(KwMock())
+        assert_equal(listener.threads, set([threading.current_thread()]))
+
+
 class TestAttributesAreNotAccessedUnnecessarily(unittest.TestCase):
 
     def test_start_and_end_methods(self):
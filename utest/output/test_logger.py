@@ -3,6 +3,7 @@ import unittest
 from robot.utils.asserts import assert_equal, assert_true, assert_false
 
 from robot.output.logger import Logger
+from robot.output.loggerhelper import Message
 from robot.output.console.verbose import VerboseOutput
 
 
@@ -112,6 +113,78 @@ class TestLogger(unittest.TestCase):
         self.logger.register_logger(logger)
         assert_false(hasattr(logger, 'msg'))
 
+    def test_background_messages_are_logged_when_keyword_ends(self):
+        class MyLogger:
+            def __init__(self): self.messages = []
+            def log_message(self, msg): self.messages.append(msg.message)
+            def end_keyword(self, kw): self.ended_with = list(self.messages)
+        logger = MyLogger()
+        self.logger.register_logger(logger)
+        self.logger.start_keyword('kw')
+        self.logger.log_background_message(Message('background'))
+        self.logger.log_message(Message('normal'))
+        assert_equal(logger.messages, ['normal'])
+        self.logger.end_keyword('kw')
+        assert_equal(logger.ended_with, ['normal', 'background'])
+
+    def test_background_messages_can_be_logged_explicitly(self):
+        logger = LoggerMock(('First', 'INFO'), ('Second', 'WARN'))
+        self.logger.register_logger(logger)
+        self.logger.log_background_message(Message('First'))
+        self.logger.log_background_message(Message('Second', 'WARN'))
+        self.logger.log_background_messages()
+        assert_equal(logger.msg.message, 'Second')
+        assert_equal(logger.expected, [])
+
+    def test_background_messages_are_held_until_next_keyword_starts(self):
+        class MyLogger:
+            def __init__(self): self.messages = []
+            def message(self, msg): self.messages.append(msg.message)
+            def log_message(self, msg): self.messages.append(msg.message)
+            def start_keyword(self, kw): self.messages.append('start')
+            def end_test(self, test): self.messages.append('end test')
+        logger = MyLogger()
+        self.logger.register_logger(logger)
+        self.logger.log_background_message(Message('between keywords'))
+        self.logger.end_test('test')
+        self.logger.start_keyword('kw')
+        assert_equal(logger.messages, ['end test', 'start', 'between keywords'])
+
+    def test_background_messages_are_logged_to_parent_before_child_starts(self):
+        class MyLogger:
+            def __init__(self): self.messages = []
+            def log_message(self, msg): self.messages.append(msg.message)
+            def start_keyword(self, kw): self.messages.append('start ' + kw)
+        logger = MyLogger()
+        self.logger.register_logger(logger)
+        self.logger.start_keyword('parent')
+        self.logger.log_background_message(Message('background'))
+        self.logger.start_keyword('child')
+        assert_equal(logger.messages,
+                     ['start parent', 'background', 'start child'])
+
+    def test_background_message_queue_is_bounded(self):
+        class MyLogger:
+            def __init__(self): self.messages = []
+            def message(self, msg): self.messages.append(msg)
+        class SmallQueueLogger(Logger):
+            _max_background_messages = 3
+        logger = MyLogger()
+        self.logger = SmallQueueLogger(register_console_logger=False)
+        self.logger.register_logger(logger)
+        for count in 5, 3, 4:
+            for index in range(count):
+                self.logger.log_background_message(Message(str(index)))
+            self.logger.log_background_messages()
+        warning = ('%d message%s logged by non-main threads dropped because '
+                   'more than 3 messages were queued.')
+        assert_equal([m.message for m in logger.messages],
+                     ['2', '3', '4', warning % (2, 's'),
+                      '0', '1', '2',
+                      '1', '2', '3', warning % (1, '')])
+        assert_equal(logger.messages[3].level, 'WARN')
+        assert_equal(logger.messages[-1].level, 'WARN')
+
     def test_start_and_end_suite_test_and_keyword(self):
         class MyLogger:
             def start_suite(self, suite): self.started_suite = suite
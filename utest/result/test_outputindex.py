@@ -0,0 +1,151 @@
+import os
+import tempfile
+import unittest
+
+from robot.errors import DataError
+from robot.output.xmllogger import XmlLogger
+from robot.result import ExecutionResult, Result
+from robot.result.outputindex import (OutputIndex, SkippingReader,
+                                      get_index_path, read_output_index)
+from robot.utils.asserts import assert_equal, assert_raises_with_msg, assert_true
+
+
+PATH = os.path.join(tempfile.gettempdir(), 'test_outputindex.xml')
+
+
+def create_result():
+    result = Result()
+    root = result.suite
+    root.name = 'Root'
+    for suite_name in 'First', 'Second':
+        suite = root.suites.create(name=suite_name)
+        for test_name, status in [('Pass', 'PASS'), ('Fail', 'FAIL')]:
+            test = suite.tests.create(name=test_name, status=status)
+            test.keywords.create(kwname='Log', status=status)
+    return result
+
+
+def write_output(result, path=PATH, index=True):
+    logger = XmlLogger(path, index=index)
+    result.suite.visit(logger)
+    logger.close()
+
+
+class TestOutputIndex(unittest.TestCase):
+
+    def setUp(self):
+        write_output(create_result())
+
+    def tearDown(self):
+        for path in PATH, get_index_path(PATH):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_index_is_written(self):
+        index = read_output_index(PATH)
+        assert_equal([s[0] for s in index.suites], ['Root', 'First', 'Second'])
+        assert_equal([index.test_longname(t) for t in index.tests],
+                     ['Root.First.Pass', 'Root.First.Fail',
+                      'Root.Second.Pass', 'Root.Second.Fail'])
+
+    def test_offsets(self):
+        index = read_output_index(PATH)
+        with open(PATH, 'rb') as output:
+            content = output.read()
+        for name, _, start, end, _, _ in index.suites:
+            part = content[start:end].decode('UTF-8')
+            assert_true(part.startswith('<suite '), part)
+            assert_true(part.endswith('</suite>\n'), part)
+            assert_true('name="%s"' % name in part)
+        for name, _, start, end, _, _ in index.tests:
+            part = content[start:end].decode('UTF-8')
+            assert_true(part.startswith('<test '), part)
+            assert_true(part.endswith('</test>\n'), part)
+
+    def test_offsets_with_non_ascii_content(self):
+        result = create_result()
+        result.suite.suites[0].name = u'F\xefrst \u2603'
+        write_output(result)
+        index = read_output_index(PATH)
+        with open(PATH, 'rb') as output:
+            content = output.read()
+        for _, _, start, end, _, _ in index.suites + index.tests:
+            part = content[start:end].decode('UTF-8')
+            assert_true(part.startswith(('<suite ', '<test ')), part)
+            assert_true(part.endswith(('</suite>\n', '</test>\n')), part)
+
+    def test_index_cannot_be_written_for_compressed_or_binary_outputs(self):
+        for path in 'output.xml.gz', 'output.rbo':
+            assert_raises_with_msg(DataError,
+                                   'Output index can only be written for '
+                                   'uncompressed XML outputs.',
+                                   XmlLogger, path, index=True)
+
+    def test_failed_tests_and_suites(self):
+        index = read_output_index(PATH)
+        assert_equal(index.failed_tests, ['Root.First.Fail', 'Root.Second.Fail'])
+        assert_equal(index.failed_suites, ['Root.First', 'Root.Second'])
+
+    def test_suite_teardown_failure_fails_tests(self):
+        result = create_result()
+        result.suite.suites[0].keywords.create(type='teardown', status='FAIL')
+        write_output(result)
+        index = read_output_index(PATH)
+        assert_equal(index.failed_tests, ['Root.First.Pass', 'Root.First.Fail',
+                                          'Root.Second.Fail'])
+
+    def test_index_is_not_used_if_output_changes(self):
+        with open(PATH, 'a') as output:
+            output.write('\n')
+        assert_equal(read_output_index(PATH), None)
+
+    def test_index_is_not_written_by_default(self):
+        os.remove(get_index_path(PATH))
+        write_output(create_result(), index=False)
+        assert_equal(read_output_index(PATH), None)
+
+    def test_selecting_suites_and_tests(self):
+        for options, expected in [
+            ({'include_suites': ['First']}, ['Root.First.Pass', 'Root.First.Fail']),
+            ({'include_tests': ['Fail']}, ['Root.First.Fail', 'Root.Second.Fail']),
+            ({'include_suites': ['Root.Second'], 'include_tests': ['P*']},
+             ['Root.Second.Pass']),
+        ]:
+            result = ExecutionResult(PATH, **options)
+            tests = [t.longname for s in result.suite.suites for t in s.tests]
+            assert_equal(tests, expected)
+
+    def test_skipped_ranges(self):
+        index = read_output_index(PATH)
+        second = index.suites[2]
+        assert_equal(index.get_skipped_ranges(['First']), [second[2:4]])
+        assert_equal(index.get_skipped_ranges(['Non-existing']), [])
+        assert_equal(index.get_skipped_ranges(), [])
+        pass1, fail1, pass2, fail2 = index.tests
+        assert_equal(index.get_skipped_ranges(include_tests=['Fail']),
+                     [pass1[2:4], pass2[2:4]])
+
+
+class TestSkippingReader(unittest.TestCase):
+
+    def setUp(self):
+        with open(PATH, 'wb') as f:
+            f.write(b'0123456789')
+
+    def tearDown(self):
+        os.remove(PATH)
+
+    def test_skipping(self):
+        for ranges, expected in [([], b'0123456789'),
+                                 ([(0, 2)], b'23456789'),
+                                 ([(2, 4), (6, 10)], b'0145'),
+                                 ([(0, 10)], b'')]:
+            for size in 1, 3, 100, -1:
+                reader = SkippingReader(PATH, ranges)
+                data = b''.join(iter(lambda: reader.read(size), b''))
+                reader.close()
+                assert_equal(data, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
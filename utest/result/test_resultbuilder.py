@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 from os.path import join, dirname
 
@@ -20,7 +22,7 @@ SUITE_TEARDOWN_FAILED = _read_file('suite_teardown_failed.xml')
 class TestBuildingSuiteExecutionResult(unittest.TestCase):
 
     def setUp(self):
-        result = ExecutionResult(StringIO(GOLDEN_XML))
+        result = self._build()
         self._suite = result.suite
         self._test = self._suite.tests[0]
         self._keyword = self._test.keywords[0]
@@ -29,6 +31,9 @@ class TestBuildingSuiteExecutionResult(unittest.TestCase):
         self._setup = self._suite.keywords[0]
         self._errors = result.errors
 
+    def _build(self, **options):
+        return ExecutionResult(StringIO(GOLDEN_XML), **options)
+
     def test_suite_is_built(self):
         assert_equal(self._suite.source, 'normal.html')
         assert_equal(self._suite.name, 'Normal')
@@ -92,6 +97,31 @@ class TestBuildingSuiteExecutionResult(unittest.TestCase):
                       "Error in file 'normal.html' in table 'Settings': Resource file 'nope' does not exist.")
 
 
+class TestBuildingSuiteExecutionResultFromBinaryOutput(
+        TestBuildingSuiteExecutionResult):
+    path = join(tempfile.gettempdir(), 'test_resultbuilder.rbo')
+
+    def setUp(self):
+        ExecutionResult(StringIO(GOLDEN_XML)).save(self.path)
+        TestBuildingSuiteExecutionResult.setUp(self)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def _build(self, **options):
+        return ExecutionResult(self.path, **options)
+
+    def test_binary_output_is_written(self):
+        with open(self.path, 'rb') as f:
+            assert_equal(f.read(4), b'RBO\x01')
+
+    def test_excluding_keywords(self):
+        suite = self._build(include_keywords=False).suite
+        assert_equal(list(suite.keywords), [])
+        assert_equal(list(suite.tests[0].keywords), [])
+        assert_equal(suite.tests[0].status, 'PASS')
+
+
 class TestCombiningSuites(unittest.TestCase):
 
     def setUp(self):
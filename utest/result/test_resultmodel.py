@@ -30,6 +30,114 @@ class TestSuiteStats(unittest.TestCase):
         assert_equal(suite.test_count, 16)
         assert_equal(suite.suites[-1].test_count, 6)
 
+    def test_stats_are_updated_when_test_status_changes(self):
+        suite = self._create_nested_suite_with_tests()
+        self._verify_stats(suite, (4, 2), (6, 4))
+        self._verify_stats(suite.suites[0], (2, 1), (3, 2))
+        suite.suites[0].tests[3].status = 'PASS'
+        suite.suites[0].tests[1].status = 'FAIL'
+        suite.suites[1].tests[0].passed = False
+        self._verify_stats(suite, (4, 2), (5, 5))
+        self._verify_stats(suite.suites[0], (3, 0), (3, 2))
+        self._verify_stats(suite.suites[1], (1, 2), (2, 3))
+        assert_equal(suite.suites[0].status, 'PASS')
+        assert_equal(suite.status, 'FAIL')
+
+    def test_stats_are_updated_when_tests_are_added_or_removed(self):
+        suite = self._create_nested_suite_with_tests()
+        self._verify_stats(suite, (4, 2), (6, 4))
+        suite.suites[0].tests.create(status='FAIL')
+        suite.suites[1].tests.pop()
+        self._verify_stats(suite, (4, 3), (6, 4))
+        suite.suites[1].tests[3] = TestCase(status='PASS')
+        self._verify_stats(suite, (5, 2), (7, 3))
+        suite.suites[0].tests = [t for t in suite.suites[0].tests if t.passed]
+        self._verify_stats(suite, (5, 0), (7, 0))
+        suite.suites[0].tests.clear()
+        suite.suites.append(self._create_suite_with_tests())
+        self._verify_stats(suite, (5, 1), (7, 2))
+        suite.suites.pop(1)
+        self._verify_stats(suite, (2, 1), (3, 2))
+        suite.suites = []
+        self._verify_stats(suite, (0, 0), (0, 0))
+
+    def test_status_changes_of_removed_tests_do_not_affect_stats(self):
+        suite = self._create_nested_suite_with_tests()
+        self._verify_stats(suite, (4, 2), (6, 4))
+        popped = suite.suites[0].tests.pop()
+        replaced = suite.suites[1].tests[0]
+        suite.suites[1].tests[0] = TestCase(status='PASS')
+        filtered = suite.suites[1].tests[3]
+        suite.suites[1].tests = [t for t in suite.suites[1].tests if t.passed]
+        self._verify_stats(suite, (4, 1), (6, 1))
+        popped.status = 'PASS'
+        replaced.status = 'FAIL'
+        filtered.status = 'PASS'
+        self._verify_stats(suite, (4, 1), (6, 1))
+
+    def test_copied_test_has_own_tags(self):
+        suite = self._create_suite_with_tests()
+        self._verify_stats(suite, (2, 1), (3, 2))
+        copy = suite.tests[0].copy()
+        assert_true(copy.tags is not suite.tests[0].tags)
+        assert_true(copy.tags._test is copy)
+        assert_equal(list(copy.tags), [])
+        copy.tags.add('nc')
+        assert_equal(list(suite.tests[0].tags), [])
+        self._verify_stats(suite, (2, 1), (3, 2))
+
+    def test_stats_are_updated_when_tags_or_criticality_change(self):
+        suite = self._create_nested_suite_with_tests()
+        self._verify_stats(suite, (4, 2), (6, 4))
+        suite.suites[0].tests[0].tags.add('nc')
+        suite.suites[1].tests[4].tags.remove('n?')
+        self._verify_stats(suite, (3, 3), (6, 4))
+        suite.suites[1].tests[0].tags = ['nc']
+        self._verify_stats(suite, (2, 3), (6, 4))
+        suite.set_criticality()
+        self._verify_stats(suite, (6, 4), (6, 4))
+        self._verify_stats(suite.suites[1], (3, 2), (3, 2))
+
+    def test_stats_are_updated_when_test_times_change(self):
+        suite = TestSuite()
+        test = suite.suites.create().tests.create(starttime='20170101 12:00:00.000',
+                                                  endtime='20170101 12:00:01.000')
+        assert_equal(suite.statistics.all.elapsed, 1000)
+        test.endtime = '20170101 12:00:02.500'
+        assert_equal(suite.statistics.all.elapsed, 2500)
+
+    def test_stats_are_updated_when_suite_with_different_criticality_is_added(self):
+        suite = TestSuite()
+        suite.set_criticality(non_critical_tags='nc')
+        sub = self._create_suite_with_tests()
+        sub.set_criticality()
+        self._verify_stats(sub, (3, 2), (3, 2))
+        suite.suites.append(sub)
+        self._verify_stats(sub, (2, 1), (3, 2))
+        self._verify_stats(suite, (2, 1), (3, 2))
+
+    def test_returned_stats_are_not_shared(self):
+        suite = self._create_suite_with_tests()
+        suite.statistics.all.passed = 100
+        self._verify_stats(suite, (2, 1), (3, 2))
+
+    def test_invalidate_statistics(self):
+        suite = self._create_nested_suite_with_tests()
+        self._verify_stats(suite, (4, 2), (6, 4))
+        test = suite.suites[0].tests[0]
+        test.parent = suite.suites[1]
+        suite.suites[1].tests._items += (test,)
+        suite.suites[0].tests._items = suite.suites[0].tests._items[1:]
+        suite.invalidate_statistics()
+        self._verify_stats(suite, (4, 2), (6, 4))
+        self._verify_stats(suite.suites[0], (1, 1), (2, 2))
+        self._verify_stats(suite.suites[1], (3, 1), (4, 2))
+
+    def _verify_stats(self, suite, critical, all):
+        stats = suite.statistics
+        assert_equal((stats.critical.passed, stats.critical.failed), critical)
+        assert_equal((stats.all.passed, stats.all.failed), all)
+
     def _create_nested_suite_with_tests(self):
         suite = TestSuite()
         suite.set_criticality([], ['nc'])
@@ -0,0 +1,84 @@
+import unittest
+
+from robot.errors import DataError
+from robot.running.arguments import ArgumentSpec
+from robot.utils.asserts import (assert_equal, assert_false,
+                                 assert_raises_with_msg, assert_true)
+from robot.variables import Variables
+
+
+class TestBindingPlans(unittest.TestCase):
+
+    def setUp(self):
+        self.spec = ArgumentSpec('kw', positional=['a', 'b'], defaults=['b'])
+        self.variables = Variables()
+        self.variables['${x}'] = 'value'
+        self.variables['&{d}'] = {'b': 'from dict'}
+
+    def _resolve(self, *args, **config):
+        return self.spec.resolve(args, self.variables, **config)
+
+    def _plan(self, *args, **config):
+        key = (config.get('resolve_named', True),
+               config.get('resolve_variables_until'),
+               config.get('dict_to_kwargs', False))
+        return self.spec._resolvers[key]._plans[args]
+
+    def test_plan_is_reused(self):
+        assert_equal(self._resolve('1', 'b=${x}'), (['1'], [('b', 'value')]))
+        plan = self._plan('1', 'b=${x}')
+        self.variables['${x}'] = 'new'
+        assert_equal(self._resolve('1', 'b=${x}'), (['1'], [('b', 'new')]))
+        assert_true(self._plan('1', 'b=${x}') is plan)
+
+    def test_static_arguments_are_unescaped_and_validated_in_advance(self):
+        assert_equal(self._resolve('\\${x}', 'b=\\\\'),
+                     (['${x}'], [('b', '\\')]))
+        assert_true(self._plan('\\${x}', 'b=\\\\')._validated)
+
+    def test_list_and_dict_variables_are_validated_when_resolved(self):
+        self.variables['@{list}'] = ['1', '2']
+        assert_equal(self._resolve('@{list}'), (['1', '2'], []))
+        assert_false(self._plan('@{list}')._validated)
+        assert_equal(self._resolve('1', '&{d}'),
+                     (['1'], [('b', 'from dict')]))
+        assert_false(self._plan('1', '&{d}')._validated)
+        self.variables['@{list}'] = ['1', '2', '3']
+        assert_raises_with_msg(DataError,
+                               "Keyword 'kw' expected 1 to 2 arguments, got 3.",
+                               self._resolve, '@{list}')
+
+    def test_variable_errors_are_reported_before_invalid_arguments(self):
+        for _ in range(2):
+            assert_raises_with_msg(DataError,
+                                   "Variable '${nonex}' not found.",
+                                   self._resolve, '${nonex}', '2', '3')
+        assert_raises_with_msg(DataError,
+                               "Keyword 'kw' expected 1 to 2 arguments, got 3.",
+                               self._resolve, '${x}', '2', '3')
+
+    def test_no_plan_when_named_argument_names_contain_variables(self):
+        self.variables['${name}'] = 'b'
+        assert_equal(self._resolve('1', '${name}=2'), (['1'], [('b', '2')]))
+        assert_equal(self._plan('1', '${name}=2'), None)
+
+    def test_no_plan_for_non_string_arguments(self):
+        assert_equal(self._resolve(1, 2), ([1, 2], []))
+        assert_equal(self._plan(1, 2), None)
+        assert_equal(self._resolve([1], {}), ([[1], {}], []))
+
+    def test_resolve_variables_until(self):
+        config = {'resolve_named': False, 'resolve_variables_until': 1}
+        assert_equal(self._resolve('\\${x}', '\\${x}', **config),
+                     (['${x}', '\\${x}'], []))
+        assert_equal(self._resolve('${x}', '${x}', **config),
+                     (['value', '${x}'], []))
+
+    def test_plans_are_not_used_in_dry_run(self):
+        assert_equal(self.spec.resolve(['\\${x}', 'b=${x}']),
+                     (['\\${x}'], [('b', '${x}')]))
+        assert_equal(self.spec._resolvers[(True, None, False)]._plans, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
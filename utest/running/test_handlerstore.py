@@ -0,0 +1,95 @@
+import unittest
+
+from robot.errors import DataError
+from robot.running.arguments import EmbeddedArguments
+from robot.running.handlerstore import EmbeddedArgumentsIndex, HandlerStore
+from robot.utils.asserts import (assert_equal, assert_false,
+                                 assert_raises_with_msg, assert_true)
+
+
+class EmbeddedHandler(object):
+
+    def __init__(self, name):
+        self.name = name
+        self.embedded_name = EmbeddedArguments(name).name
+
+    def matches(self, name):
+        return self.embedded_name.match(name) is not None
+
+
+class TestEmbeddedArgumentsIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = EmbeddedArgumentsIndex()
+        for name in ['User selects ${item} from list',
+                     'User selects ${item}',
+                     'User ${does} something',
+                     '${x} + ${y} = 3',
+                     'No args',
+                     u'K\xe4ytt\xe4j\xe4 ${x} valitsee']:
+            self.index.add(EmbeddedHandler(name))
+
+    def test_candidates_by_prefix_and_suffix(self):
+        self._verify('User selects book from list',
+                     ['User selects ${item} from list', 'User selects ${item}'])
+        self._verify('User selects book', ['User selects ${item}'])
+        self._verify('User walks something', ['User ${does} something'])
+        self._verify('1 + 2 = 3', ['${x} + ${y} = 3'])
+        self._verify('1 + 2 = 4', [])
+        self._verify('Something else', [])
+
+    def test_candidates_are_case_insensitive(self):
+        self._verify('USER SELECTS book', ['User selects ${item}'])
+        self._verify('user does SOMETHING', ['User ${does} something'])
+
+    def test_prefix_and_suffix_do_not_overlap(self):
+        self._verify('User something', [])
+
+    def test_all_handlers_are_candidates_with_non_ascii_names(self):
+        assert_equal(len(self.index.get_candidates(u'K\xe4ytt\xe4j\xe4 x')), 6)
+
+    def _verify(self, name, expected):
+        candidates = [h.name for h in self.index.get_candidates(name)]
+        assert_equal(sorted(candidates), sorted(expected))
+
+
+class TestHandlerStoreWithEmbeddedArguments(unittest.TestCase):
+
+    def setUp(self):
+        self.store = HandlerStore('resource.robot', HandlerStore.RESOURCE_FILE_TYPE)
+        for name in ['Select ${x} from ${y}', 'Select ${x:\d+} from list',
+                     '${prefix} from list', u'\xc4\xe4kk\xf6set ${x}']:
+            self.store.add(EmbeddedHandler(name), embedded=True)
+
+    def test_contains(self):
+        assert_true('Select item from menu' in self.store)
+        assert_true('select 1 from list' in self.store)
+        assert_true(u'\xc4\xe4KK\xf6SET value' in self.store)
+        assert_false('Select item' in self.store)
+
+    def test_get_single_match(self):
+        assert_equal(self.store['Select item from menu'].name,
+                     'Select ${x} from ${y}')
+        assert_equal(self.store['Something from list'].name,
+                     '${prefix} from list')
+
+    def test_multiple_matches(self):
+        assert_raises_with_msg(
+            DataError,
+            "Resource file 'resource.robot' contains multiple keywords "
+            "matching name 'Select 1 from list':\n"
+            "    ${prefix} from list\n"
+            "    Select ${x:\d+} from list\n"
+            "    Select ${x} from ${y}",
+            self.store.__getitem__, 'Select 1 from list')
+
+    def test_no_match(self):
+        assert_raises_with_msg(
+            DataError,
+            "Resource file 'resource.robot' contains no keywords "
+            "matching name 'Nothing'.",
+            self.store.__getitem__, 'Nothing')
+
+
+if __name__ == '__main__':
+    unittest.main()
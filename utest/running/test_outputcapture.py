@@ -0,0 +1,67 @@
+from __future__ import print_function
+
+import sys
+import unittest
+
+from robot.utils.asserts import assert_equal, assert_true
+
+from robot.running.outputcapture import PythonCapturer
+
+
+class TestPythonCapturer(unittest.TestCase):
+
+    def setUp(self):
+        self.stdout = sys.stdout
+
+    def tearDown(self):
+        sys.stdout = self.stdout
+
+    def test_capture(self):
+        capturer = PythonCapturer()
+        print('Hello, world!')
+        assert_equal(capturer.release(), u'Hello, world!\n')
+        assert_true(sys.stdout is self.stdout)
+
+    def test_nothing_written(self):
+        assert_equal(PythonCapturer().release(), u'')
+
+    def test_buffers_are_reused(self):
+        capturer = PythonCapturer()
+        print('first')
+        buffer = capturer._buffer
+        assert_equal(capturer.release(), u'first\n')
+        capturer = PythonCapturer()
+        print('second')
+        assert_true(capturer._buffer is buffer)
+        assert_equal(capturer.release(), u'second\n')
+
+    def test_nested(self):
+        outer = PythonCapturer()
+        print('outer 1')
+        inner = PythonCapturer()
+        print('inner')
+        assert_equal(inner.release(), u'inner\n')
+        print('outer 2')
+        assert_equal(outer.release(), u'outer 1\nouter 2\n')
+
+    def test_writes_to_released_stream_are_ignored(self):
+        capturer = PythonCapturer()
+        stream = sys.stdout
+        assert_equal(capturer.release(), u'')
+        capturer = PythonCapturer()
+        stream.write('ignored')
+        stream.flush()
+        print('captured')
+        assert_equal(capturer.release(), u'captured\n')
+
+    def test_closing_stream(self):
+        capturer = PythonCapturer()
+        print('before close')
+        sys.stdout.close()
+        assert_true(sys.stdout.closed)
+        print('after close')
+        assert_equal(capturer.release(), u'before close\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
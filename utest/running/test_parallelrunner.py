@@ -0,0 +1,79 @@
+import sys
+import threading
+import unittest
+
+from robot.utils import StringIO
+from robot.utils.asserts import assert_equal, assert_true
+
+from robot.running.parallelrunner import _OutputRouter, _RoutingStream
+
+
+class KeywordMock(object):
+
+    def __init__(self, target):
+        self.stdout = StringIO()
+        self.stderr = StringIO()
+        self._thread = threading.Thread(target=target)
+
+    def run(self):
+        self._thread.start()
+        self._thread.join()
+
+
+class TestRoutingStream(unittest.TestCase):
+
+    def test_writes_are_routed_based_on_thread(self):
+        original, routed = StringIO(), StringIO()
+        thread = threading.Thread(target=lambda: stream.write('thread'))
+        stream = _RoutingStream({thread: routed}, original)
+        stream.write('main')
+        thread.start()
+        thread.join()
+        assert_equal(original.getvalue(), 'main')
+        assert_equal(routed.getvalue(), 'thread')
+
+    def test_other_attributes_come_from_original_stream(self):
+        original = StringIO()
+        stream = _RoutingStream({}, original)
+        assert_equal(stream.getvalue, original.getvalue)
+        stream.flush()
+
+
+class TestOutputRouter(unittest.TestCase):
+
+    def setUp(self):
+        self.stdout, self.stderr = sys.stdout, sys.stderr
+
+    def tearDown(self):
+        sys.stdout, sys.stderr = self.stdout, self.stderr
+
+    def test_output_is_routed_to_keywords(self):
+        first = KeywordMock(lambda: sys.stdout.write('first'))
+        second = KeywordMock(lambda: sys.stderr.write('second'))
+        with _OutputRouter([first, second]):
+            first.run()
+            second.run()
+        assert_equal(first.stdout.getvalue(), 'first')
+        assert_equal(first.stderr.getvalue(), '')
+        assert_equal(second.stdout.getvalue(), '')
+        assert_equal(second.stderr.getvalue(), 'second')
+
+    def test_original_streams_are_restored(self):
+        with _OutputRouter([KeywordMock(None)]):
+            assert_true(isinstance(sys.stdout, _RoutingStream))
+            assert_true(isinstance(sys.stderr, _RoutingStream))
+        assert_true(sys.stdout is self.stdout)
+        assert_true(sys.stderr is self.stderr)
+
+    def test_original_streams_are_restored_after_error(self):
+        try:
+            with _OutputRouter([]):
+                raise ValueError
+        except ValueError:
+            pass
+        assert_true(sys.stdout is self.stdout)
+        assert_true(sys.stderr is self.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()
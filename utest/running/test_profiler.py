@@ -0,0 +1,154 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from robot.result import Keyword
+from robot.running.profiler import Profiler
+from robot.utils.asserts import assert_equal, assert_raises, assert_true
+
+
+class FakeTimer(object):
+
+    def __init__(self):
+        self.time = 0
+
+    def __call__(self):
+        return self.time
+
+
+class TestProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.timer = FakeTimer()
+        self.profiler = Profiler(self.timer)
+
+    def test_self_and_total_time(self):
+        self._start('Outer', 'Resource')
+        self._elapse(1)
+        self._start('Inner', 'Lib')
+        self._elapse(2)
+        self._end()
+        self._elapse(3)
+        self._end()
+        self._verify('keywords',
+                     ('Lib.Inner', 1, 2, 2, 2),
+                     ('Resource.Outer', 1, 6, 4, 6))
+        self._verify('libraries',
+                     ('Lib', 1, 2, 2, 2),
+                     ('Resource', 1, 6, 4, 6))
+        self._verify('suites', ('Suite', 2, 6, 6, 6))
+
+    def test_multiple_calls(self):
+        for elapsed in 1, 4, 2:
+            self._start('Keyword')
+            self._elapse(elapsed)
+            self._end()
+        self._verify('keywords', ('Lib.Keyword', 3, 7, 7, 4))
+
+    def test_recursive_calls_are_not_counted_twice_into_total(self):
+        self._start('Keyword')
+        self._elapse(1)
+        self._start('Keyword')
+        self._elapse(2)
+        self._end()
+        self._end()
+        self._verify('keywords', ('Lib.Keyword', 2, 3, 3, 3))
+
+    def test_keywords_in_test_case_file_use_suite_as_library(self):
+        self._start('Keyword', library=None)
+        self._end()
+        self._verify('libraries', ('Suite', 1, 0, 0, 0))
+        self._verify('keywords', ('Suite.Keyword', 1, 0, 0, 0))
+
+    def test_operations_are_not_part_of_self_time(self):
+        self._start('Keyword')
+        self._elapse(1)
+        result = self.profiler.measure(Profiler.VARIABLE_RESOLUTION,
+                                       self._elapse_and_return, 2, 'x')
+        assert_equal(result, 'x')
+        self.profiler.measure(Profiler.KEYWORD_LOOKUP, self._elapse, 3)
+        self._end()
+        self._verify('keywords', ('Lib.Keyword', 1, 6, 1, 6))
+        self._verify('operations',
+                     ('Keyword lookup', 1, 3, 3, 3),
+                     ('Variable resolution', 1, 2, 2, 2))
+
+    def test_failing_operation(self):
+        assert_raises(ZeroDivisionError, self.profiler.measure,
+                      Profiler.KEYWORD_LOOKUP, lambda: 1/0)
+        self._verify('operations', ('Keyword lookup', 1, 0, 0, 0))
+
+    def test_for_loops_are_not_measured_separately(self):
+        self._start('Keyword')
+        self._start('${x} IN [ @{list} ]', type=Keyword.FOR_LOOP_TYPE)
+        self._start('${x} = 1', type=Keyword.FOR_ITEM_TYPE)
+        self._elapse(1)
+        self._start('Inner')
+        self._elapse(2)
+        self._end()
+        self._end()
+        self._end()
+        self._end()
+        self._verify('keywords',
+                     ('Lib.Inner', 1, 2, 2, 2),
+                     ('Lib.Keyword', 1, 3, 1, 3))
+
+    def test_sorting(self):
+        for name, elapsed, count in [('A', 1, 3), ('B', 3, 1), ('C', 2, 2)]:
+            for _ in range(count):
+                self._start(name)
+                self._elapse(elapsed)
+                self._end()
+        for sort, expected in [('self', 'CAB'), ('total', 'CAB'),
+                               ('max', 'BCA'), ('count', 'ACB'),
+                               ('name', 'ABC')]:
+            names = [item['name'][-1] for item
+                     in self.profiler.get_report(sort)['keywords']]
+            assert_equal(''.join(names), expected, sort)
+
+    def test_write(self):
+        directory = tempfile.mkdtemp()
+        try:
+            self._start('Keyword')
+            self._elapse(1)
+            self._end()
+            for name, expected in [('profile.txt', 'profile.txt'),
+                                   ('profile', 'profile'),
+                                   ('profile.json', 'profile.txt')]:
+                path = os.path.join(directory, name)
+                paths = self.profiler.write(path)
+                assert_equal(paths, (os.path.join(directory, expected),
+                                     os.path.join(directory, 'profile.json')))
+                with open(paths[0]) as text:
+                    assert_true('1.000      1.000      1.000  Lib.Keyword'
+                                in text.read())
+                with open(paths[1]) as data:
+                    assert_equal(json.load(data), self.profiler.get_report())
+        finally:
+            shutil.rmtree(directory)
+
+    def _start(self, name, library='Lib', type=Keyword.KEYWORD_TYPE):
+        keyword = Keyword(kwname=name, libname=library, type=type)
+        self.profiler.start_keyword(keyword, 'Suite')
+
+    def _end(self):
+        self.profiler.end_keyword()
+
+    def _elapse(self, seconds):
+        self.timer.time += seconds
+
+    def _elapse_and_return(self, seconds, value):
+        self._elapse(seconds)
+        return value
+
+    def _verify(self, stats, *expected):
+        items = self.profiler.get_report('name')[stats]
+        assert_equal([(item['name'], item['count'], item['total'],
+                       item['self'], item['max']) for item in items],
+                     list(expected))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -632,6 +632,10 @@ class _FakeContext:
         self.variables = _FakeVariableScope()
         self.timeouts = set()
         self.test = None
+        self.profiler = None
+
+    def resolve_arguments(self, resolver, arguments):
+        return resolver(arguments, self.variables)
 
 
 if __name__ == '__main__':
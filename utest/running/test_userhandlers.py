@@ -2,9 +2,11 @@ import unittest
 
 from robot.errors import DataError
 from robot.model import Keywords
-from robot.running.userkeyword import EmbeddedArgumentsHandler
+from robot.running.userkeyword import (EmbeddedArgumentsHandler,
+                                       UserKeywordHandler)
 from robot.running.arguments import EmbeddedArguments, UserKeywordArgumentParser
 from robot.utils.asserts import assert_equal, assert_true, assert_raises
+from robot.variables import Variables
 
 
 class Fake(object):
@@ -161,5 +163,54 @@ class TestGetArgSpec(unittest.TestCase):
         assert_raises(DataError, self._parse, '${args1}=default ${arg2}')
 
 
+class TestShortDocAndTags(unittest.TestCase):
+
+    def setUp(self):
+        self.variables = Variables()
+        self.variables['${x}'] = 'X'
+
+    def test_without_variables(self):
+        handler = self._handler('Short doc.\nMore doc.\n\nTags: t2, t3', ['t1'])
+        doc, tags = handler.get_shortdoc_and_tags(self.variables)
+        assert_equal(doc, 'Short doc.')
+        assert_equal(list(tags), ['t1', 't2', 't3'])
+
+    def test_without_variables_is_cached(self):
+        handler = self._handler('Doc.\n\nTags: t2', ['t1'])
+        first = handler.get_shortdoc_and_tags(self.variables)
+        self.variables['${x}'] = 'new'
+        assert_true(handler.get_shortdoc_and_tags(self.variables) is first)
+
+    def test_escapes_are_handled_when_cached(self):
+        handler = self._handler('Back\\slash \\\\ x', ['\\#tag'])
+        doc, tags = handler.get_shortdoc_and_tags(self.variables)
+        assert_equal(doc, 'Backslash \\ x')
+        assert_equal(list(tags), ['#tag'])
+
+    def test_with_variables(self):
+        handler = self._handler('${x} doc.\n\nTags: ${x}2', ['${x}1', 'static'])
+        doc, tags = handler.get_shortdoc_and_tags(self.variables)
+        assert_equal(doc, 'X doc.')
+        assert_equal(list(tags), ['static', 'X1', 'X2'])
+        self.variables['${x}'] = 'Y'
+        doc, tags = handler.get_shortdoc_and_tags(self.variables)
+        assert_equal(doc, 'Y doc.')
+        assert_equal(list(tags), ['static', 'Y1', 'Y2'])
+
+    def test_variable_only_in_tags(self):
+        handler = self._handler('Doc.', ['${x}'])
+        assert_equal(list(handler.get_shortdoc_and_tags(self.variables)[1]),
+                     ['X'])
+        self.variables['${x}'] = 'Y'
+        assert_equal(list(handler.get_shortdoc_and_tags(self.variables)[1]),
+                     ['Y'])
+
+    def _handler(self, doc, tags):
+        data = HandlerDataMock('Keyword')
+        data.doc = doc
+        data.tags = tags
+        return UserKeywordHandler(data, 'resource')
+
+
 if __name__ == '__main__':
     unittest.main()
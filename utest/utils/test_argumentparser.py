@@ -1,7 +1,9 @@
 import unittest
 import os
+import sys
 
 from robot.utils.argumentparser import ArgumentParser
+from robot.utils.importer import get_import_cache_invalidations
 from robot.utils.asserts import (assert_equal, assert_raises,
                                  assert_raises_with_msg, assert_true)
 from robot.errors import Information, DataError, FrameworkError
@@ -226,6 +228,24 @@ class TestArgumentParserParseArgs(unittest.TestCase):
         assert_equal(ap._get_pythonpath([p1 + ':' + p2]), [p1,p2])
         assert_true(p1 in ap._get_pythonpath(os.path.join(p2,'*')))
 
+    def test_new_pythonpath_invalidates_import_caches(self):
+        ap = ArgumentParser('''Usage:
+ -P --pythonpath path *
+''')
+        path = os.path.abspath(os.path.dirname(__file__))
+        sys_path = sys.path[:]
+        try:
+            while path in sys.path:
+                sys.path.remove(path)
+            before = get_import_cache_invalidations()
+            ap.parse_args(['--pythonpath', path])
+            assert_equal(sys.path[0], path)
+            assert_equal(get_import_cache_invalidations(), before + 1)
+            ap.parse_args(['--pythonpath', path])
+            assert_equal(get_import_cache_invalidations(), before + 1)
+        finally:
+            sys.path = sys_path
+
     def test_arguments_are_globbed(self):
         _, args = self.ap.parse_args([__file__.replace('test_', '?????')])
         assert_equal(args, [__file__])
@@ -0,0 +1,132 @@
+import os
+import tempfile
+import unittest
+
+from robot.utils import (BinaryOutputParser, BinaryOutputWriter,
+                         is_binary_output)
+from robot.utils.asserts import assert_equal, assert_false, assert_true
+
+
+PATH = os.path.join(tempfile.gettempdir(), 'test_binaryoutput.rbo')
+
+
+class TestBinaryOutput(unittest.TestCase):
+
+    def setUp(self):
+        self.writer = BinaryOutputWriter(PATH)
+
+    def tearDown(self):
+        os.remove(PATH)
+
+    def test_is_binary_output(self):
+        self.writer.close()
+        assert_true(is_binary_output(PATH))
+        assert_false(is_binary_output(__file__))
+        assert_false(is_binary_output('<robot/>'))
+
+    def test_elements_and_attributes(self):
+        self.writer.start('robot', {'generator': 'Robot'})
+        self.writer.element('tag', 'tag')
+        self.writer.element('msg', u'hyv\xe4', {'level': 'INFO'})
+        self.writer.end('robot')
+        self._verify([('start', 'robot', {'generator': 'Robot'}, None),
+                      ('start', 'tag', {}, 'tag'),
+                      ('end', 'tag', {}, 'tag'),
+                      ('start', 'msg', {'level': 'INFO'}, u'hyv\xe4'),
+                      ('end', 'msg', {'level': 'INFO'}, u'hyv\xe4'),
+                      ('end', 'robot', {'generator': 'Robot'}, None)])
+
+    def test_empty_elements_and_attributes_are_not_written(self):
+        self.writer.start('robot')
+        self.writer.element('doc', '')
+        self.writer.element('status', '', {'status': 'PASS', 'x': ''})
+        self.writer.end('robot')
+        self._verify([('start', 'robot', {}, None),
+                      ('start', 'status', {'status': 'PASS'}, ''),
+                      ('end', 'status', {'status': 'PASS'}, ''),
+                      ('end', 'robot', {}, None)])
+
+    def test_skippable_elements(self):
+        self.writer.start('robot')
+        for name in 'skip', 'keep':
+            self.writer.start('kw', {'name': name})
+            self.writer.start('kw', {'name': 'nested ' + name})
+            self.writer.element('msg', 'message ' + name, {'level': 'INFO'})
+            self.writer.end('kw')
+            self.writer.end('kw')
+        self.writer.element('msg', 'message skip', {'level': 'INFO'})
+        self.writer.end('robot')
+        skip = lambda elem: elem.get('name') == 'skip'
+        self._verify([('start', 'robot', {}, None),
+                      ('start', 'kw', {'name': 'keep'}, None),
+                      ('start', 'kw', {'name': 'nested keep'}, None),
+                      ('start', 'msg', {'level': 'INFO'}, 'message keep'),
+                      ('end', 'msg', {'level': 'INFO'}, 'message keep'),
+                      ('end', 'kw', {'name': 'nested keep'}, None),
+                      ('end', 'kw', {'name': 'keep'}, None),
+                      ('start', 'msg', {'level': 'INFO'}, 'message skip'),
+                      ('end', 'msg', {'level': 'INFO'}, 'message skip'),
+                      ('end', 'robot', {}, None)], skip)
+
+    def test_strings_added_in_skipped_elements_are_known_after_them(self):
+        self.writer.start('robot')
+        self.writer.start('kw', {'name': 'skip'})
+        self.writer.start('kw', {'name': 'inner'})
+        self.writer.element('tag', 'new')
+        self.writer.end('kw')
+        self.writer.end('kw')
+        self.writer.start('kw', {'name': 'inner'})
+        self.writer.element('tag', 'new')
+        self.writer.end('kw')
+        self.writer.end('robot')
+        skip = lambda elem: elem.get('name') == 'skip'
+        expected = [('start', 'robot', {}, None),
+                    ('start', 'kw', {'name': 'inner'}, None),
+                    ('start', 'tag', {}, 'new'),
+                    ('end', 'tag', {}, 'new'),
+                    ('end', 'kw', {'name': 'inner'}, None),
+                    ('end', 'robot', {}, None)]
+        self._verify(expected, skip)
+        assert_equal(self._parse(),
+                     expected[:1] + [('start', 'kw', {'name': 'skip'}, None)]
+                     + expected[1:5] + [('end', 'kw', {'name': 'skip'}, None)]
+                     + expected[1:])
+        assert_equal(self._parse(lambda elem: True),
+                     expected[:1] + expected[-1:])
+
+    def test_lengths_are_patched_also_after_data_is_flushed(self):
+        self.writer._buffer_size = 10
+        self.writer.start('robot')
+        for name in 'skip', 'keep':
+            self.writer.start('kw', {'name': name})
+            for index in range(5):
+                self.writer.element('msg', 'message %d' % index)
+            self.writer.end('kw')
+        self.writer.end('robot')
+        skip = lambda elem: elem.get('name') == 'skip'
+        msgs = [(event, 'msg', {}, 'message %d' % index)
+                for index in range(5) for event in ('start', 'end')]
+        self._verify([('start', 'robot', {}, None),
+                      ('start', 'kw', {'name': 'keep'}, None)] + msgs +
+                     [('end', 'kw', {'name': 'keep'}, None),
+                      ('end', 'robot', {}, None)], skip)
+
+    def test_closing_writes_open_skippable_elements(self):
+        self.writer.start('kw', {'name': 'Not ended'})
+        self.writer.element('msg', 'Written', {'level': 'INFO'})
+        self._verify([('start', 'kw', {'name': 'Not ended'}, None),
+                      ('start', 'msg', {'level': 'INFO'}, 'Written'),
+                      ('end', 'msg', {'level': 'INFO'}, 'Written'),
+                      ('end', 'kw', {'name': 'Not ended'}, None)])
+
+    def _verify(self, expected, skip=None):
+        self.writer.close()
+        assert_equal(self._parse(skip), expected)
+
+    def _parse(self, skip=None):
+        return [(event, elem.tag, dict(elem.attrib), elem.text)
+                for event, elem in BinaryOutputParser(PATH, skip)]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,6 @@
 import os
+import gzip
+import tempfile
 import unittest
 
 from robot.utils.asserts import assert_equal, assert_true
@@ -20,6 +22,19 @@ class TestETSource(unittest.TestCase):
         self._verify_string_representation(source, PATH)
         assert_true(source._opened is None)
 
+    def test_path_to_compressed_file(self):
+        path = os.path.join(tempfile.gettempdir(), 'test_etreesource.xml.gz')
+        with gzip.open(path, 'wb') as f:
+            f.write(b'<tag>content</tag>')
+        try:
+            source = ETSource(path)
+            with source as src:
+                assert_equal(ET.parse(src).getroot().text, 'content')
+            assert_true(source._opened.closed)
+            self._verify_string_representation(source, path)
+        finally:
+            os.remove(path)
+
     def test_opened_file_object(self):
         source = ETSource(open(PATH))
         with source as src:
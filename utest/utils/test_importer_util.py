@@ -9,7 +9,8 @@ from os.path import basename, dirname, exists, join, normpath
 
 from robot.errors import DataError
 from robot.utils import abspath, JYTHON, WINDOWS, PY3
-from robot.utils.importer import Importer, ByPathImporter
+from robot.utils.importer import (Importer, ByPathImporter,
+                                  get_import_cache_invalidations)
 from robot.utils.asserts import (assert_equal, assert_true, assert_raises,
                                  assert_raises_with_msg)
 
@@ -349,6 +350,56 @@ class TestImportClassOrModule(unittest.TestCase):
         return Importer(type, logger or LoggerStub()).import_class_or_module(name)
 
 
+class TestImportCacheInvalidation(unittest.TestCase):
+
+    def setUp(self):
+        self.logger = LoggerStub()
+        self.tearDown()
+
+    def tearDown(self):
+        if exists(TESTDIR):
+            shutil.rmtree(TESTDIR)
+        if TESTDIR in sys.path:
+            sys.path.remove(TESTDIR)
+        for name in 'cached_1', 'cached_2':
+            sys.modules.pop(name, None)
+
+    def test_not_invalidated_when_import_succeeds(self):
+        before = get_import_cache_invalidations()
+        self._import('classes')
+        assert_equal(get_import_cache_invalidations(), before)
+        assert_equal(len(self.logger.messages), 1)
+
+    def test_invalidated_when_import_fails(self):
+        before = get_import_cache_invalidations()
+        assert_raises(DataError, self._import, 'NonExisting')
+        if PY3:
+            assert_equal(get_import_cache_invalidations(), before + 1)
+            assert_true(self.logger.messages[0].startswith(
+                "Importing 'NonExisting' failed. Invalidated import caches "
+                "and retrying."))
+        else:
+            assert_equal(get_import_cache_invalidations(), before)
+            assert_equal(self.logger.messages, [])
+
+    def test_not_invalidated_when_imported_module_has_missing_dependency(self):
+        create_temp_file('cached_1.py', extra_content='import non_existing\n')
+        sys.path.insert(0, TESTDIR)
+        before = get_import_cache_invalidations()
+        assert_raises(DataError, self._import, 'cached_1')
+        assert_equal(get_import_cache_invalidations(), before)
+
+    def test_module_created_after_directory_was_cached(self):
+        create_temp_file('cached_1.py', attr=1)
+        sys.path.insert(0, TESTDIR)
+        assert_equal(self._import('cached_1').attr, 1)
+        create_temp_file('cached_2.py', attr=2)
+        assert_equal(self._import('cached_2').attr, 2)
+
+    def _import(self, name):
+        return Importer(logger=self.logger).import_class_or_module(name)
+
+
 class TestErrorDetails(unittest.TestCase):
 
     def test_no_traceback(self):
@@ -236,6 +236,25 @@ class TestNormalizedDict(unittest.TestCase):
         nd = NormalizedDict((c, None) for c in 'aBcDeFg123XyZ___')
         assert_equal(list(nd.keys()), list('123_aBcDeFgXyZ'))
 
+    def test_keys_are_sorted_after_modifications(self):
+        nd = NormalizedDict({'b': 1, 'D': 2})
+        assert_equal(list(nd), ['b', 'D'])
+        nd['C'] = 3
+        nd['a'] = 4
+        assert_equal(list(nd), ['a', 'b', 'C', 'D'])
+        nd['B'] = 5
+        del nd['c']
+        assert_equal(list(nd), ['a', 'b', 'D'])
+        nd.clear()
+        nd['x'] = 6
+        assert_equal(list(nd), ['x'])
+
+    def test_modifying_while_iterating_keys(self):
+        nd = NormalizedDict({'a': 1, 'b': 2})
+        for key in nd:
+            nd[key + 'x'] = 3
+        assert_equal(list(nd), ['a', 'ax', 'b', 'bx'])
+
     if PY2:
 
         def test_iterkeys_and_keys(self):
@@ -313,6 +332,21 @@ class TestNormalizedDict(unittest.TestCase):
         assert_equal(nd._data, {})
         assert_equal(nd._keys, {})
 
+    def test_normalizer_is_shared_by_dicts_with_same_spec(self):
+        assert_true(NormalizedDict()._normalize is
+                    NormalizedDict(ignore=[])._normalize)
+        assert_true(NormalizedDict(ignore='_')._normalize is
+                    NormalizedDict(ignore=['_'])._normalize)
+        assert_true(NormalizedDict()._normalize is not
+                    NormalizedDict(caseless=False)._normalize)
+
+    def test_normalizing_with_ignored_underscores(self):
+        normalizer = NormalizedDict(ignore=['_'])._normalize
+        for string in ['', 'Hello World', ' _ X_Y \t Z_ ', u'\xc4iti_\xe4',
+                       'A__B__C', '\n\r']:
+            assert_equal(normalizer(string), normalize(string, ignore='_'))
+            assert_equal(normalizer(string), normalize(string, ignore='_'))
+
 
 if __name__ == '__main__':
     unittest.main()
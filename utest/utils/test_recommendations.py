@@ -0,0 +1,77 @@
+import random
+import unittest
+
+from robot.utils import RecommendationFinder, RecommendationIndex
+from robot.utils.asserts import assert_equal
+
+
+CANDIDATES = ['Log', 'Log Many', 'Log To Console', 'Log Variables',
+              'Should Be Equal', 'Should Be Equal As Integers',
+              'Should Be Equal As Numbers', 'Should Be Equal As Strings',
+              'Should Not Be Equal', 'Should Contain', 'Should Not Contain',
+              'Run Keyword', 'Run Keyword If', 'Run Keywords',
+              'Set Variable', 'Set Test Variable', 'Set Suite Variable',
+              'Get Variable Value', 'Variable Should Exist', 'No Operation',
+              'Open Browser', 'Close Browser', 'Click Element', 'ab', 'x']
+
+
+class TestRecommendationIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.normalizer = lambda name: name.lower()
+
+    def test_same_recommendations_as_finder(self):
+        index = RecommendationIndex(CANDIDATES, self.normalizer)
+        finder = RecommendationFinder(self.normalizer)
+        for name in ['Lgo', 'log many', 'Shuold Be Equal', 'Should Equal',
+                     'Shoud Be Equal As Integer', 'Run Keyword Iff',
+                     'Set Tset Variable', 'Variable Should Exists',
+                     'Clik Element', 'Open Browsr', 'ba', 'y', 'Nothing',
+                     'Completely different keyword name']:
+            assert_equal(index.find_recommendations(name),
+                         finder.find_recommendations(name, CANDIDATES))
+
+    def test_same_recommendations_as_finder_with_random_typos(self):
+        index = RecommendationIndex(CANDIDATES, self.normalizer)
+        finder = RecommendationFinder(self.normalizer)
+        rand = random.Random(42)
+        for _ in range(500):
+            name = self._add_typos(rand.choice(CANDIDATES), rand)
+            assert_equal(index.find_recommendations(name),
+                         finder.find_recommendations(name, CANDIDATES),
+                         name)
+
+    def _add_typos(self, name, rand):
+        chars = list(name)
+        for _ in range(rand.randint(1, 5)):
+            pos = rand.randint(0, len(chars))
+            action = rand.choice(['insert', 'delete', 'swap'])
+            if action == 'insert' or not chars:
+                chars.insert(pos, rand.choice('abcdefghijklmnopqrstuvwxyz '))
+            elif action == 'delete':
+                del chars[min(pos, len(chars) - 1)]
+            elif pos < len(chars) - 1:
+                chars[pos], chars[pos+1] = chars[pos+1], chars[pos]
+        return ''.join(chars)
+
+    def test_duplicates_after_normalization(self):
+        index = RecommendationIndex(['Keyword', 'KEYWORD', 'Other'],
+                                    self.normalizer)
+        assert_equal(len(index), 2)
+        assert_equal(index.find_recommendations('keywrod'),
+                     ['KEYWORD', 'Keyword'])
+
+    def test_max_matches(self):
+        index = RecommendationIndex(CANDIDATES, self.normalizer)
+        assert_equal(index.find_recommendations('Should Be Equal'),
+                     ['Should Be Equal', 'Should Not Be Equal'])
+        assert_equal(index.find_recommendations('Should Be Equal', 1),
+                     ['Should Be Equal'])
+
+    def test_no_candidates_or_name(self):
+        assert_equal(RecommendationIndex([]).find_recommendations('x'), [])
+        assert_equal(RecommendationIndex(['x']).find_recommendations(''), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,4 @@
+import gzip
 import os
 import unittest
 import tempfile
@@ -139,5 +140,33 @@ class TestXmlWriter(unittest.TestCase):
             return f.read()
 
 
+class TestCompressedXmlWriter(unittest.TestCase):
+    path = PATH + '.gz'
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_gz_extension_compresses_output(self):
+        writer = XmlWriter(self.path)
+        writer.element('robot', u'hyv\xe4', {'a': 'b'})
+        writer.close()
+        with open(self.path, 'rb') as f:
+            assert_equal(f.read(2), b'\x1f\x8b')
+        with gzip.open(self.path) as f:
+            content = f.read().decode('UTF-8')
+        assert_true(content.startswith('<?xml version="1.0" encoding="UTF-8"?>'))
+        assert_true(u'<robot a="b">hyv\xe4</robot>' in content)
+
+    def test_compressed_output_can_be_parsed(self):
+        writer = XmlWriter(self.path)
+        writer.element('robot', u'hyv\xe4', {'a': 'b'})
+        writer.close()
+        with ETSource(self.path) as source:
+            root = ET.parse(source).getroot()
+        assert_equal(root.tag, 'robot')
+        assert_equal(root.text, u'hyv\xe4')
+        assert_equal(root.attrib, {'a': 'b'})
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,196 @@
+import os
+import unittest
+
+from robot.errors import DataError, VariableError
+from robot.utils import RecommendationFinder, unic
+from robot.utils.asserts import (assert_equal, assert_raises,
+                                 assert_raises_with_msg, assert_true)
+from robot.variables import Variables, variable_not_found
+from robot.variables.finders import ExtendedFinder, ResolutionPlan
+
+
+class TestResolutionPlan(unittest.TestCase):
+
+    def test_normal_variable(self):
+        plan = ResolutionPlan('${var}')
+        assert_equal(plan.has_value, False)
+        assert_equal(plan.extended, None)
+        assert_equal(plan.environment, False)
+
+    def test_number(self):
+        for name, value in [('${42}', 42), ('${0x F F}', 255),
+                            ('${0b101}', 5), ('${1.5}', 1.5)]:
+            plan = ResolutionPlan(name)
+            assert_equal(plan.has_value, True)
+            assert_equal(plan.value, value)
+            assert_equal(plan.extended, None)
+
+    def test_numbers_only_as_scalars(self):
+        plan = ResolutionPlan('@{42}')
+        assert_equal(plan.has_value, False)
+
+    def test_empty(self):
+        for name, value in [('${EMPTY}', ''), ('@{empty}', ()),
+                            ('&{E_MPTY}', {})]:
+            plan = ResolutionPlan(name)
+            assert_equal(plan.has_value, True)
+            assert_equal(plan.value, value)
+
+    def test_extended(self):
+        for name, extended in [('${obj.attr}', ('obj', '.attr')),
+                               ('${list[0]}', ('list', '[0]')),
+                               ('${x * 2}', ('x ', '* 2')),
+                               ('@{a.b.c}', ('a', '.b.c'))]:
+            plan = ResolutionPlan(name)
+            assert_equal(plan.has_value, False)
+            assert_equal(plan.extended, extended)
+
+    def test_environment(self):
+        plan = ResolutionPlan('%{PATH}')
+        assert_equal(plan.environment, True)
+        assert_equal(plan.extended, None)
+
+    def test_invalid_name(self):
+        assert_raises(DataError, ResolutionPlan, 'invalid')
+
+    def test_plans_are_cached(self):
+        assert_true(ResolutionPlan.get('${x.y}') is ResolutionPlan.get('${x.y}'))
+
+
+class TestExtendedVariables(unittest.TestCase):
+
+    def setUp(self):
+        self.variables = Variables()
+        self.variables['${obj}'] = Page()
+        self.variables['${list}'] = [1, 2, 3]
+
+    def test_attribute_access(self):
+        assert_equal(self.variables['${obj.locators.login}'], 'id=login')
+
+    def test_item_access_and_expressions(self):
+        assert_equal(self.variables['${list[-1]}'], 3)
+        assert_equal(self.variables['${list * 2}'], [1, 2, 3, 1, 2, 3])
+        assert_equal(self.variables['@{list[:2]}'], [1, 2])
+
+    def test_code_is_compiled_once(self):
+        self.variables['${obj.locators.logout}']
+        code = ExtendedFinder._compiled['.locators.logout']
+        self.variables['${obj.locators.logout}']
+        self.variables['${obj .locators.logout}']
+        assert_true(ExtendedFinder._compiled['.locators.logout'] is code)
+
+    def test_same_extended_part_with_different_base(self):
+        self.variables['${other}'] = Page('other')
+        assert_equal(self.variables['${obj.locators.login}'], 'id=login')
+        assert_equal(self.variables['${other.locators.login}'], 'other=login')
+
+    def test_stored_variable_has_precedence(self):
+        self.variables['${obj.locators.login}'] = 'stored'
+        self.variables['${42}'] = 'stored'
+        assert_equal(self.variables['${obj.locators.login}'], 'stored')
+        assert_equal(self.variables['${42}'], 'stored')
+
+    def test_non_existing_base(self):
+        assert_raises(VariableError, self.variables.__getitem__,
+                      '${nonex.attr}')
+
+    def test_invalid_extended_part(self):
+        assert_raises(VariableError, self.variables.__getitem__,
+                      '${obj.nonex}')
+        assert_raises(VariableError, self.variables.__getitem__,
+                      '${obj.!invalid}')
+
+
+class TestGet(unittest.TestCase):
+
+    def setUp(self):
+        self.variables = Variables()
+        self.variables['${scalar}'] = 'value'
+        self.variables['@{list}'] = [1, 2]
+        self.variables['${obj}'] = Page()
+
+    def test_existing(self):
+        assert_equal(self.variables.get('${scalar}'), 'value')
+        assert_equal(self.variables.get('@{list}'), [1, 2])
+        assert_equal(self.variables.get('${obj.locators.login}'), 'id=login')
+        assert_equal(self.variables.get('${42}'), 42)
+        assert_equal(self.variables.get('@{EMPTY}'), [])
+
+    def test_non_existing(self):
+        assert_equal(self.variables.get('${nonex}'), None)
+        assert_equal(self.variables.get('${nonex}', 'default'), 'default')
+        assert_equal(self.variables.get('${nonex.attr}', 'x'), 'x')
+        assert_equal(self.variables.get('%{NONEX_ENV_VAR_1234}', 'x'), 'x')
+
+    def test_environment_variable(self):
+        os.environ['ROBOT_TEST_GET_VAR'] = 'env'
+        try:
+            assert_equal(self.variables.get('%{ROBOT_TEST_GET_VAR}'), 'env')
+        finally:
+            del os.environ['ROBOT_TEST_GET_VAR']
+
+    def test_other_errors_are_raised(self):
+        assert_raises(DataError, self.variables.get, 'invalid')
+        assert_raises(VariableError, self.variables.get, '${obj.nonex}')
+        assert_raises(VariableError, self.variables.get, '@{scalar}')
+
+    def test_find_raises_with_recommendations(self):
+        assert_raises_with_msg(VariableError,
+                               "Variable '${scalr}' not found. "
+                               "Did you mean:\n    ${scalar}",
+                               self.variables.__getitem__, '${scalr}')
+
+
+class TestNotFoundMessage(unittest.TestCase):
+
+    def test_recommendations_are_searched_lazily(self):
+        finder = RecommendationFinder.find_recommendations
+        calls = []
+        RecommendationFinder.find_recommendations = \
+            lambda *args: calls.append(args) or finder(*args)
+        try:
+            try:
+                variable_not_found('${scalr}', {'scalar': 1, 'other': 2})
+            except VariableError as err:
+                error = err
+            assert_equal(calls, [])
+            expected = ("Variable '${scalr}' not found. "
+                        "Did you mean:\n    ${scalar}")
+            assert_equal(unic(error), expected)
+            assert_equal(error.message, expected)
+            assert_equal(len(calls), 1)
+        finally:
+            RecommendationFinder.find_recommendations = finder
+
+    def test_candidates_are_collected_immediately(self):
+        candidates = {'scalar': 1, 'list': [1]}
+        try:
+            variable_not_found('@{lst}', candidates)
+        except VariableError as err:
+            error = err
+        candidates.clear()
+        assert_equal(error.message,
+                     "Variable '@{lst}' not found. Did you mean:\n    @{list}")
+
+    def test_custom_message(self):
+        try:
+            variable_not_found('%{nonex}', {}, 'Custom message.')
+        except VariableError as err:
+            assert_equal(err.message, 'Custom message.')
+
+
+class Page(object):
+
+    def __init__(self, prefix='id'):
+        self.locators = Locators(prefix)
+
+
+class Locators(object):
+
+    def __init__(self, prefix):
+        self.login = prefix + '=login'
+        self.logout = prefix + '=logout'
+
+
+if __name__ == '__main__':
+    unittest.main()